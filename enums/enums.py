@@ -60,6 +60,12 @@ geometry_types = [
     ("ADDITIONAL", "Additional", "", 13)
 ]
 
+tile_parts = [
+    ("NONE", "None", "", 1),
+    ("BASE", "Base", "", 2),
+    ("CORE", "Core", "", 3)
+]
+
 base_socket_side = [
     ("INNER", "Inner", "", 1),
     ("OUTER", "Outer", "", 2)
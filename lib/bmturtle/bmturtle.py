@@ -1,180 +1,844 @@
-from math import radians
+from math import radians, pi
+from functools import wraps
 import bpy
 import bmesh
-from mathutils import Vector
-
-
-def create_turtle(name, vert_groups=None):
-    cursor = bpy.context.scene.cursor
-    # create new empty turtle world
-    mesh = bpy.data.meshes.new("mesh")
-    obj = bpy.data.objects.new(name, mesh)
-    obj['penstate'] = True
-
-    # create vertex groups
-    if vert_groups:
-        for i in range(len(vert_groups)):
-            obj.vertex_groups.new(name=vert_groups[i])
-
-    # link object to active collection
-    bpy.context.layer_collection.collection.objects.link(obj)
-
-    # make object active
-    bpy.context.view_layer.objects.active = obj
-
-    # update depgraph
-    bpy.context.view_layer.update()
-
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    vert = bmesh.ops.create_vert(bm, co=cursor.location)
-    vert['vert'][0].select = True
-    return bm, obj
-
-
-def pu(bm):
-    for v in bm.verts:
-        v.select_set(False)
-    bm.select_flush(False)
-
-    bpy.context.view_layer.objects.active['penstate'] = False
-
-
-def pd(bm):
-    bpy.context.view_layer.objects.active['penstate'] = True
-
-
-def fd(bm, distance, del_original=True):
-    extrude_translate(bm, (0.0, distance, 0.0), del_original)
-
-
-def bk(bm, distance, del_original=True):
-    extrude_translate(bm, (0.0, -distance, 0.0), del_original)
-
-
-def up(bm, distance, del_original=True):
-    extrude_translate(bm, (0.0, 0.0, distance), del_original)
-
-
-def dn(bm, distance, del_original=True):
-    extrude_translate(bm, (0.0, 0.0, -distance), del_original)
-
-
-def ri(bm, distance, del_original=True):
-    extrude_translate(bm, (distance, 0.0, 0.0), del_original)
-
-
-def lf(bm, distance, del_original=True):
-    extrude_translate(bm, (-distance, 0.0, 0.0), del_original)
-
-
-def extrude_translate(bm, local_trans, del_original=True):
-    # use cursor as turtle
-    turtle = bpy.context.scene.cursor
-
-    # work out transform in turtle's local space and convert to global
-    local_trans = Vector(local_trans)
-    world_trans = turtle.matrix.to_3x3() @ local_trans
-    turtle.location = turtle.matrix.translation + world_trans
-
-    if bpy.context.view_layer.objects.active['penstate'] is 1:
-        if bm.select_mode == {'VERT'}:
-            bm.select_flush(True)
-            # get selected verts
-            selected = [v for v in bm.verts if v.select]
-            ret = bmesh.ops.extrude_vert_indiv(bm, verts=selected)
-            verts = ret['verts']
-
-            # translate along turtle's local Y
-            bmesh.ops.translate(bm, vec=(world_trans), verts=verts)
-
-            # deselect original verts
-            for v in bm.verts:
-                v.select_set(False)
-            bm.select_flush(False)
-
-            # select extruded verts
-            for v in verts:
-                v.select_set(True)
-            bm.select_flush(True)
-
-        if bm.select_mode == {'EDGE'}:
-            bm.select_flush(True)
-            selected = [e for e in bm.edges if e.select]
-            ret = bmesh.ops.extrude_edge_only(bm, edges=selected)
-            geom = ret["geom"]
-            edges = [e for e in geom
-                     if isinstance(e, bmesh.types.BMEdge)]
-            verts = [v for v in geom
-                     if isinstance(v, bmesh.types.BMVert)]
-            bmesh.ops.translate(bm, vec=(world_trans), verts=verts)
-
-            # deselect original edges
-            for e in bm.edges:
-                e.select_set(False)
-            for v in bm.verts:
-                v.select_set(False)
-            bm.select_flush(False)
-
-            # select extruded edges
-            for e in edges:
-                e.select_set(True)
-            bm.select_flush(True)
-
-        if bm.select_mode == {'FACE'}:
-            bm.select_flush(True)
-            sel_f = [f for f in bm.faces if f.select]
-            ret = bmesh.ops.extrude_face_region(bm, geom=sel_f)
-            geom = ret["geom"]
-
-            faces = [f for f in geom
-                     if isinstance(f, bmesh.types.BMFace)]
-            edges = [e for e in geom
-                     if isinstance(e, bmesh.types.BMEdge)]
-            verts = [v for v in geom
-                     if isinstance(v, bmesh.types.BMVert)]
-
-            bmesh.ops.translate(bm, vec=(world_trans), verts=verts)
-
-            if del_original is True:
-                bmesh.ops.delete(bm, geom=sel_f, context='FACES')
-
-            # deselect original faces and edges
-            bm_deselect_all(bm)
-
-            #select extruded faces
-            for f in faces:
-                f.select_set(True)
-
-
-def lt(degrees):
-    turtle = bpy.context.scene.cursor
-    turtle.rotation_euler = (
-        turtle.rotation_euler[0],
-        turtle.rotation_euler[1],
-        turtle.rotation_euler[2] + radians(degrees))
-
-
-def rt(degrees):
-    lt(-degrees)
-
-
-def home(obj):
-    turtle = bpy.context.scene.cursor
-    turtle.location = obj.location
-    turtle.rotation_euler = obj.rotation_euler
+from mathutils import Vector, Matrix, Euler, kdtree
+from .. utils.selection import select_verts
+
+
+def recorded(func):
+    """Adds a turtle command to the turtle's program when it is recording.
+
+    Commands called by other commands are not recorded as they will be
+    called again when the program is played
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.program is None or self.recording_depth:
+            return func(self, *args, **kwargs)
+
+        self.program.append([
+            func.__name__,
+            encode_args(self.bm, args),
+            encode_args(self.bm, kwargs)])
+
+        self.recording_depth += 1
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.recording_depth -= 1
+    return wrapper
+
+
+class Turtle:
+    """A self contained turtle that draws into its own bmesh.
+
+    The turtle keeps its own location, rotation and pen state rather than
+    using the scene cursor and the active object, so several turtles can
+    run side by side and nothing in the scene is touched until finalise
+    is called.
+
+    Commands mirror the bpy.ops.turtle operators and act on the bmesh
+    selection in the same way so turtle scripts can be ported line by line.
+
+    The turtle keeps track of the geometry its last move extruded (the
+    frontier) so the next move only touches that geometry rather than
+    scanning the whole mesh for the selection. Commands that change the
+    selection in other ways reset it. If you change the selection of
+    turtle.bm directly call reset_frontier afterwards.
+
+    Keyword arguments:
+    name -- name of the object created on finalise
+    matrix -- 4x4 Matrix, starting transform of turtle. Its translation
+    becomes the object origin. Defaults to identity
+    vert_groups -- list of vertex group names to create on finalise.
+    Groups passed to assign_vert_group are added to it
+    record -- BOOL, record commands in turtle.program so they can be
+    played again with play
+    """
+
+    def __init__(self, name='turtle', matrix=None, vert_groups=None, record=False):
+        if matrix is None:
+            matrix = Matrix.Identity(4)
+        self.name = name
+        self.origin = matrix.to_translation()
+        self.location = self.origin.copy()
+        self.rotation = matrix.to_euler('XYZ')
+        self.pendown = True
+        self.vert_groups = list(vert_groups or [])
+
+        # index of last vert when begin_path was called
+        self.beginpath_vert = 0
+
+        # selected verts, edges and faces or None if we need to
+        # read the selection from the bmesh
+        self.frontier = None
+
+        # list of [command, args, kwargs] or None if not recording
+        self.program = [] if record else None
+        self.recording_depth = 0
+
+        self.bm = bmesh.new()
+        self.bm.select_mode = {'VERT'}
+
+    @property
+    def matrix(self):
+        return Matrix.Translation(self.location) @ self.rotation.to_matrix().to_4x4()
+
+    def local_co(self, co):
+        """Converts a world coordinate to a coordinate in the turtle's mesh"""
+        return Vector(co) - self.origin
+
+    def get_frontier(self):
+        """Returns the selected verts, edges and faces"""
+        if self.frontier is None:
+            self.frontier = self.selected_geom()
+        return self.frontier
+
+    def reset_frontier(self):
+        """Forget the frontier so the selection is read from the bmesh"""
+        self.frontier = None
+
+    # pen commands
+    @recorded
+    def pu(self):
+        """Pen up. Turtle moves without drawing"""
+        self.pendown = False
+
+    @recorded
+    def pd(self):
+        """Pen down. Turtle draws as it moves"""
+        self.pendown = True
+
+    # movement commands
+    @recorded
+    def fd(self, d, m=False, cuts=1, guards=(0, 0)):
+        return self.move((0.0, d, 0.0), m, cuts, guards)
+
+    @recorded
+    def bk(self, d, m=False, cuts=1, guards=(0, 0)):
+        return self.move((0.0, -d, 0.0), m, cuts, guards)
+
+    @recorded
+    def up(self, d, m=False, cuts=1, guards=(0, 0)):
+        return self.move((0.0, 0.0, d), m, cuts, guards)
+
+    @recorded
+    def dn(self, d, m=False, cuts=1, guards=(0, 0)):
+        return self.move((0.0, 0.0, -d), m, cuts, guards)
+
+    @recorded
+    def ri(self, d, m=False, cuts=1, guards=(0, 0)):
+        return self.move((d, 0.0, 0.0), m, cuts, guards)
+
+    @recorded
+    def lf(self, d, m=False, cuts=1, guards=(0, 0)):
+        return self.move((-d, 0.0, 0.0), m, cuts, guards)
+
+    def move(self, local_trans, m=False, cuts=1, guards=(0, 0)):
+        """Moves turtle in its local space.
+
+        If the pen is down the selection is extruded along the move,
+        or translated with the turtle if m (move mode) is True.
+        Returns the frontier, the geometry left selected after the move
+
+        Keyword arguments:
+        cuts -- number of equal segments to extrude the move in
+        guards -- (start, end) length of extra segments added at each
+        end of the move. Part of the move, not added to it
+        """
+        world_trans = self.rotation.to_matrix() @ Vector(local_trans)
+
+        if self.pendown:
+            if len(self.bm.verts) == 0:
+                self.add_vert()
+            frontier = self.get_frontier()
+            if m:
+                verts = [ele for ele in frontier if isinstance(ele, bmesh.types.BMVert)]
+                bmesh.ops.translate(self.bm, vec=world_trans, verts=verts)
+            elif cuts == 1 and not any(guards):
+                self.frontier = extrude_translate(self.bm, world_trans, frontier)
+            else:
+                self.frontier = extrude_guarded(self.bm, world_trans, cuts, guards, frontier)
+
+        self.location = self.location + world_trans
+        return self.frontier
+
+    @recorded
+    def arc(self, r, d, s):
+        """Draws an arc with the turtle at its center, leaving the turtle in place.
+
+        Keyword arguments:
+        r -- radius
+        d -- degrees of arc
+        s -- segments in arc
+        """
+        circumference = 2 * pi * r
+        segment_length = circumference / ((360 / d) * s)
+        rotation_amount = d / s
+
+        start_loc = self.location.copy()
+        start_rot = self.rotation.copy()
+        self.deselect_all()
+        self.pu()
+        self.fd(r)
+        self.add_vert()
+        self.pd()
+        self.rt(90)
+        self.rt(rotation_amount / 2)
+
+        for i in range(s):
+            self.fd(segment_length)
+            self.rt(rotation_amount)
+
+        self.pu()
+        self.location = start_loc
+        self.rotation = start_rot
+
+    # rotation commands
+    @recorded
+    def lt(self, d):
+        """Rotate left. d = degrees"""
+        self.rotation.z += radians(d)
+
+    @recorded
+    def rt(self, d):
+        """Rotate right. d = degrees"""
+        self.rotation.z -= radians(d)
+
+    @recorded
+    def lu(self, d):
+        """Pitch up (look up). d = degrees"""
+        self.rotation.x += radians(d)
+
+    @recorded
+    def ld(self, d):
+        """Pitch down (look down). d = degrees"""
+        self.rotation.x -= radians(d)
+
+    @recorded
+    def rl(self, d):
+        """Roll left around Y. d = degrees"""
+        self.rotation.y -= radians(d)
+
+    @recorded
+    def rr(self, d):
+        """Roll right around Y. d = degrees"""
+        self.rotation.y += radians(d)
+
+    @recorded
+    def set_position(self, v):
+        self.location = Vector(v)
+
+    @recorded
+    def set_rotation(self, v):
+        """Set rotation. v = rotation in degrees (0, 0, 0)"""
+        self.rotation = Euler([radians(i) for i in v])
+
+    @recorded
+    def set_state(self, location, rotation):
+        """Set turtle location and rotation, eg. to return to a saved state.
+        rotation = Euler or rotation in radians"""
+        self.location = Vector(location)
+        self.rotation = Euler(rotation)
+
+    @recorded
+    def home(self):
+        """Set turtle location and rotation to object origin"""
+        self.location = self.origin.copy()
+        self.rotation = Euler((0, 0, 0))
+
+    # geometry commands
+    @recorded
+    def add_vert(self):
+        """Adds a vert at the turtle's location and makes it the selection"""
+        self.deselect_all()
+        vert = self.bm.verts.new(self.local_co(self.location))
+        vert.select = True
+        self.frontier = [vert]
+        return vert
+
+    @recorded
+    def merge(self, t=0.0001):
+        """Merges duplicate selected vertices. t = threshold"""
+        bmesh.ops.remove_doubles(self.bm, verts=self.selected_verts(), dist=t)
+        self.reset_frontier()
+
+    @recorded
+    def merge_at_turtle(self):
+        """Merges selected vertices at the turtle's location"""
+        bmesh.ops.pointmerge(
+            self.bm,
+            verts=self.selected_verts(),
+            merge_co=self.local_co(self.location))
+        self.reset_frontier()
+
+    @recorded
+    def edge_face_add(self):
+        """Creates an edge or face from the selection, like mesh.edge_face_add"""
+        ret = bmesh.ops.contextual_create(self.bm, geom=self.selected_geom())
+        self.select_geom(ret['faces'] + ret['edges'])
+        return ret
+
+    @recorded
+    def fill(self):
+        """Fills selected edge loops with triangles, like mesh.fill"""
+        ret = bmesh.ops.triangle_fill(
+            self.bm,
+            use_beauty=True,
+            use_dissolve=False,
+            edges=self.selected_edges())
+        self.select_geom(ret['geom'])
+        return ret
+
+    @recorded
+    def fill_grid(self, span=1):
+        """Fills a single selected closed edge loop with a grid, like mesh.fill_grid.
+
+        The loop is split into two rails from its sharpest corner, span
+        edges apart, in the same way the operator splits it.
+        """
+        loop = edge_loop_verts(self.selected_edges())
+        verts_len = len(loop)
+
+        # find the vertex with the best angle (a corner vertex)
+        best = 0
+        best_angle = -1.0
+        for i, v in enumerate(loop):
+            v_a = loop[i - 1].co - v.co
+            v_b = loop[(i + 1) % verts_len].co - v.co
+            angle = pi - v_a.angle(v_b, 0)
+            if angle > best_angle:
+                best_angle = angle
+                best = i
+
+        loop = loop[best:] + loop[:best]
+        edges = [self.bm.edges.get((loop[i], loop[(i + 1) % verts_len]))
+                 for i in range(verts_len)]
+
+        span = min(span, (verts_len // 2) - 1)
+        rails = edges[span:verts_len // 2] + edges[(verts_len // 2) + span:]
+
+        ret = bmesh.ops.grid_fill(self.bm, edges=rails, use_interp_simple=False)
+        self.deselect_all()
+        self.select_geom(ret['faces'])
+        return ret
+
+    @recorded
+    def bridge(self, number_cuts=0, interpolation='PATH'):
+        """Bridges selected edge loops, like mesh.bridge_edge_loops"""
+        ret = bmesh.ops.bridge_loops(self.bm, edges=self.selected_edges())
+        self.deselect_all()
+        self.select_geom(ret['faces'])
+
+        if number_cuts:
+            subd = bmesh.ops.subdivide_edgering(
+                self.bm,
+                edges=ret['edges'],
+                interp_mode=interpolation,
+                smooth=1.0,
+                cuts=number_cuts,
+                profile_shape='SMOOTH',
+                profile_shape_factor=0.0)
+            self.select_geom(subd['faces'])
+        return ret
+
+    @recorded
+    def inset(self, thickness, depth=0, use_select_inset=False):
+        """Insets selected faces, like mesh.inset"""
+        faces = self.selected_faces()
+        ret = bmesh.ops.inset_region(
+            self.bm,
+            faces=faces,
+            use_boundary=True,
+            use_even_offset=True,
+            use_interpolate=True,
+            thickness=thickness,
+            depth=depth)
+
+        self.deselect_all()
+        if use_select_inset:
+            self.select_geom(ret['faces'])
+        else:
+            self.select_geom(faces)
+        return ret
+
+    @recorded
+    def bevel_verts(self, offset):
+        """Vertex only bevel of selected verts using offset type WIDTH"""
+        verts = self.selected_verts()
+        try:
+            ret = bmesh.ops.bevel(
+                self.bm,
+                geom=verts,
+                offset=offset,
+                offset_type='WIDTH',
+                segments=1,
+                profile=0.5,
+                affect='VERTICES',
+                loop_slide=True)
+        except TypeError:
+            # before 2.90 affect was the boolean vertex_only
+            ret = bmesh.ops.bevel(
+                self.bm,
+                geom=verts,
+                offset=offset,
+                offset_type='WIDTH',
+                segments=1,
+                profile=0.5,
+                vertex_only=True,
+                loop_slide=True)
+
+        self.deselect_all()
+        self.select_geom(ret['verts'] + ret['faces'])
+        return ret
+
+    @recorded
+    def connect_verts(self):
+        """Connects two selected verts across a face, like mesh.vert_connect_path"""
+        ret = bmesh.ops.connect_vert_pair(self.bm, verts=self.selected_verts())
+        self.select_geom(ret['edges'])
+        return ret
+
+    @recorded
+    def subdivide(self, number_cuts=1):
+        """Subdivides selected edges, like mesh.subdivide"""
+        ret = bmesh.ops.subdivide_edges(
+            self.bm,
+            edges=self.selected_edges(),
+            cuts=number_cuts,
+            use_grid_fill=True,
+            quad_corner_type='STRAIGHT_CUT')
+        self.select_geom(ret['geom'])
+        return ret
+
+    @recorded
+    def duplicate_move(self, v):
+        """Duplicates selection and moves it by v in the turtle's local space"""
+        ret = bmesh.ops.duplicate(self.bm, geom=self.selected_geom())
+        geom = ret['geom']
+        world_trans = self.rotation.to_matrix() @ Vector(v)
+        verts = [ele for ele in geom if isinstance(ele, bmesh.types.BMVert)]
+        bmesh.ops.translate(self.bm, vec=world_trans, verts=verts)
+        self.deselect_all()
+        self.select_geom(geom)
+        return ret
+
+    @recorded
+    def delete(self, type='VERT'):
+        """Deletes selection and deselects what is left, like mesh.delete.
+
+        type -- 'VERT', 'EDGE', 'FACE' or 'ONLY_FACE'
+        """
+        if type == 'VERT':
+            bmesh.ops.delete(self.bm, geom=self.selected_verts(), context='VERTS')
+        elif type == 'EDGE':
+            bmesh.ops.delete(self.bm, geom=self.selected_edges(), context='EDGES')
+        elif type == 'FACE':
+            bmesh.ops.delete(self.bm, geom=self.selected_faces(), context='FACES')
+        elif type == 'ONLY_FACE':
+            bmesh.ops.delete(self.bm, geom=self.selected_faces(), context='FACES_ONLY')
+        self.deselect_all()
+
+    @recorded
+    def mirror(self, axis, merge_dist=0.001):
+        """Mirrors the whole mesh around the object origin, merging
+        verts on the mirror plane. axis = 'X', 'Y' or 'Z'"""
+        bmesh.ops.mirror(
+            self.bm,
+            geom=self.bm.verts[:] + self.bm.edges[:] + self.bm.faces[:],
+            merge_dist=merge_dist,
+            axis=axis)
+        self.reset_frontier()
+
+    @recorded
+    def triangulate(self):
+        """Triangulates selected faces, like mesh.quads_convert_to_tris"""
+        bmesh.ops.triangulate(
+            self.bm,
+            faces=self.selected_faces(),
+            quad_method='BEAUTY',
+            ngon_method='BEAUTY')
+        self.bm.select_flush_mode()
+        self.reset_frontier()
+
+    @recorded
+    def recalc_normals(self):
+        """Makes normals of selected faces consistent"""
+        bmesh.ops.recalc_face_normals(self.bm, faces=self.selected_faces())
+
+    # path commands
+    @recorded
+    def begin_path(self):
+        """Stores the index of the last vert that has been drawn"""
+        self.beginpath_vert = len(self.bm.verts) - 1
+
+    def path_verts(self):
+        """Returns all verts drawn since begin_path"""
+        self.bm.verts.ensure_lookup_table()
+        return self.bm.verts[self.beginpath_vert:]
+
+    @recorded
+    def select_path(self):
+        """Selects all verts drawn since begin_path"""
+        frontier = self.get_frontier()
+        self.frontier = frontier + select_verts(self.path_verts())
+
+    @recorded
+    def stroke_path(self):
+        """Draws an edge between the last vert and the begin_path vert"""
+        verts = self.path_verts()
+        if len(verts) > 1 and self.bm.edges.get((verts[0], verts[-1])) is None:
+            self.bm.edges.new((verts[0], verts[-1]))
+        self.deselect_all()
+        verts[-1].select = True
+        self.frontier = [verts[-1]]
+
+    @recorded
+    def fill_path(self):
+        """Creates a face from all verts drawn since begin_path"""
+        self.select_path()
+        self.edge_face_add()
+        self.deselect_all()
+
+    # selection commands
+    def selected_verts(self):
+        return [v for v in self.bm.verts if v.select]
+
+    def selected_edges(self):
+        return [e for e in self.bm.edges if e.select]
+
+    def selected_faces(self):
+        return [f for f in self.bm.faces if f.select]
+
+    def selected_geom(self):
+        return self.selected_verts() + self.selected_edges() + self.selected_faces()
+
+    @recorded
+    def select_geom(self, geom):
+        """Adds verts, edges or faces to the selection"""
+        for ele in geom:
+            if isinstance(ele, bmesh.types.BMVert):
+                ele.select = True
+            else:
+                for v in ele.verts:
+                    v.select = True
+        self.bm.select_flush_mode()
+        self.reset_frontier()
+
+    @recorded
+    def select_all(self):
+        bm_select_all(self.bm)
+        self.reset_frontier()
+
+    @recorded
+    def deselect_all(self):
+        bm_deselect_all(self.bm)
+        self.frontier = []
+
+    @recorded
+    def select_by_location(self, lbound, ubound, buffer=0.01, additive=False):
+        """Selects verts within a bounding cuboid in world coordinates"""
+        lbound = self.local_co(lbound)
+        ubound = self.local_co(ubound)
+
+        for v in self.bm.verts:
+            inside = lbound[0] - buffer <= v.co[0] <= ubound[0] + buffer and \
+                lbound[1] - buffer <= v.co[1] <= ubound[1] + buffer and \
+                lbound[2] - buffer <= v.co[2] <= ubound[2] + buffer
+            if additive:
+                v.select |= inside
+            else:
+                v.select = inside
+        self.bm.select_flush_mode()
+        self.reset_frontier()
+
+    @recorded
+    def select_at_turtle(self, buffer=0.01, additive=True):
+        """Selects verts at the turtle's location"""
+        self.select_by_location(self.location, self.location, buffer, additive)
+
+    # vertex group commands
+    @recorded
+    def assign_vert_group(self, group, verts=None):
+        """Adds verts to a vertex group.
+
+        Weights are stored in the bmesh deform layer and written to the
+        object along with the mesh on finalise, so scripts can put verts
+        in their groups as they draw them rather than selecting each group
+        in edit mode afterwards.
+
+        Keyword arguments:
+        verts -- verts to add, defaults to the selected verts
+        """
+        if group not in self.vert_groups:
+            self.vert_groups.append(group)
+        index = self.vert_groups.index(group)
+
+        if verts is None:
+            verts = self.selected_verts()
+
+        deform = self.bm.verts.layers.deform.verify()
+        for v in verts:
+            v[deform][index] = 1.0
+
+    def play(self, program):
+        """Runs the commands in a program recorded by another turtle"""
+        for command, args, kwargs in program:
+            getattr(self, command)(
+                *decode_args(self.bm, args),
+                **decode_args(self.bm, kwargs))
+
+    def finalise(self, collection=None, make_active=False):
+        """Write turtle bmesh to a new object, link it and free the bmesh.
+
+        Keyword arguments:
+        collection -- bpy.types.Collection to link to,
+        defaults to active collection
+        make_active -- BOOL, select the new object and make it active,
+        deselecting everything else
+        """
+        mesh = bpy.data.meshes.new("mesh")
+        obj = bpy.data.objects.new(self.name, mesh)
+        obj.location = self.origin
+
+        # group indices match the deform layer written by assign_vert_group
+        for group in self.vert_groups:
+            obj.vertex_groups.new(name=group)
+
+        self.bm.to_mesh(mesh)
+        self.bm.free()
+        self.bm = None
+
+        if collection is None:
+            collection = bpy.context.layer_collection.collection
+        collection.objects.link(obj)
+
+        if make_active:
+            for selected in bpy.context.selected_objects:
+                selected.select_set(False)
+            obj.select_set(True)
+            bpy.context.view_layer.objects.active = obj
+
+        return obj
+
+
+def create_turtle(name, vert_groups=None, matrix=None, record=False):
+    """Returns a new Turtle. Defaults to starting at the world origin"""
+    return Turtle(name, matrix, vert_groups, record)
+
+
+def finalise_turtle(turtle, collection=None, make_active=False):
+    """Creates an object from the turtle's bmesh and returns it"""
+    return turtle.finalise(collection, make_active)
+
+
+def cursor_matrix():
+    """Returns a matrix at the scene cursor's location.
+
+    Turtle scripts start at the cursor but, like turtle.add_turtle,
+    ignore its rotation
+    """
+    return Matrix.Translation(bpy.context.scene.cursor.location)
+
+
+def extrude_translate(bm, world_trans, geom=None):
+    """Extrudes geometry of bm and moves it by world_trans.
+
+    Works like mesh.extrude_region_move. Loose verts are extruded into
+    edges, wire edges into faces and faces as a region. Only geom is
+    deselected and only the extruded geometry is selected so the cost
+    depends on the size of geom rather than the size of the mesh.
+
+    Keyword arguments:
+    geom -- list of selected verts, edges and faces to extrude,
+    defaults to the selection of bm
+    Returns the extruded verts, edges and faces
+    """
+    if geom is None:
+        geom = [v for v in bm.verts if v.select] + \
+            [e for e in bm.edges if e.select] + \
+            [f for f in bm.faces if f.select]
+
+    if not geom:
+        return []
+
+    ret = bmesh.ops.extrude_face_region(bm, geom=geom)
+    verts = [ele for ele in ret['geom'] if isinstance(ele, bmesh.types.BMVert)]
+    bmesh.ops.translate(bm, vec=world_trans, verts=verts)
+
+    # extrude copies the select flag to the new geometry so
+    # deselect the old frontier and everything touching it
+    for ele in geom:
+        if ele.is_valid:
+            ele.select_set(False)
 
+    for v in verts:
+        v.select_set(True)
 
-def finalise_turtle(bm, obj):
-    mesh = obj.data
-    bm.to_mesh(mesh)
-    bm.free()
+    # flush selection to the extruded edges and faces only
+    new_geom = verts[:]
+    for ele in ret['geom']:
+        if not isinstance(ele, bmesh.types.BMVert):
+            selected = all(v.select for v in ele.verts)
+            ele.select_set(selected)
+            if selected:
+                new_geom.append(ele)
+
+    return new_geom
+
+
+def extrude_subdivided(bm, world_trans, cuts, geom=None):
+    """Extrudes geometry of bm by world_trans in cuts equal segments.
+
+    Rather than extruding once per segment we extrude once and
+    subdivide the side edges, so all the rings are built by two
+    bmesh ops whatever the number of cuts.
+    Returns the extruded verts, edges and faces
+    """
+    if geom is None:
+        geom = [v for v in bm.verts if v.select] + \
+            [e for e in bm.edges if e.select] + \
+            [f for f in bm.faces if f.select]
+
+    old_verts = set(ele for ele in geom if isinstance(ele, bmesh.types.BMVert))
+    new_geom = extrude_translate(bm, world_trans, geom)
+
+    if cuts < 2:
+        return new_geom
+
+    new_verts = [ele for ele in new_geom if isinstance(ele, bmesh.types.BMVert)]
+    side_edges = [e for v in new_verts for e in v.link_edges if e.other_vert(v) in old_verts]
+
+    ret = bmesh.ops.subdivide_edges(
+        bm,
+        edges=side_edges,
+        cuts=cuts - 1,
+        use_grid_fill=True)
+
+    # the cuts may pick up the select flag of the extruded verts
+    new_verts = set(new_verts)
+    for ele in ret['geom']:
+        if isinstance(ele, bmesh.types.BMVert) and ele not in new_verts:
+            ele.select_set(False)
+
+    return new_geom
+
+
+def extrude_guarded(bm, world_trans, cuts, guards, geom=None):
+    """Extrudes geometry of bm by world_trans with a guard segment at
+    each end and cuts equal segments in between.
+
+    Keyword arguments:
+    guards -- (start, end) lengths of the guard segments. Skipped if 0
+    Returns the extruded verts, edges and faces
+    """
+    direction = world_trans.normalized()
+    middle = world_trans - direction * (guards[0] + guards[1])
+
+    if guards[0]:
+        geom = extrude_translate(bm, direction * guards[0], geom)
+    geom = extrude_subdivided(bm, middle, cuts, geom)
+    if guards[1]:
+        geom = extrude_translate(bm, direction * guards[1], geom)
+
+    return geom
+
+
+def encode_args(bm, args):
+    """Converts turtle command arguments to plain lists, dicts and numbers.
+
+    Verts, edges and faces are stored by index as {'vert': index} etc.
+    """
+    if isinstance(args, dict):
+        return {key: encode_args(bm, value) for key, value in args.items()}
+    if isinstance(args, bmesh.types.BMVert):
+        bm.verts.index_update()
+        return {'vert': args.index}
+    if isinstance(args, bmesh.types.BMEdge):
+        bm.edges.index_update()
+        return {'edge': args.index}
+    if isinstance(args, bmesh.types.BMFace):
+        bm.faces.index_update()
+        return {'face': args.index}
+    if isinstance(args, (list, tuple, set, Vector, Euler)):
+        return [encode_args(bm, arg) for arg in args]
+    return args
+
+
+def decode_args(bm, args):
+    """Converts arguments stored by encode_args back to turtle command arguments"""
+    if isinstance(args, dict):
+        if 'vert' in args:
+            bm.verts.ensure_lookup_table()
+            return bm.verts[args['vert']]
+        if 'edge' in args:
+            bm.edges.ensure_lookup_table()
+            return bm.edges[args['edge']]
+        if 'face' in args:
+            bm.faces.ensure_lookup_table()
+            return bm.faces[args['face']]
+        return {key: decode_args(bm, value) for key, value in args.items()}
+    if isinstance(args, list):
+        return [decode_args(bm, arg) for arg in args]
+    return args
+
+
+def verts_on_segment(verts, start, end, tolerance=0.0001):
+    """Returns the verts that lie on the line from start to end when seen
+    from above, at any height. Coordinates are local to the turtle"""
+    start = Vector(start).xy
+    end = Vector(end).xy
+    direction = end - start
+    length = direction.length
+    direction.normalize()
+
+    on_segment = []
+    for v in verts:
+        offset = v.co.xy - start
+        along = offset.dot(direction)
+        if -tolerance <= along <= length + tolerance and \
+                (offset - direction * along).length <= tolerance:
+            on_segment.append(v)
+    return on_segment
+
+
+def verts_over(verts, locs, tolerance=0.0001):
+    """Returns the verts directly above or below any of locs.
+    Coordinates are local to the turtle"""
+    kd = kdtree.KDTree(len(locs))
+    for i, co in enumerate(locs):
+        kd.insert((co[0], co[1], 0), i)
+    kd.balance()
+
+    over = []
+    for v in verts:
+        co, index, dist = kd.find((v.co[0], v.co[1], 0))
+        if index is not None and dist <= tolerance:
+            over.append(v)
+    return over
+
+
+def edge_loop_verts(edges):
+    """Returns the verts of a closed loop of edges in order"""
+    edges = set(edges)
+    first = next(iter(edges))
+    loop = [first.verts[0]]
+    e = first
+    v = first.verts[1]
+
+    while v is not loop[0]:
+        loop.append(v)
+        e = next(le for le in v.link_edges if le in edges and le is not e)
+        v = e.other_vert(v)
+
+    return loop
 
 
 def bm_select_all(bm):
     for v in bm.verts:
         v.select_set(True)
-        bm.select_flush(True)
+    bm.select_flush(True)
 
 
 def bm_deselect_all(bm):
@@ -183,20 +847,21 @@ def bm_deselect_all(bm):
     bm.select_flush(False)
 
 
-def draw_cuboid(dimensions):
-    bm, obj = create_turtle(name='cuboid')
+def draw_cuboid(dimensions, matrix=None):
+    """Draws a cuboid and returns it.
 
-    bm.select_mode = {'VERT'}
+    Keyword arguments:
+    dimensions -- (x, y, z)
+    matrix -- 4x4 Matrix, transform to start drawing from
+    """
+    t = create_turtle('cuboid', matrix=matrix)
 
-    fd(bm, dimensions[1])
-    bm.select_mode = {'EDGE'}
-    bm_select_all(bm)
-    ri(bm, dimensions[0])
-    bm.select_mode = {'FACE'}
-    bm_select_all(bm)
-    up(bm, dimensions[2], False)
-    pu(bm)
-    home(obj)
-    finalise_turtle(bm, obj)
+    t.fd(dimensions[1])
+    t.select_all()
+    t.ri(dimensions[0])
+    t.select_all()
+    t.up(dimensions[2])
+    t.pu()
+    t.home()
 
-    return obj
+    return finalise_turtle(t)
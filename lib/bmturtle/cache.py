@@ -0,0 +1,338 @@
+"""Caches the meshes drawn by turtle scripts.
+
+Turtle scripts always draw the same mesh for the same arguments, so we
+store the mesh of each script call keyed by a hash of the script's name,
+its arguments and the source of the turtle and its scripts, so editing
+them makes the cached meshes stale. Cached meshes are kept in memory for
+the session and saved to the mesh cache folder set in the addon
+preferences, so drawing a tile with the same parameters again creates the
+object straight from the cached mesh. The least recently used meshes are
+removed from the folder when it grows bigger than the size set in the
+preferences.
+"""
+import os
+import json
+import hashlib
+from functools import wraps
+from contextlib import contextmanager
+import bpy
+from mathutils import Vector
+from ... utils.registration import get_prefs
+
+# cache key: cached mesh and return values
+memory_cache = {}
+
+# bump when the format of cache entries changes
+cache_version = 2
+
+# hash of the source of the bmturtle package, made the first time it's needed
+source_hash = {'hash': None}
+
+# scripts skip the cache while this is more than 0. See bypass_cache
+bypass_depth = {'depth': 0}
+
+
+def cached_script(func=None, world_vectors=False):
+    """Decorator for turtle scripts that return an object or a tuple
+    whose first item is an object. Scripts whose arguments can't be
+    hashed are run as normal.
+
+    Keyword arguments:
+    world_vectors -- BOOL, Vectors returned with the object are world
+    coordinates. They are cached relative to the cursor so the cached
+    mesh can be reused wherever the cursor is
+    """
+    if func is None:
+        return lambda func: cached_script(func, world_vectors)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if bypass_depth['depth'] > 0:
+            return func(*args, **kwargs)
+
+        try:
+            key = cache_key(func, args, kwargs)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        offset = bpy.context.scene.cursor.location.copy() if world_vectors else None
+
+        entry = memory_cache.get(key)
+        if entry is None:
+            entry = load_entry(key)
+
+        if entry is not None:
+            memory_cache[key] = entry
+            return entry_to_result(entry, offset)
+
+        result = func(*args, **kwargs)
+        entry = result_to_entry(result, offset)
+        if entry is not None:
+            memory_cache[key] = entry
+            save_entry(key, entry)
+        return result
+    return wrapper
+
+
+@contextmanager
+def bypass_cache():
+    """Context manager that runs cached scripts, and any cached scripts
+    they call, without reading from or saving to the cache"""
+    bypass_depth['depth'] += 1
+    try:
+        yield
+    finally:
+        bypass_depth['depth'] -= 1
+
+
+def cache_key(func, args, kwargs):
+    """Returns a hash of the script's name, its arguments and the turtle source"""
+    data = to_json(
+        [cache_version, get_source_hash(), func.__module__, func.__qualname__, args, kwargs],
+        precision=6)
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def get_source_hash():
+    """Returns a hash of the .py files in the bmturtle package, which
+    holds the turtle and all the cached scripts"""
+    if source_hash['hash'] is None:
+        sha = hashlib.sha1()
+        package_path = os.path.dirname(os.path.abspath(__file__))
+        for root, dirs, files in os.walk(package_path):
+            dirs.sort()
+            for filename in sorted(files):
+                if filename.endswith('.py'):
+                    with open(os.path.join(root, filename), 'rb') as f:
+                        sha.update(filename.encode())
+                        sha.update(f.read())
+        source_hash['hash'] = sha.hexdigest()
+    return source_hash['hash']
+
+
+def to_json(value, precision=None, offset=None):
+    """Converts value to something json can store. Vectors are stored as
+    {'vector': [x, y, z]} with offset subtracted from them. Raises
+    TypeError for anything else json can't store"""
+    if isinstance(value, Vector):
+        if offset is not None:
+            value = value - offset
+        return {'vector': [to_json(v, precision) for v in value]}
+    if isinstance(value, dict):
+        return {str(k): to_json(v, precision, offset) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(v, precision, offset) for v in value]
+    if isinstance(value, float):
+        return round(value, precision) if precision is not None else value
+    if isinstance(value, (int, str, bool)) or value is None:
+        return value
+    if hasattr(value, '__len__') and hasattr(value, '__getitem__'):
+        # bpy_prop_array and other sequences
+        return [to_json(v, precision) for v in value]
+    raise TypeError("Can't cache value of type " + type(value).__name__)
+
+
+def from_json(value, offset=None):
+    """Reverses to_json"""
+    if isinstance(value, dict):
+        if 'vector' in value and len(value) == 1:
+            vec = Vector(value['vector'])
+            return vec + offset if offset is not None else vec
+        return {k: from_json(v, offset) for k, v in value.items()}
+    if isinstance(value, list):
+        return [from_json(v, offset) for v in value]
+    return value
+
+
+def result_to_entry(result, offset=None):
+    """Returns a cache entry for the value returned by a turtle script"""
+    if isinstance(result, bpy.types.Object):
+        obj, extra = result, None
+    elif isinstance(result, tuple) and result and isinstance(result[0], bpy.types.Object):
+        obj, extra = result[0], list(result[1:])
+    else:
+        return None
+
+    try:
+        extra = to_json(extra, offset=offset)
+    except TypeError:
+        return None
+
+    return {'mesh': mesh_to_dict(obj), 'extra': extra}
+
+
+def entry_to_result(entry, offset=None):
+    """Creates an object from a cache entry and returns it in the same
+    form the script returned it"""
+    obj = dict_to_object(entry['mesh'])
+    if entry['extra'] is None:
+        return obj
+    return (obj, *from_json(entry['extra'], offset))
+
+
+def mesh_to_dict(obj):
+    """Returns the mesh and vertex groups of obj as a dict. Edges that
+    aren't part of a face are stored as loose_edges"""
+    mesh = obj.data
+
+    co = [0.0] * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', co)
+    vertex_index = [0] * len(mesh.loops)
+    mesh.loops.foreach_get('vertex_index', vertex_index)
+    loop_start = [0] * len(mesh.polygons)
+    mesh.polygons.foreach_get('loop_start', loop_start)
+    loop_total = [0] * len(mesh.polygons)
+    mesh.polygons.foreach_get('loop_total', loop_total)
+
+    uv = None
+    if mesh.uv_layers.active is not None:
+        uv = [0.0] * (len(mesh.loops) * 2)
+        mesh.uv_layers.active.data.foreach_get('uv', uv)
+
+    edge_index = [0] * len(mesh.loops)
+    mesh.loops.foreach_get('edge_index', edge_index)
+    face_edges = set(edge_index)
+    loose_edges = [list(edge.vertices) for edge in mesh.edges if edge.index not in face_edges]
+
+    # name: [vert indices, weights]
+    vert_groups = {group.name: [[], []] for group in obj.vertex_groups}
+    names = {group.index: group.name for group in obj.vertex_groups}
+    for v in mesh.vertices:
+        for g in v.groups:
+            indices, weights = vert_groups[names[g.group]]
+            indices.append(v.index)
+            weights.append(g.weight)
+
+    return {
+        'name': obj.name,
+        'co': co,
+        'vertex_index': vertex_index,
+        'loop_start': loop_start,
+        'loop_total': loop_total,
+        'loose_edges': loose_edges,
+        'uv': uv,
+        'vert_groups': vert_groups}
+
+
+def dict_to_object(data):
+    """Creates an object at the cursor from a dict made by mesh_to_dict,
+    links it to the active collection and makes it active"""
+    mesh = bpy.data.meshes.new('mesh')
+    mesh.vertices.add(len(data['co']) // 3)
+    mesh.vertices.foreach_set('co', data['co'])
+    mesh.loops.add(len(data['vertex_index']))
+    mesh.loops.foreach_set('vertex_index', data['vertex_index'])
+    mesh.polygons.add(len(data['loop_start']))
+    mesh.polygons.foreach_set('loop_start', data['loop_start'])
+    mesh.polygons.foreach_set('loop_total', data['loop_total'])
+    mesh.update(calc_edges=True)
+
+    loose_edges = data['loose_edges']
+    if loose_edges:
+        edge_verts = [0] * (len(mesh.edges) * 2)
+        mesh.edges.foreach_get('vertices', edge_verts)
+        mesh.edges.add(len(loose_edges))
+        mesh.edges.foreach_set('vertices', edge_verts + [i for edge in loose_edges for i in edge])
+        mesh.update()
+
+    if data['uv'] is not None:
+        uv_layer = mesh.uv_layers.new(name='UVMap')
+        uv_layer.data.foreach_set('uv', data['uv'])
+
+    obj = bpy.data.objects.new(data['name'], mesh)
+    obj.location = bpy.context.scene.cursor.location
+
+    for name, (indices, weights) in data['vert_groups'].items():
+        group = obj.vertex_groups.new(name=name)
+        # add verts with the same weight together
+        by_weight = {}
+        for index, weight in zip(indices, weights):
+            by_weight.setdefault(weight, []).append(index)
+        for weight, weight_indices in by_weight.items():
+            group.add(weight_indices, weight, 'REPLACE')
+
+    bpy.context.layer_collection.collection.objects.link(obj)
+    for selected in bpy.context.selected_objects:
+        selected.select_set(False)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+
+    return obj
+
+
+def get_cache_path():
+    """Returns the mesh cache folder or None if the disk cache is off"""
+    prefs = get_prefs()
+    if not prefs.use_mesh_cache or not prefs.mesh_cache_path:
+        return None
+    return bpy.path.abspath(prefs.mesh_cache_path)
+
+
+def load_entry(key):
+    """Returns the cache entry saved on disk for key or None"""
+    path = get_cache_path()
+    if path is None:
+        return None
+
+    filepath = os.path.join(path, key + '.json')
+    if not os.path.isfile(filepath):
+        return None
+
+    try:
+        with open(filepath) as f:
+            entry = json.load(f)
+        # mark as recently used so trim_cache keeps it
+        os.utime(filepath)
+        return entry
+    except (OSError, ValueError):
+        return None
+
+
+def save_entry(key, entry):
+    """Saves a cache entry to disk"""
+    path = get_cache_path()
+    if path is None:
+        return
+
+    try:
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, key + '.json'), 'w') as f:
+            json.dump(entry, f)
+    except OSError:
+        return
+
+    trim_cache(path, get_prefs().mesh_cache_size * 1024 * 1024)
+
+
+def trim_cache(path, max_size):
+    """Removes the least recently used entries from the mesh cache folder
+    until it is no bigger than max_size bytes"""
+    entries = []
+    for filename in os.listdir(path):
+        if filename.endswith('.json'):
+            try:
+                stat = os.stat(os.path.join(path, filename))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, filename))
+
+    size = sum(entry[1] for entry in entries)
+    for mtime, file_size, filename in sorted(entries):
+        if size <= max_size:
+            break
+        try:
+            os.remove(os.path.join(path, filename))
+        except OSError:
+            continue
+        size -= file_size
+
+
+def clear_cache(disk=False):
+    """Empties the memory cache and optionally the disk cache"""
+    memory_cache.clear()
+
+    path = get_cache_path()
+    if disk and path is not None and os.path.isdir(path):
+        for filename in os.listdir(path):
+            if filename.endswith('.json'):
+                os.remove(os.path.join(path, filename))
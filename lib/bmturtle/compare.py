@@ -0,0 +1,206 @@
+"""Compare the bpy.ops.turtle scripts with their bmturtle equivalents.
+
+Run from Blender's python console with MakeTile enabled:
+
+    from MakeTile.lib.bmturtle.compare import compare_all
+    compare_all()
+
+Each script is run with both backends at the world origin. The vert and
+face counts, the sorted vertex coordinates and the time each backend
+took are reported. The bmesh scripts are run without the mesh cache so
+they are timed drawing the mesh. Scripts in shape_only_cases build the same solid from
+different verts and faces, so only their volume and bounds are compared.
+"""
+from time import perf_counter
+import bpy
+import bmesh
+from .. utils.utils import mode
+from . cache import bypass_cache
+from .. turtle.scripts import (
+    primitives as ops_primitives,
+    straight_tile as ops_straight_tile,
+    triangular_tile as ops_triangular_tile,
+    curved_floor as ops_curved_floor,
+    openlock_floor_base as ops_openlock_floor_base,
+    openlock_curved_wall_base as ops_openlock_curved_wall_base,
+    U_tile as ops_U_tile)
+from .. turtle.scripts import L_Tile as ops_L_Tile
+from . scripts import (
+    primitives,
+    straight_tile,
+    triangular_tile,
+    curved_floor,
+    openlock_floor_base,
+    openlock_curved_wall_base,
+    U_tile,
+    L_Tile)
+
+
+# scripts whose bmesh version deliberately builds different topology: reason
+shape_only_cases = {
+    'draw_openlock_rect_floor_base':
+        'built directly from the profile with ngon walls and bottoms '
+        'rather than by mirroring a turtle drawn quarter'}
+
+
+def sample_cases():
+    """Returns a list of (name, ops function, bmesh function, args)"""
+    triangles = ops_L_Tile.calculate_corner_wall_triangles(2, 2, 0.3, 90)
+
+    return [
+        ('draw_cuboid',
+         ops_primitives.draw_cuboid,
+         primitives.draw_cuboid,
+         ((2, 1, 0.5),)),
+        ('draw_curved_slab',
+         ops_primitives.draw_curved_slab,
+         primitives.draw_curved_slab,
+         (2, 90, 0.3, 0.5, 8)),
+        ('draw_straight_wall_core',
+         ops_straight_tile.draw_straight_wall_core,
+         straight_tile.draw_straight_wall_core,
+         ((2, 0.3, 2), (8, 1, 8))),
+        ('draw_rectangular_floor_core',
+         ops_straight_tile.draw_rectangular_floor_core,
+         straight_tile.draw_rectangular_floor_core,
+         ((2, 2, 0.3), (8, 8, 1))),
+        ('draw_tri_floor_core',
+         ops_triangular_tile.draw_tri_floor_core,
+         triangular_tile.draw_tri_floor_core,
+         (2, 2, 90, 0.3)),
+        ('draw_openlock_tri_floor_base',
+         ops_triangular_tile.draw_openlock_tri_floor_base,
+         triangular_tile.draw_openlock_tri_floor_base,
+         (2, 2, 0.2755, 90)),
+        ('draw_pos_curved_slab',
+         ops_curved_floor.draw_pos_curved_slab,
+         curved_floor.draw_pos_curved_slab,
+         (2, 8, 90, 0.3, (4, 4, 1, 8))),
+        ('draw_neg_curved_slab',
+         ops_curved_floor.draw_neg_curved_slab,
+         curved_floor.draw_neg_curved_slab,
+         (2, 8, 90, 0.3, (4, 4, 1, 8))),
+        ('draw_openlock_pos_curved_base',
+         ops_curved_floor.draw_openlock_pos_curved_base,
+         curved_floor.draw_openlock_pos_curved_base,
+         (2, 8, 90, 0.2755)),
+        ('draw_openlock_rect_floor_base',
+         ops_openlock_floor_base.draw_openlock_rect_floor_base,
+         openlock_floor_base.draw_openlock_rect_floor_base,
+         ((4, 4, 0.2756),)),
+        ('draw_openlock_curved_base',
+         ops_openlock_curved_wall_base.draw_openlock_curved_base,
+         openlock_curved_wall_base.draw_openlock_curved_base,
+         (2, 8, 90, 0.2755, 'INNER')),
+        ('draw_u_3D',
+         ops_U_tile.draw_u_3D,
+         U_tile.draw_u_3D,
+         (2, 2, 0.3, 2, 1)),
+        ('draw_corner_3D',
+         ops_L_Tile.draw_corner_3D,
+         L_Tile.draw_corner_3D,
+         (triangles, 90, 0.3, 2)),
+        ('draw_corner_wall_core',
+         ops_L_Tile.draw_corner_wall_core,
+         L_Tile.draw_corner_wall_core,
+         (triangles, 90, 0.3, 2, (8, 8, 1, 8)))]
+
+
+def run_script(func, args):
+    """Runs func with the scene cursor at the world origin and returns
+    the object it drew and how long it took"""
+    cursor = bpy.context.scene.cursor
+    cursor.location = (0, 0, 0)
+    cursor.rotation_euler = (0, 0, 0)
+
+    start = perf_counter()
+    ret = func(*args)
+    mode('OBJECT')
+    elapsed = perf_counter() - start
+
+    if isinstance(ret, bpy.types.Object):
+        obj = ret
+    elif isinstance(ret, tuple) and isinstance(ret[0], bpy.types.Object):
+        obj = ret[0]
+    else:
+        obj = bpy.context.object
+
+    return obj, elapsed
+
+
+def mesh_summary(obj, precision=4):
+    """Returns the vert count, face count and sorted rounded world
+    coordinates of obj's mesh"""
+    world = obj.matrix_world
+    coords = sorted(
+        tuple(round(c, precision) for c in world @ v.co)
+        for v in obj.data.vertices)
+    return len(obj.data.vertices), len(obj.data.polygons), coords
+
+
+def shape_summary(obj, precision=4):
+    """Returns the rounded volume and world bounds of obj's mesh"""
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    bm.transform(obj.matrix_world)
+    volume = round(bm.calc_volume(signed=False), precision)
+    coords = [v.co for v in bm.verts]
+    bounds = tuple(
+        (round(min(co[i] for co in coords), precision),
+         round(max(co[i] for co in coords), precision))
+        for i in range(3))
+    bm.free()
+    return volume, bounds
+
+
+def compare(name, ops_func, bm_func, args, precision=4):
+    """Runs a script with both backends and returns a dict describing
+    how the results differ"""
+    ops_obj, ops_time = run_script(ops_func, args)
+    ops_verts, ops_faces, ops_coords = mesh_summary(ops_obj, precision)
+    ops_shape = shape_summary(ops_obj, precision)
+    bpy.data.objects.remove(ops_obj, do_unlink=True)
+
+    with bypass_cache():
+        bm_obj, bm_time = run_script(bm_func, args)
+    bm_verts, bm_faces, bm_coords = mesh_summary(bm_obj, precision)
+    bm_shape = shape_summary(bm_obj, precision)
+    bpy.data.objects.remove(bm_obj, do_unlink=True)
+
+    if name in shape_only_cases:
+        match = ops_shape == bm_shape
+    else:
+        match = ops_verts == bm_verts and ops_faces == bm_faces and ops_coords == bm_coords
+
+    return {
+        'name': name,
+        'verts': (ops_verts, bm_verts),
+        'faces': (ops_faces, bm_faces),
+        'coords_match': ops_coords == bm_coords,
+        'shape_match': ops_shape == bm_shape,
+        'match': match,
+        'time': (ops_time, bm_time)}
+
+
+def compare_all(precision=4):
+    """Compares every script in sample_cases and prints a report"""
+    results = []
+    for name, ops_func, bm_func, args in sample_cases():
+        result = compare(name, ops_func, bm_func, args, precision)
+        results.append(result)
+
+        if result['match']:
+            status = 'SHAPE OK' if name in shape_only_cases else 'OK'
+        else:
+            status = 'DIFFERS'
+        print('{:<32} {:<9} verts {:>6} {:>6}  faces {:>6} {:>6}  ops {:>8.4f}s  bmesh {:>8.4f}s'.format(
+            name,
+            status,
+            result['verts'][0],
+            result['verts'][1],
+            result['faces'][0],
+            result['faces'][1],
+            result['time'][0],
+            result['time'][1]))
+
+    return results
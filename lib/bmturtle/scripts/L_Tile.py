@@ -0,0 +1,283 @@
+import bpy
+from ... turtle.scripts.L_Tile import calculate_corner_wall_triangles
+from .. bmturtle import create_turtle, finalise_turtle, cursor_matrix
+from .. cache import cached_script
+
+
+@cached_script(world_vectors=True)
+def draw_corner_floor(triangles, angle, thickness, floor_height, base_height, inc_vert_locs=True):
+    '''Returns a corner floor and optionally locations of bottom verts'''
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    vert_locs = draw_corner_2D_verts(t, triangles, angle, thickness)
+
+    t.select_all()
+    t.pd()
+    t.up(floor_height - base_height)
+    t.select_all()
+    t.recalc_normals()
+    t.deselect_all()
+
+    floor = finalise_turtle(t, make_active=True)
+
+    if inc_vert_locs is False:
+        return floor
+    else:
+        return floor, vert_locs
+
+
+@cached_script(world_vectors=True)
+def draw_corner_wall(triangles, angle, thickness, wall_height, base_height, inc_vert_locs=True):
+    '''Returns a corner wall and optionally locations of bottom verts'''
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    vert_locs = draw_corner_2D_verts(t, triangles, angle, thickness)
+
+    t.select_all()
+    t.pd()
+    t.up(0.001)
+    t.up(wall_height - base_height - 0.011)
+    t.up(0.01)
+    t.select_all()
+    t.recalc_normals()
+    t.pu()
+    t.deselect_all()
+
+    obj = finalise_turtle(t, make_active=True)
+
+    if inc_vert_locs is False:
+        return obj
+    else:
+        return obj, vert_locs
+
+
+@cached_script(world_vectors=True)
+def draw_corner_3D(triangles, angle, thickness, height, inc_vert_locs=False):
+    '''Returns a 3D corner piece and optionally locations of bottom verts'''
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    vert_loc = draw_corner_2D_verts(t, triangles, angle, thickness)
+
+    t.select_all()
+    t.pd()
+    t.up(height)
+    t.select_all()
+    t.recalc_normals()
+    t.pu()
+    t.deselect_all()
+
+    obj = finalise_turtle(t, make_active=True)
+
+    if inc_vert_locs is False:
+        return obj
+    else:
+        return obj, vert_loc
+
+
+@cached_script
+def draw_corner_wall_core(triangles, angle, thickness, height, native_subdivisions):
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    verts = t.bm.verts
+
+    def cos_from(start_index, start_co):
+        # subdivided moves add their cuts out of order so we
+        # sort the verts along the leg
+        verts.ensure_lookup_table()
+        cos = [v.co.copy() for v in verts[start_index:]]
+        return sorted(cos, key=lambda co: (co - start_co).length)
+
+    vert_locs = {}
+
+    # draw leg_1 #
+    # outer
+    t.rt(angle)
+    t.fd(triangles['a_adj'], cuts=native_subdivisions[0], guards=(0, 0.001))
+
+    vert_locs['Leg 1 Outer'] = cos_from(0, t.local_co(t.origin))
+
+    # end #
+    t.pu()
+    t.deselect_all()
+    t.lt(90)
+    leg_1_end_vert_locs = [t.local_co(t.location)]
+    t.fd(thickness)
+    t.pd()
+    t.add_vert()
+    leg_1_end_vert_locs.append(t.local_co(t.location))
+    vert_locs['Leg 1 End'] = leg_1_end_vert_locs
+
+    # inner #
+    t.lt(90)
+    start_index = len(verts)
+    start_co = t.local_co(t.location)
+    t.fd(triangles['b_adj'], cuts=native_subdivisions[0], guards=(0.001, 0))
+
+    # the ops version skips the 0.001 guard vert
+    leg_1_inner_vert_locs = cos_from(start_index, start_co)[1:]
+    t.deselect_all()
+    leg_1_inner_vert_locs.append(t.local_co(t.location))
+    vert_locs['Leg 1 Inner'] = leg_1_inner_vert_locs
+
+    # home #
+    t.pu()
+    t.deselect_all()
+    t.home()
+    t.select_at_turtle(buffer=0.0001)
+
+    t.pd()
+
+    # draw leg 2 #
+    # outer #
+    verts.ensure_lookup_table()
+    leg_2_outer_vert_locs = [verts[0].co.copy()]
+
+    start_index = len(verts)
+    t.fd(triangles['c_adj'], cuts=native_subdivisions[1], guards=(0, 0.001))
+
+    leg_2_outer_vert_locs.extend(cos_from(start_index, leg_2_outer_vert_locs[0]))
+
+    t.deselect_all()
+    vert_locs['Leg 2 Outer'] = leg_2_outer_vert_locs
+
+    # end #
+    t.pu()
+    t.rt(90)
+    leg_2_end_vert_locs = [t.local_co(t.location)]
+    t.fd(thickness)
+    t.pd()
+    t.add_vert()
+    leg_2_end_vert_locs.append(t.local_co(t.location))
+    vert_locs['Leg 2 End'] = leg_2_end_vert_locs
+
+    # inner #
+    t.rt(90)
+
+    start_index = len(verts)
+    start_co = t.local_co(t.location)
+    t.fd(triangles['d_adj'], cuts=native_subdivisions[1], guards=(0.001, 0))
+
+    leg_2_inner_vert_locs = cos_from(start_index, start_co)[1:]
+    t.deselect_all()
+    leg_2_inner_vert_locs.append(t.local_co(t.location))
+    vert_locs['Leg 2 Inner'] = leg_2_inner_vert_locs
+
+    t.select_all()
+    t.merge()
+    t.pu()
+    t.home()
+    t.bridge(number_cuts=native_subdivisions[2], interpolation='LINEAR')
+    t.select_all()
+    t.inset(0.001)
+    t.select_all()
+    t.merge()
+
+    # Z #
+    t.pd()
+    t.up(height, cuts=native_subdivisions[3], guards=(0.001, 0.001))
+
+    t.deselect_all()
+
+    return finalise_turtle(t, make_active=True), vert_locs
+
+
+def draw_corner_2D(triangles, angle, thickness, return_object=False):
+    '''Draws a 2D corner mesh in which is an "L" shape
+    and returns a dict containing the location of the verts for making vert
+    groups later and optionally the object.'''
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    vert_loc = draw_corner_2D_verts(t, triangles, angle, thickness)
+    obj = finalise_turtle(t, make_active=True)
+
+    if return_object is False:
+        return vert_loc
+    else:
+        return vert_loc, obj
+
+
+def draw_corner_2D_verts(t, triangles, angle, thickness):
+    '''Draws a 2D "L" shape into turtle t and returns a dict containing
+    the location of its verts'''
+    orig_loc = t.location.copy()
+    orig_rot = t.rotation.copy()
+
+    # We save the location of each vertex as it is drawn
+    # to use for making vert groups & positioning cutters
+    vert_loc = {
+        'origin': orig_loc
+    }
+    t.pd()
+    # draw X leg
+    t.rt(angle)
+    t.fd(triangles['a_adj'] - 0.001)
+    vert_loc['x_outer_1'] = t.location.copy()
+    t.fd(0.001)
+
+    vert_loc['x_outer_2'] = t.location.copy()
+    t.lt(90)
+    t.fd(0.001)
+    vert_loc['end_1_1'] = t.location.copy()
+    t.fd(thickness - 0.002)
+    vert_loc['end_1_2'] = t.location.copy()
+    t.fd(0.001)
+    vert_loc['end_1_3'] = t.location.copy()
+    t.lt(90)
+    t.fd(0.001)
+    vert_loc['x_inner_1'] = t.location.copy()
+    t.fd(triangles['b_adj'] - 0.001)
+    vert_loc['x_inner_2'] = t.location.copy()
+    # home
+    t.pu()
+    t.set_state(orig_loc, orig_rot)
+
+    t.deselect_all()
+    t.select_at_turtle(buffer=0.0001)
+    t.pd()  # vert loc same as a
+
+    # draw Y leg
+    t.fd(triangles['c_adj'] - 0.001)
+    vert_loc['y_outer_1'] = t.location.copy()
+    t.fd(0.001)
+    vert_loc['y_outer_2'] = t.location.copy()
+    t.rt(90)
+
+    t.fd(0.001)
+    vert_loc['end_2_1'] = t.location.copy()
+
+    t.fd(thickness - 0.002)
+    vert_loc['end_2_2'] = t.location.copy()
+    t.fd(0.001)
+    vert_loc['end_2_3'] = t.location.copy()
+    t.rt(90)
+    t.fd(0.001)
+    vert_loc['y_inner_1'] = t.location.copy()
+    t.fd(triangles['d_adj'] - 0.001)  # vert loc same as x_inner_2
+
+    t.select_all()
+    t.merge()
+    t.pu()
+    t.set_state(orig_loc, orig_rot)
+    t.edge_face_add()
+    t.deselect_all()
+
+    for start, end in (
+            ('origin', 'x_inner_2'),
+            ('y_inner_1', 'y_outer_1'),
+            ('x_inner_1', 'x_outer_1')):
+        t.select_by_location(vert_loc[start], vert_loc[start], buffer=0.0001)
+        t.select_by_location(vert_loc[end], vert_loc[end], buffer=0.0001, additive=True)
+        t.connect_verts()
+
+    return vert_loc
+
+
+def move_cursor_to_wall_start(triangles, angle, thickness, base_height):
+    '''Moves the scene cursor to the start of the inner leg of a corner wall'''
+    cursor = bpy.context.scene.cursor
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    t.pu()
+    t.up(base_height)
+    t.rt(angle)
+    t.fd(triangles['a_adj'])
+    t.lt(90)
+    t.fd(thickness)
+    t.lt(90)
+    t.fd(triangles['b_adj'])
+    t.bm.free()
+    cursor.location = t.location
@@ -0,0 +1,122 @@
+from .. bmturtle import create_turtle, finalise_turtle, cursor_matrix
+from .. cache import cached_script
+
+
+@cached_script(world_vectors=True)
+def draw_u_3D(leg_1_len, leg_2_len, thickness, height, inner_len, inc_vert_locs=False):
+    '''Returns a 3D U shape and optionally locations of bottom verts'''
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    vert_loc = draw_u_2D_verts(t, leg_1_len, leg_2_len, thickness, inner_len)
+
+    t.select_all()
+    t.pd()
+    t.up(height)
+    t.select_all()
+    t.recalc_normals()
+    t.pu()
+    t.deselect_all()
+
+    obj = finalise_turtle(t, make_active=True)
+
+    if inc_vert_locs is False:
+        return obj
+    else:
+        return obj, vert_loc
+
+
+def draw_u_2D(leg_1_len, leg_2_len, thickness, inner_len):
+    '''Draws a 2D U shape and returns the location of its verts'''
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    vert_loc = draw_u_2D_verts(t, leg_1_len, leg_2_len, thickness, inner_len)
+    finalise_turtle(t, make_active=True)
+    return vert_loc
+
+
+def draw_u_2D_verts(t, leg_1_len, leg_2_len, thickness, inner_len):
+    '''
+    leg_1_len and leg_2_len are the inner lengths of the legs
+                ||           ||
+                ||leg_1 leg_2||
+                ||           ||
+                ||___inner___||
+         origin x--------------
+                     outer
+    '''
+    leg_1_outer_len = leg_1_len + thickness
+    leg_2_outer_len = leg_2_len + thickness
+    outer_len = inner_len + (thickness * 2)
+
+    orig_loc = t.location.copy()
+    orig_rot = t.rotation.copy()
+
+    # We save the location of each vertex as it is drawn
+    # to use for making vert groups & positioning cutters
+    vert_loc = {
+        'origin': orig_loc
+    }
+
+    t.pd()
+    # draw leg_1
+    t.fd(0.001)
+    vert_loc['leg_1_1'] = t.location.copy()
+    t.fd(leg_1_outer_len - 0.002)
+    vert_loc['leg_1_2'] = t.location.copy()
+    t.fd(0.001)
+    vert_loc['leg_1_3'] = t.location.copy()
+    t.rt(90)
+    t.fd(0.001)
+    vert_loc['leg_1_4'] = t.location.copy()
+    t.fd(thickness - 0.002)
+    vert_loc['leg_1_5'] = t.location.copy()
+    t.fd(0.001)
+    vert_loc['leg_1_6'] = t.location.copy()
+    t.rt(90)
+    t.fd(0.001)
+    vert_loc['leg_1_7'] = t.location.copy()
+    t.fd(leg_1_len - 0.001)
+    vert_loc['leg_1_8'] = t.location.copy()
+    t.lt(90)
+    t.fd(inner_len)
+    vert_loc['leg_2_1'] = t.location.copy()
+    t.lt(90)
+    t.fd(leg_2_len - 0.001)
+    vert_loc['leg_2_2'] = t.location.copy()
+    t.fd(0.001)
+    vert_loc['leg_2_3'] = t.location.copy()
+    t.rt(90)
+    t.fd(0.001)
+    vert_loc['leg_2_4'] = t.location.copy()
+    t.fd(thickness - 0.002)
+    vert_loc['leg_2_5'] = t.location.copy()
+    t.fd(0.001)
+    vert_loc['leg_2_6'] = t.location.copy()
+    t.rt(90)
+    t.fd(0.001)
+    vert_loc['leg_2_7'] = t.location.copy()
+    t.fd(leg_2_outer_len - 0.002)
+    vert_loc['leg_2_8'] = t.location.copy()
+    t.fd(0.001)
+    vert_loc['leg_2_9'] = t.location.copy()
+    t.rt(90)
+    t.fd(0.001)
+    vert_loc['outer_1'] = t.location.copy()
+    t.fd(outer_len - 0.002)
+    vert_loc['outer_2'] = t.location.copy()
+    t.fd(0.001)
+
+    t.select_all()
+    t.merge()
+    t.pu()
+    t.set_state(orig_loc, orig_rot)
+    t.edge_face_add()
+    t.deselect_all()
+
+    # connect leg_1_2 and leg_1_7 so we can have flat ends
+    # and connect leg_2_2 and leg_2_7
+    for start, end in (('leg_1_2', 'leg_1_7'), ('leg_2_2', 'leg_2_7')):
+        t.select_by_location(vert_loc[start], vert_loc[start], buffer=0.0001)
+        t.select_by_location(vert_loc[end], vert_loc[end], buffer=0.0001, additive=True)
+        t.connect_verts()
+        t.deselect_all()
+
+    return vert_loc
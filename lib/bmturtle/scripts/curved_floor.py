@@ -0,0 +1,299 @@
+from mathutils import geometry
+from ... turtle.scripts.curved_floor import calc_tri, distance_between_two_verts
+from .. bmturtle import (
+    create_turtle,
+    finalise_turtle,
+    cursor_matrix,
+    verts_on_segment,
+    verts_over)
+from .. cache import cached_script
+
+outer_w = 0.2362                 # outer ring width
+slot_w = 0.1811                # slot width
+slot_h = 0.2402                # slot height
+support_w = 0.11811              # slot support width
+support_h = 0.05472            # slot support height
+extra_sup_dist = 0.8531       # distance between extra supports for large tiles
+
+
+def edge_intersection(t, start, angle, length, offset):
+    '''Returns the world location where two lines, each running parallel to
+    and offset inside one of the straight edges of a curved loop, cross'''
+    t.pu()
+
+    # line parallel to the edge at angle
+    t.set_position(start)
+    t.set_rotation((0, 0, 0))
+    t.rt(angle)
+    t.fd(length / 2)
+    t.lt(90)
+    t.fd(offset)
+    t.lt(90)
+    v1 = t.location.copy()
+    t.fd(0.01)
+    v2 = t.location.copy()
+
+    # line parallel to the edge at 0
+    t.set_position(start)
+    t.set_rotation((0, 0, 0))
+    t.fd(length / 2)
+    t.rt(90)
+    t.fd(offset)
+    t.rt(90)
+    v3 = t.location.copy()
+    t.fd(0.01)
+    v4 = t.location.copy()
+
+    iv = geometry.intersect_line_line(v1, v2, v3, v4)
+    return (iv[0] + iv[1]) / 2
+
+
+def draw_curved_loop(t, start, radius, angle, segments):
+    '''Draws an arc of radius around start and joins both its ends
+    to start. Leaves every vert selected'''
+    t.set_position(start)
+    t.set_rotation((0, 0, 0))
+    t.arc(radius, angle, segments)
+    t.add_vert()
+    t.pd()
+    t.fd(radius)
+    t.deselect_all()
+    t.set_position(start)
+    t.select_at_turtle()
+    t.rt(angle)
+    t.fd(radius)
+    t.select_all()
+    t.merge(t=0.01)
+
+
+@cached_script
+def draw_openlock_pos_curved_base(length, segments, angle, height):
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    origin = t.location.copy()
+
+    # draw outer loop
+    t.pd()
+    t.fd(length)
+    t.pu()
+    t.home()
+    t.deselect_all()
+    t.select_at_turtle()
+    t.pd()
+    t.rt(angle)
+    t.fd(length)
+    t.home()
+    t.deselect_all()
+    t.arc(length, angle, segments)
+    t.select_all()
+    t.merge(t=0.01)
+
+    # save outer loop verts
+    outer_loop = set(t.selected_verts())
+    t.deselect_all()
+
+    # draw loop 2
+    new_vert_loc = edge_intersection(t, origin, angle, length, outer_w)
+
+    # calculate distance between new vert and origin of outer loop
+    dist = distance_between_two_verts(new_vert_loc, origin)
+
+    # work out length of loop 2 edge
+    length_2 = length - dist - outer_w
+
+    # draw arc, connect up new loop's origin to arc then bridge between two loops
+    draw_curved_loop(t, new_vert_loc, length_2, angle, segments)
+    t.bridge()
+
+    # save loop 2 verts
+    loop_2 = set(v for v in t.bm.verts if v not in outer_loop)
+
+    t.deselect_all()
+
+    # draw loop 3 using same method as loop 2
+    new_vert_2_loc = edge_intersection(t, new_vert_loc, angle, length_2, slot_w)
+    dist = distance_between_two_verts(new_vert_loc, new_vert_2_loc)
+    length_3 = length_2 - dist - slot_w
+    draw_curved_loop(t, new_vert_2_loc, length_3, angle, segments)
+    t.deselect_all()
+
+    inner_loop = [v for v in t.bm.verts if v not in outer_loop and v not in loop_2]
+
+    # add face to inner loop
+    t.select_geom(loop_2)
+    t.select_geom(inner_loop)
+    t.edge_face_add()
+    t.deselect_all()
+
+    # extrude inner loop up
+    t.select_geom(inner_loop)
+    t.pd()
+    t.up(slot_h)
+
+    # save inner loop top verts
+    inner_top_verts = t.selected_verts()
+
+    # delete top face
+    t.delete('ONLY_FACE')
+
+    # select loop 2 and extrude up
+    t.select_geom(loop_2)
+    t.up(slot_h)
+
+    # bridge between loop 2 top and inner loop top
+    t.select_geom(inner_top_verts)
+    t.bridge()
+    t.deselect_all()
+
+    # select outer loop extrude up and add face
+    t.select_geom(outer_loop)
+    t.up(height)
+    t.edge_face_add()
+
+    t.select_all()
+
+    # clean up
+    t.recalc_normals()
+    t.deselect_all()
+    t.pu()
+    t.home()
+    t.select_all()
+    t.triangulate()
+    t.deselect_all()
+
+    return finalise_turtle(t, make_active=True)
+
+
+@cached_script
+def draw_pos_curved_slab(length, segments, angle, height, native_subdivisions):
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    t.pd()
+    t.fd(length, cuts=native_subdivisions[1])
+    side_b_end = t.local_co(t.location)
+
+    t.pu()
+    t.home()
+    t.deselect_all()
+    t.select_at_turtle()
+    t.pd()
+    t.rt(angle)
+    t.fd(length, cuts=native_subdivisions[0])
+    side_c_end = t.local_co(t.location)
+    t.home()
+    t.deselect_all()
+    start_index = len(t.bm.verts)
+    t.arc(length, angle, native_subdivisions[3])
+    t.bm.verts.ensure_lookup_table()
+    side_a = t.bm.verts[start_index:]
+    t.select_all()
+    t.merge(t=0.01)
+    side_a_locs = [v.co.copy() for v in side_a if v.is_valid]
+
+    t.fill_grid(span=native_subdivisions[0])
+    bottom = list(t.bm.verts)
+    t.pd()
+    t.up(height, cuts=native_subdivisions[2])
+    top = t.selected_verts()
+    t.inset(0.001)
+
+    # groups are assigned once the mesh is built as extruding and insetting
+    # copy the weights of the verts they start from
+    verts = list(t.bm.verts)
+    origin = (0, 0, 0)
+    t.assign_vert_group('Side a', verts_over(verts, side_a_locs))
+    t.assign_vert_group('Side b', verts_on_segment(verts, origin, side_b_end))
+    t.assign_vert_group('Side c', verts_on_segment(verts, origin, side_c_end))
+    t.assign_vert_group('Bottom', bottom)
+    t.assign_vert_group('Top', top + t.selected_verts())
+
+    t.select_all()
+    t.recalc_normals()
+    t.pu()
+    t.home()
+    t.deselect_all()
+
+    return finalise_turtle(t, make_active=True)
+
+
+@cached_script
+def draw_neg_curved_slab(length, segments, angle, height, native_subdivisions, return_vert_locs=False):
+    dim = calc_tri(angle, length, length)
+
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    t.pd()
+    t.add_vert()
+    verts = t.bm.verts
+    vert_locs = {}
+
+    def cos_from(start_index):
+        verts.ensure_lookup_table()
+        return [v.co.copy() for v in verts[start_index:]]
+
+    # draw side b
+    t.fd(length, cuts=native_subdivisions[0])
+
+    vert_locs['side_b'] = cos_from(0)
+    t.pu()
+    t.home()
+    t.deselect_all()
+    t.select_at_turtle()
+    t.pd()
+
+    # draw side c
+    t.rt(angle)
+    start_index = len(verts) - 1
+    t.fd(length, cuts=native_subdivisions[0])
+
+    vert_locs['side_c'] = cos_from(start_index)
+    t.deselect_all()
+    t.pu()
+
+    # move to opposite of angle A on mirror triangle
+    t.lt(180 - dim['C'] * 2)
+    t.fd(length)
+    t.lt(180)
+
+    # draw side a
+    start_index = len(verts) - 1
+    t.arc(length, angle, segments)
+    vert_locs['side_a'] = cos_from(start_index)
+
+    t.pu()
+    t.deselect_all()
+    t.home()
+    t.fd(length)
+    t.select_at_turtle()
+    t.merge_at_turtle()
+    t.select_all()
+    t.merge(t=0.01)
+    t.edge_face_add()
+    bottom = list(verts)
+    t.pd()
+    t.up(height)
+    t.inset(0.001)
+
+    # groups are assigned once the mesh is built as extruding and insetting
+    # copy the weights of the verts they start from. The inset leaves the
+    # top face selected without its edge verts
+    t.assign_vert_group('Top')
+    t.assign_vert_group('Bottom', bottom)
+
+    all_verts = list(verts)
+    origin = (0, 0, 0)
+    side_b_end = vert_locs['side_b'][-1]
+    t.assign_vert_group('Side a', verts_over(all_verts, vert_locs['side_a'] + [side_b_end]))
+    t.assign_vert_group('Side b', verts_on_segment(all_verts, origin, side_b_end))
+    t.assign_vert_group('Side c', verts_on_segment(all_verts, origin, vert_locs['side_c'][-1]))
+
+    t.select_all()
+    t.recalc_normals()
+    t.pu()
+    t.home()
+    t.triangulate()
+    t.deselect_all()
+
+    slab = finalise_turtle(t, make_active=True)
+
+    if return_vert_locs is True:
+        return slab, vert_locs
+
+    return slab
@@ -0,0 +1,278 @@
+"""Builds subdivided cuboid cores directly from numpy arrays.
+
+For axis aligned cores we know where every vertex, face, UV and vertex
+group goes, so rather than extruding the core with a turtle, projecting
+its UVs and selecting each side to assign its vertex group, we compute
+it all at once and load it into the mesh with foreach_set.
+"""
+import bpy
+import numpy as np
+
+# (axis the side faces, 0 for the min side or 1 for the max side)
+sides = (
+    (2, 0),  # bottom
+    (2, 1),  # top
+    (1, 0),  # front
+    (1, 1),  # back
+    (0, 0),  # left
+    (0, 1))  # right
+
+
+def draw_rectangular_floor_core(size, native_subdivisions, island_margin=0.01):
+    '''Returns a rectangular floor core of size (x, y, z)'''
+    return draw_grid_core(
+        size,
+        native_subdivisions,
+        rect_floor_vert_groups(size),
+        island_margin)
+
+
+def draw_straight_floor_core(size, native_subdivisions, island_margin=0.01):
+    '''Returns a straight floor core of size (x, y, z)'''
+    return draw_grid_core(
+        size,
+        native_subdivisions,
+        rect_floor_vert_groups(size),
+        island_margin)
+
+
+def draw_straight_wall_core(size, native_subdivisions, island_margin=0.01):
+    '''Returns a straight wall core of size (x, y, z)'''
+    return draw_grid_core(
+        size,
+        native_subdivisions,
+        straight_wall_vert_groups(size),
+        island_margin)
+
+
+def draw_column_core(size, native_subdivisions, island_margin=0.01):
+    '''Returns a connecting column core of size (x, y, z)'''
+    return draw_grid_core(
+        size,
+        native_subdivisions,
+        column_vert_groups(size),
+        island_margin)
+
+
+def rect_floor_vert_groups(size):
+    '''Returns bounds of the vertex groups of a floor core.
+
+    The sides include their edges. Top and Bottom stop 0.001 short of the
+    sides so displacement doesn't pull the edges of the tile out of shape'''
+    x, y, z = size
+    return {
+        'Left': ((0, 0, 0), (0.001, y, z)),
+        'Right': ((x - 0.001, 0, 0), (x, y, z)),
+        'Front': ((0, 0, 0), (x, 0.001, z)),
+        'Back': ((0, y - 0.001, 0), (x, y, z)),
+        'Bottom': ((0.001, 0.001, 0), (x - 0.001, y - 0.001, 0)),
+        'Top': ((0.001, 0.001, z), (x - 0.001, y - 0.001, z))}
+
+
+def straight_wall_vert_groups(size):
+    '''Returns bounds of the vertex groups of a wall core.
+
+    Front and Back stop 0.001 short of the other sides so displacement
+    doesn't pull the edges of the wall out of shape'''
+    x, y, z = size
+    return {
+        'Left': ((-0.01, 0, 0.001), (0.01, y, z - 0.001)),
+        'Right': ((x - 0.01, 0, 0.001), (x + 0.01, y, z - 0.001)),
+        'Front': ((0.001, 0, 0.001), (x - 0.001, 0, z - 0.001)),
+        'Back': ((0.001, y, 0.001), (x - 0.001, y, z - 0.001)),
+        'Bottom': ((0.001, 0, 0), (x - 0.001, y, 0.01)),
+        'Top': ((0.001, 0, z - 0.012), (x - 0.001, y, z))}
+
+
+def column_vert_groups(size):
+    '''Returns bounds of the vertex groups of a column core.
+
+    Sides stop at the 0.001 guards so displacement doesn't pull
+    the top and bottom edges of the column out of shape'''
+    x, y, z = size
+    return {
+        'Top': ((0, 0, z), (x, y, z)),
+        'Bottom': ((0, 0, 0), (x, y, 0)),
+        'Sides': ((0, 0, 0.001), (x, y, z - 0.001))}
+
+
+def axis_coords(length, subdivisions):
+    '''Returns the coordinates of the cuts along an axis of length with
+    subdivisions equal segments between a 0.001 guard segment at each end'''
+    return np.concatenate((
+        (0.0,),
+        np.linspace(0.001, length - 0.001, subdivisions + 1),
+        (length,)))
+
+
+def draw_grid_core(size, native_subdivisions, vert_groups=None, island_margin=0.01):
+    '''Returns a subdivided cuboid of size (x, y, z) at the cursor.
+
+    Keyword arguments:
+    size -- (x, y, z)
+    native_subdivisions -- (x, y, z) subdivisions between the 0.001 guards
+    vert_groups -- dict of vertex group name: (lbound, ubound). Verts
+    within 0.0001 of the bounding box are added to the group
+    island_margin -- margin between UV islands
+    '''
+    coords = [axis_coords(length, max(subdivs, 1))
+              for length, subdivs in zip(size, native_subdivisions)]
+    shape = tuple(len(c) for c in coords)
+
+    # verts are the lattice points on the surface of the box
+    lattice = np.indices(shape)
+    on_surface = np.zeros(shape, dtype=bool)
+    for axis in range(3):
+        on_surface |= (lattice[axis] == 0) | (lattice[axis] == shape[axis] - 1)
+
+    index = np.full(shape, -1, dtype=np.int32)
+    index[on_surface] = np.arange(np.count_nonzero(on_surface), dtype=np.int32)
+
+    ijk = np.argwhere(on_surface)
+    verts = np.column_stack([coords[axis][ijk[:, axis]] for axis in range(3)])
+
+    faces = []
+    uvs = []
+    islands, scale = uv_islands(size, island_margin)
+
+    for (axis, end), offset in zip(sides, islands):
+        grid = np.take(index, 0 if end == 0 else shape[axis] - 1, axis=axis)
+
+        quads = np.stack((
+            grid[:-1, :-1],
+            grid[1:, :-1],
+            grid[1:, 1:],
+            grid[:-1, 1:]), axis=-1).reshape(-1, 4)
+
+        # wind faces so normals point out of the box
+        if (axis == 1) == (end == 1):
+            quads = quads[:, ::-1]
+        faces.append(quads)
+
+        uvs.append(side_uvs(verts[quads.ravel()], axis, end, size, offset, scale))
+
+    faces = np.concatenate(faces)
+    uvs = np.concatenate(uvs)
+
+    mesh = bpy.data.meshes.new('mesh')
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set('co', verts.astype(np.float32).ravel())
+
+    mesh.loops.add(faces.size)
+    mesh.loops.foreach_set('vertex_index', faces.ravel())
+
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set('loop_start', np.arange(0, faces.size, 4, dtype=np.int32))
+    mesh.polygons.foreach_set('loop_total', np.full(len(faces), 4, dtype=np.int32))
+
+    mesh.update(calc_edges=True)
+
+    uv_layer = mesh.uv_layers.new(name='UVMap')
+    uv_layer.data.foreach_set('uv', uvs.astype(np.float32).ravel())
+
+    # so the UVs can be laid out the same way again by unwrap_grid_core
+    mesh['mt_uv_unwrap'] = 'GRID'
+
+    obj = bpy.data.objects.new('turtle_world', mesh)
+    obj.location = bpy.context.scene.cursor.location
+
+    if vert_groups:
+        for name, (lbound, ubound) in vert_groups.items():
+            inside = np.all(
+                (verts >= np.array(lbound) - 0.0001) & (verts <= np.array(ubound) + 0.0001),
+                axis=1)
+            group = obj.vertex_groups.new(name=name)
+            group.add(np.flatnonzero(inside).tolist(), 1.0, 'ADD')
+
+    bpy.context.layer_collection.collection.objects.link(obj)
+    for selected in bpy.context.selected_objects:
+        selected.select_set(False)
+    obj.select_set(True)
+    bpy.context.view_layer.objects.active = obj
+
+    return obj
+
+
+def side_uvs(face_verts, axis, end, size, offset, scale):
+    '''Returns the UVs of the loops of a side of a cuboid.
+
+    The side is projected flat and mirrored so the island
+    is not flipped when seen from outside'''
+    u_axis, v_axis = [a for a in range(3) if a != axis]
+    u = face_verts[:, u_axis]
+    v = face_verts[:, v_axis]
+    if (axis == 1) == (end == 1):
+        u = size[u_axis] - u
+    return np.column_stack((u * scale + offset[0], v * scale + offset[1]))
+
+
+def unwrap_grid_core(obj, island_margin=0.01):
+    '''Lays out the UVs of a core made by draw_grid_core again with a new
+    island_margin.
+
+    Curved cores are bent by a modifier so their mesh is still a cuboid
+    and each face can be put back on its side's island'''
+    mesh = obj.data
+    num_faces = len(mesh.polygons)
+
+    co = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape(-1, 3)
+    co -= co.min(axis=0)
+    size = co.max(axis=0)
+
+    normals = np.empty(num_faces * 3)
+    mesh.polygons.foreach_get('normal', normals)
+    normals = normals.reshape(-1, 3)
+    loop_total = np.empty(num_faces, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_total)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+
+    # the side each face is on from the axis and direction of its normal
+    face_axis = np.abs(normals).argmax(axis=1)
+    face_end = (normals[np.arange(num_faces), face_axis] > 0).astype(np.int32)
+    loop_axis = np.repeat(face_axis, loop_total)
+    loop_end = np.repeat(face_end, loop_total)
+
+    islands, scale = uv_islands(size, island_margin)
+    uvs = np.zeros((len(loop_verts), 2))
+    for (axis, end), offset in zip(sides, islands):
+        on_side = (loop_axis == axis) & (loop_end == end)
+        uvs[on_side] = side_uvs(co[loop_verts[on_side]], axis, end, size, offset, scale)
+
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is None:
+        uv_layer = mesh.uv_layers.new(name='UVMap')
+    uv_layer.data.foreach_set('uv', uvs.astype(np.float32).ravel())
+    mesh.update()
+
+
+def uv_islands(size, island_margin):
+    '''Returns the offset of the UV island of each side of a cuboid and
+    the scale to apply to the islands so they fit in the UV square.
+
+    Islands are packed in three rows, bottom and top, front and back
+    then left and right, in the same order as sides. island_margin is
+    a fraction of the UV square so it is added after scaling'''
+    x, y, z = size
+    row_heights = (y, z, z)
+    row_widths = ((x, x), (x, x), (y, y))
+
+    # leave room for one margin between the islands in a row and two between the rows
+    width = max(sum(widths) for widths in row_widths)
+    height = sum(row_heights)
+    scale = min(
+        max(1 - island_margin, 0.0001) / width,
+        max(1 - 2 * island_margin, 0.0001) / height)
+
+    offsets = []
+    v = 0
+    for row_height, widths in zip(row_heights, row_widths):
+        u = 0
+        for width in widths:
+            offsets.append((u, v))
+            u += width * scale + island_margin
+        v += row_height * scale + island_margin
+
+    return offsets, scale
@@ -0,0 +1,82 @@
+from math import pi, degrees
+from .. bmturtle import create_turtle, finalise_turtle, cursor_matrix
+from .. cache import cached_script
+
+
+@cached_script
+def draw_openlock_curved_base(radius, segments, angle, height, clip_side):
+    base_width = 0.5
+    slot_outer_dist = 0.071
+    slot_side_dist = 0.236
+    slot_w = 0.1811
+    slot_h = 0.2402
+
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+
+    # draw inner radius loop
+    t.pd()
+    t.arc(radius, angle, segments)
+
+    # save inner loop verts
+    inner_loop = set(t.bm.verts)
+
+    t.arc(radius + base_width, angle, segments)
+
+    outer_loop = set(v for v in t.bm.verts if v not in inner_loop)
+
+    t.select_all()
+    t.edge_face_add()
+    t.delete('ONLY_FACE')
+
+    if clip_side == 'INNER':
+        slot_outer_radius = radius + base_width - slot_outer_dist
+        slot_inner_radius = radius + base_width - slot_outer_dist - slot_w
+    else:
+        slot_outer_radius = radius + slot_outer_dist
+        slot_inner_radius = radius + slot_outer_dist + slot_w
+
+    slot_outer_arc_len = (2 * pi * slot_outer_radius) / (360 / angle) - (slot_side_dist * 2)
+    central_angle = degrees(slot_outer_arc_len / slot_outer_radius)
+    t.rt((angle - central_angle) / 2)
+    t.arc(slot_outer_radius, central_angle, segments)
+
+    slot_inner_radius = radius + base_width - slot_outer_dist - slot_w
+    slot_inner_arc_len = (2 * pi * slot_inner_radius) / (360 / angle) - (slot_side_dist * 2)
+    central_angle = degrees(slot_inner_arc_len / slot_inner_radius)
+    t.home()
+    t.rt((angle - central_angle) / 2)
+    t.arc(slot_inner_radius, central_angle, segments)
+
+    slot_loop = [v for v in t.bm.verts if v not in inner_loop and v not in outer_loop]
+
+    t.select_geom(slot_loop)
+    t.edge_face_add()
+    t.delete('ONLY_FACE')
+
+    t.select_geom(slot_loop)
+    t.pd()
+    t.up(slot_h)
+    t.edge_face_add()
+    t.deselect_all()
+
+    t.select_geom(slot_loop)
+    t.select_geom(inner_loop)
+    t.select_geom(outer_loop)
+    t.bridge()
+    t.deselect_all()
+
+    t.select_geom(inner_loop)
+    t.select_geom(outer_loop)
+    t.pd()
+    t.up(height)
+    t.edge_face_add()
+
+    t.select_all()
+    t.triangulate()
+    t.recalc_normals()
+
+    t.pu()
+    t.home()
+    t.deselect_all()
+
+    return finalise_turtle(t, make_active=True)
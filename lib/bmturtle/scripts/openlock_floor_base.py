@@ -0,0 +1,136 @@
+"""Builds OpenLOCK rectangular floor bases directly from the profile constants.
+
+The base is a slab with a channel for the clips cut into its underside.
+The channel runs round the base outer_w in from the edge and is slot_w
+wide and slot_h high. Corner supports, and on large tiles extra supports
+every extra_sup_dist along each side, fill the bottom of the channel up
+to support_h.
+
+Rather than drawing a quarter of the base with a turtle and mirroring it
+we work out where every vertex of the whole base goes and add the faces
+directly, so the time taken barely changes with the size of the tile.
+"""
+from math import floor, sqrt
+import bmesh
+from .. bmturtle import create_turtle, finalise_turtle, cursor_matrix
+from .. cache import cached_script
+
+outer_w = 0.2362                 # outer ring width
+slot_w = 0.1811                # slot width
+slot_h = 0.2402                # slot height
+support_w = 0.11811              # slot support width
+support_h = 0.05472            # slot support height
+extra_sup_dist = 0.8531       # distance between extra supports for large tiles
+
+
+@cached_script
+def draw_openlock_rect_floor_base(dimensions):
+    '''Returns an openlock rectangular floor base'''
+    x, y, z = dimensions
+    half_x = x / 2
+    half_y = y / 2
+
+    # corner supports are 45 degree chamfers support_w long
+    leg = support_w / sqrt(2)
+
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    bm = t.bm
+
+    # half size of the outer (2) and inner (3) edges of the channel
+    outer_2 = (half_x - outer_w, half_y - outer_w)
+    inner_3 = (half_x - outer_w - slot_w, half_y - outer_w - slot_w)
+
+    # each side runs anticlockwise from its start corner. Coordinates
+    # along a side are measured from its midpoint
+    sides = (
+        (lambda t, a: (t, -a[1]), 0, (-half_x, -half_y)),
+        (lambda t, a: (a[0], t), 1, (half_x, -half_y)),
+        (lambda t, a: (-t, a[1]), 0, (half_x, half_y)),
+        (lambda t, a: (-a[0], -t), 1, (-half_x, half_y)))
+
+    # a station is a point where the height of the channel changes. At each
+    # station we add verts on both edges of the channel at the bottom, the
+    # height of the supports and the height of the slot
+    stations = []
+    side_stations = []
+    cell_heights = []
+
+    for to_2d, axis, corner in sides:
+        side_coords = extra_support_coords(dimensions[axis])
+        first = len(stations)
+        for i, coord in enumerate([None] + side_coords + [None]):
+            if coord is None:
+                # ends of the side are the start of the corner chamfers
+                end = -1 if i == 0 else 1
+                points = (
+                    to_2d(end * (outer_2[axis] - leg), outer_2),
+                    to_2d(end * (inner_3[axis] - leg), inner_3))
+            else:
+                points = (to_2d(coord, outer_2), to_2d(coord, inner_3))
+
+            stations.append([
+                [bm.verts.new((co[0], co[1], h)) for h in (0, support_h, slot_h)]
+                for co in points])
+
+            # the channel alternates between slot and support along a
+            # side, starting with slot. The corner after the side is a support
+            if i < len(side_coords) + 1:
+                cell_heights.append(2 if i % 2 == 0 else 1)
+            else:
+                cell_heights.append(1)
+        side_stations.append(stations[first:])
+
+    # channel
+    num_stations = len(stations)
+    for j in range(num_stations):
+        (outer_a, inner_a), (outer_b, inner_b) = stations[j], stations[(j + 1) % num_stations]
+        h = cell_heights[j]
+
+        # walls
+        bm.faces.new([outer_a[0], outer_b[0]] + outer_b[1:h + 1] + outer_a[h:0:-1])
+        bm.faces.new([inner_a[0], inner_b[0]] + inner_b[1:h + 1] + inner_a[h:0:-1])
+
+        # ceiling
+        bm.faces.new((outer_a[h], outer_b[h], inner_b[h], inner_a[h]))
+
+        # step between the tops of the supports and the slot
+        bm.faces.new((outer_a[1], inner_a[1], inner_a[2], outer_a[2]))
+
+    # bottom of the slab outside and inside the channel
+    corners = [bm.verts.new((co[0], co[1], 0)) for to_2d, axis, co in sides]
+    for i, side in enumerate(side_stations):
+        next_side = side_stations[(i + 1) % 4]
+        start, end = corners[i], corners[(i + 1) % 4]
+        bm.faces.new([start, end] + [outer[0] for outer, inner in reversed(side)])
+        bm.faces.new((end, next_side[0][0][0], side[-1][0][0]))
+
+    bm.faces.new([inner[0] for outer, inner in stations])
+
+    # outer walls and top
+    top = [bm.verts.new((co.co[0], co.co[1], z)) for co in corners]
+    for i in range(4):
+        bm.faces.new((corners[i], corners[(i + 1) % 4], top[(i + 1) % 4], top[i]))
+    bm.faces.new(top)
+
+    bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
+    t.reset_frontier()
+
+    return finalise_turtle(t, make_active=True)
+
+
+def extra_support_coords(side_length):
+    '''Returns the coordinates of the start and end of the extra supports
+    along a side, measured from its midpoint'''
+    # sides of 100.6mm (just under 4") or more get extra supports
+    # between the outer and inner ring
+    if side_length >= 3.99:
+        num_supports = 1 + floor((side_length - 3.99) / 2)
+    else:
+        num_supports = 0
+
+    coords = []
+    for i in range(num_supports):
+        start = extra_sup_dist / 2 + i * (extra_sup_dist + support_w)
+        coords.extend((start, start + support_w))
+
+    return [-c for c in reversed(coords)] + coords
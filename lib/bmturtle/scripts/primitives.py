@@ -0,0 +1,89 @@
+from math import sqrt, cos, radians, acos, degrees
+from .. bmturtle import create_turtle, finalise_turtle, cursor_matrix
+from .. cache import cached_script
+
+
+@cached_script
+def draw_cuboid(size):
+    """Returns a cuboid. size = (x, y, z)"""
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    t.pd()
+    t.add_vert()
+    t.begin_path()
+    t.ri(size[0])
+    t.fd(size[1])
+    t.lf(size[0])
+    t.fill_path()
+    t.select_all()
+    t.up(size[2])
+    t.select_all()
+    t.recalc_normals()
+    t.pu()
+    t.home()
+
+    return finalise_turtle(t, make_active=True)
+
+
+def draw_triangle(t, b, c, A):
+    '''draws a triangle into turtle t given the length of two sides (b, c)
+    and the angle between them (A) and returns its dimensions'''
+    a = sqrt((b**2 + c**2) - ((2 * b * c) * cos(radians(A))))
+    B = degrees(acos((c**2 + a**2 - (b**2)) / (2 * c * a)))
+    C = 180 - A - B
+
+    loc_A = t.location.copy()
+    t.begin_path()
+    t.fd(b)
+    loc_B = t.location.copy()
+    t.rt(180 - C)
+    t.fd(a)
+    loc_C = t.location.copy()
+    t.rt(180 - B)
+    t.fd(c)
+    t.select_path()
+    t.merge()
+    t.pu()
+    dimensions = {
+        'a': a,  # sides
+        'b': b,
+        'c': c,
+        'A': A,  # angles
+        'B': B,
+        'C': C,
+        'loc_A': loc_A,  # corner coords
+        'loc_B': loc_B,
+        'loc_C': loc_C}
+
+    return dimensions
+
+
+def draw_tri_prism(t, b, c, A, height):
+    '''draws a triangular prism into turtle t given the length of two sides
+    of triangle (b, c), the angle between them (A) and the height and
+    returns its dimensions'''
+    dimensions = draw_triangle(t, b, c, A)
+
+    t.select_all()
+    t.edge_face_add()
+    t.pd()
+    t.up(height)
+    t.select_all()
+    t.recalc_normals()
+    dimensions['height'] = height
+    return dimensions
+
+
+@cached_script
+def draw_curved_slab(radius, A, height, width, segments):
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    t.pd()
+    t.arc(radius, A, segments)
+    t.arc(radius + width, A, segments)
+    t.select_all()
+    t.bridge()
+    t.select_all()
+    t.pd()
+    t.up(height)
+    t.select_all()
+    t.recalc_normals()
+    return finalise_turtle(t, make_active=True)
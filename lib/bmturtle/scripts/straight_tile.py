@@ -0,0 +1,34 @@
+from .. bmturtle import create_turtle, finalise_turtle, cursor_matrix
+from .. cache import cached_script
+
+
+def draw_rectangular_floor_core(size, native_subdivisions):
+    return draw_subdivided_cuboid(size, native_subdivisions)
+
+
+def draw_straight_floor_core(size, native_subdivisions):
+    return draw_subdivided_cuboid(size, native_subdivisions)
+
+
+def draw_straight_wall_core(size, native_subdivisions):
+    return draw_subdivided_cuboid(size, native_subdivisions)
+
+
+@cached_script
+def draw_subdivided_cuboid(size, native_subdivisions):
+    '''Returns a cuboid of size (x, y, z) subdivided by native_subdivisions
+    with an extra 0.001 loop at each edge'''
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    t.pd()
+    t.ri(size[0], cuts=native_subdivisions[0], guards=(0.001, 0.001))
+    t.select_all()
+    t.fd(size[1], cuts=native_subdivisions[1], guards=(0.001, 0.001))
+    t.select_all()
+    t.up(size[2], cuts=native_subdivisions[2], guards=(0.001, 0.001))
+
+    t.select_all()
+    t.recalc_normals()
+    t.pu()
+    t.home()
+
+    return finalise_turtle(t, make_active=True)
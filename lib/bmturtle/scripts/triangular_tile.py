@@ -0,0 +1,208 @@
+from math import sqrt, cos, radians, acos, degrees
+from .. bmturtle import create_turtle, finalise_turtle, cursor_matrix, verts_on_segment
+from .. cache import cached_script
+from . primitives import draw_tri_prism, draw_triangle
+
+outer_w = 0.2362                 # outer ring width
+slot_w = 0.1811                # slot width
+slot_h = 0.2402                # slot height
+support_w = 0.11811              # slot support width
+support_h = 0.05472            # slot support height
+
+
+def draw_plain_triangular_base(tile_props):
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    t.add_vert()
+    t.pd()
+    dimensions = draw_tri_prism(
+        t,
+        tile_props.leg_1_len,
+        tile_props.leg_2_len,
+        tile_props.angle,
+        tile_props.base_size[2])
+    t.pu()
+    t.home()
+
+    return finalise_turtle(t, make_active=True), dimensions
+
+
+@cached_script(world_vectors=True)
+def draw_openlock_tri_floor_base(x_leg, y_leg, height, angle_1):
+    '''Returns an openlock triangular floor base'''
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+    t.pd()
+    t.add_vert()
+    dimensions = draw_base(t, x_leg, y_leg, height, angle_1)
+
+    return finalise_turtle(t, make_active=True), dimensions
+
+
+def nearest(verts, co, count=1):
+    '''Returns the count verts in verts closest to co in x and y'''
+    return sorted(verts, key=lambda v: (v.co.xy - co.xy).length)[:count]
+
+
+def draw_base(t, b, c, height, A):
+    '''Draws an openlock triangular base into turtle t.
+
+    The turtle.scripts version selects verts by hard coded index. Here
+    we find them by their position relative to the corners instead
+    '''
+    # loops are numbered from outer to inner
+
+    # draw loop 1 (outer) and save dimensions
+    dimensions = draw_triangle(t, b, c, A)
+    loop_1 = list(t.bm.verts)
+    corners = [v.co.copy() for v in loop_1]
+
+    # fill face
+    t.select_all()
+    t.edge_face_add()
+
+    # inset to get loop 2
+    t.inset(outer_w)
+
+    # inset to get loop 3 and select inset
+    t.inset(slot_w, use_select_inset=True)
+    # delete face
+    t.delete('FACE')
+    t.deselect_all()
+
+    inner_face = [f for f in t.bm.faces if not set(f.verts) & set(loop_1)][0]
+    loop_3 = list(inner_face.verts)
+    loop_2 = [v for v in t.bm.verts if v not in loop_1 and v not in loop_3]
+
+    # bevel loop 2
+    t.select_geom(loop_2)
+    outer_bev = [v for v in t.bevel_verts(support_w)['verts'] if v.is_valid]
+    t.deselect_all()
+
+    # bevel loop 3
+    t.select_geom(loop_3)
+    inner_bev = [v for v in t.bevel_verts(support_w)['verts'] if v.is_valid]
+    t.deselect_all()
+
+    # the two verts each corner was bevelled into
+    outer_bevels = [nearest(outer_bev, co, 2) for co in corners]
+    inner_bevels = [nearest(inner_bev, co, 2) for co in corners]
+
+    # fill corner supports
+    for outer, inner in zip(outer_bevels, inner_bevels):
+        t.select_geom(outer + inner)
+        t.edge_face_add()
+        t.deselect_all()
+
+    # extrude up inner slots. Each slot runs between two corners
+    slot_bottoms = []
+    for i in range(3):
+        j = (i + 1) % 3
+        slot = nearest(outer_bevels[i], corners[j]) + \
+            nearest(outer_bevels[j], corners[i]) + \
+            nearest(inner_bevels[i], corners[j]) + \
+            nearest(inner_bevels[j], corners[i])
+        slot_bottoms.extend(slot)
+
+    slot_tops = []
+    for i in range(3):
+        t.select_geom(slot_bottoms[i * 4:i * 4 + 4])
+        t.pd()
+        t.up(support_h)
+        slot_tops.extend(t.selected_verts())
+        t.deselect_all()
+
+    # support roofs sit above the corner supports
+    for outer, inner in zip(outer_bevels, inner_bevels):
+        support = [nearest(slot_tops, v.co)[0] for v in outer + inner]
+        t.select_geom(support)
+        t.edge_face_add()
+        t.deselect_all()
+
+    outer_tops = [nearest(slot_tops, v.co)[0] for pair in outer_bevels for v in pair]
+    inner_tops = [nearest(slot_tops, v.co)[0] for pair in inner_bevels for v in pair]
+
+    slot_top = []
+    for side in (outer_tops, inner_tops):
+        t.select_geom(side)
+        t.up(slot_h - support_h)
+        slot_top.extend(t.selected_verts())
+        t.deselect_all()
+
+    t.select_geom(slot_top)
+    t.bridge()
+    t.deselect_all()
+
+    t.select_geom(loop_1)
+    t.up(height)
+    t.edge_face_add()
+
+    t.select_all()
+    t.recalc_normals()
+
+    t.pu()
+    t.home()
+
+    return dimensions
+
+
+@cached_script(world_vectors=True)
+def draw_tri_floor_core(b, c, A, height, native_subdivisions=(15, 2)):
+    '''draws a triangle given the length of two sides (b, c) and the angle between them (A).
+    native_subdivisions contains subdivs for edges and z axis'''
+    a = sqrt((b**2 + c**2) - ((2 * b * c) * cos(radians(A))))
+    B = degrees(acos((c**2 + a**2 - (b**2)) / (2 * c * a)))
+    C = 180 - A - B
+
+    t = create_turtle('turtle_world', matrix=cursor_matrix())
+
+    t.pd()
+    t.add_vert()
+
+    loc_A = t.location.copy()
+    t.begin_path()
+    t.fd(b)
+    loc_B = t.location.copy()
+    t.rt(180 - C)
+    t.fd(a)
+    loc_C = t.location.copy()
+    t.rt(180 - B)
+    t.fd(c)
+
+    t.select_all()
+    t.merge()
+    t.edge_face_add()
+    t.subdivide(native_subdivisions[0])
+    bottom = list(t.bm.verts)
+
+    t.up(height, cuts=native_subdivisions[1])
+    t.inset(0.001)
+
+    # groups are assigned once the mesh is built as extruding and insetting
+    # copy the weights of the verts they start from. The inset leaves the
+    # top face selected without its edge verts
+    t.assign_vert_group('Top')
+    t.assign_vert_group('Bottom', bottom)
+
+    # the sides run between the corners from the bottom to the top
+    verts = list(t.bm.verts)
+    corners = [t.local_co(loc) for loc in (loc_A, loc_B, loc_C)]
+    t.assign_vert_group('Side a', verts_on_segment(verts, corners[1], corners[2]))
+    t.assign_vert_group('Side b', verts_on_segment(verts, corners[0], corners[2]))
+    t.assign_vert_group('Side c', verts_on_segment(verts, corners[0], corners[1]))
+
+    t.select_all()
+    t.recalc_normals()
+    t.pu()
+    t.home()
+
+    dimensions = {
+        'a': a,  # sides
+        'b': b,
+        'c': c,
+        'A': A,  # angles
+        'B': B,
+        'C': C,
+        'loc_A': loc_A,  # corner coords
+        'loc_B': loc_B,
+        'loc_C': loc_C}
+
+    return finalise_turtle(t, make_active=True), dimensions
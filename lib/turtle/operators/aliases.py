@@ -241,9 +241,15 @@ class TURTLE_OT_quadratic_curve_alias(bpy.types.Operator):
 
     cp: FloatVectorProperty()
     ep: FloatVectorProperty()
+    resolution: IntProperty(default=12, min=0)
+    tolerance: FloatProperty(default=0.001, min=0.00001)
 
     def execute(self, context):
-        bpy.ops.turtle.quadratic_curve(cp=self.cp, ep=self.ep)
+        bpy.ops.turtle.quadratic_curve(
+            cp=self.cp,
+            ep=self.ep,
+            resolution=self.resolution,
+            tolerance=self.tolerance)
         return {'FINISHED'}
 
 
@@ -256,9 +262,16 @@ Keyword Arguments: cp1 / cp2 = coordinates of control points, ep = end point"
     cp1: FloatVectorProperty()
     cp2: FloatVectorProperty()
     ep: FloatVectorProperty()
+    resolution: IntProperty(default=12, min=0)
+    tolerance: FloatProperty(default=0.001, min=0.00001)
 
     def execute(self, context):
-        bpy.ops.turtle.cubic_curve(cp1=self.cp1, cp2=self.cp2, ep=self.ep)
+        bpy.ops.turtle.cubic_curve(
+            cp1=self.cp1,
+            cp2=self.cp2,
+            ep=self.ep,
+            resolution=self.resolution,
+            tolerance=self.tolerance)
         return {'FINISHED'}
 
 
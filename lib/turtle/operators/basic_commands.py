@@ -4,6 +4,7 @@ from bpy.props import StringProperty, FloatProperty, FloatVectorProperty, IntPro
 import bmesh
 from mathutils import Vector
 from ...utils.selection import select_by_loc, select, activate, deselect_all
+from ...utils.utils import editmode_toggle
 from bpy.types import Operator
 from bpy_extras.object_utils import AddObjectHelper
 
@@ -145,8 +146,8 @@ class TURTLE_OT_clean(bpy.types.Operator):
         if bpy.context.object['pendownp']:
             bpy.ops.turtle.add_vert()
 
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         return {'FINISHED'}
 
@@ -164,8 +165,8 @@ class TURTLE_OT_pen_down(bpy.types.Operator):
     def execute(self, context):
         bpy.context.object['pendownp'] = True
 
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         return {'FINISHED'}
 
@@ -182,8 +183,8 @@ class TURTLE_OT_pen_up(bpy.types.Operator):
     def execute(self, context):
         bpy.context.object['pendownp'] = False
 
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         return {'FINISHED'}
 
@@ -203,8 +204,8 @@ class TURTLE_OT_forward(bpy.types.Operator):
 
     def execute(self, context):
         # make sure selection is properly updated
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         """ check our object has a "pendownp" property that
          describes the pen state and if not add one"""
@@ -250,8 +251,8 @@ class TURTLE_OT_backward(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         if bpy.context.object.get('pendownp') is None:
             # pen state
@@ -290,8 +291,8 @@ class TURTLE_OT_up(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         if bpy.context.object.get('pendownp') is None:
             # pen state
@@ -330,8 +331,8 @@ class TURTLE_OT_down(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         if bpy.context.object.get('pendownp') is None:
             # pen state
@@ -371,8 +372,8 @@ class TURTLE_OT_left(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         if bpy.context.object.get('pendownp') is None:
             # pen state
@@ -410,8 +411,8 @@ class TURTLE_OT_right(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         if bpy.context.object.get('pendownp') is None:
             # pen state
@@ -452,8 +453,8 @@ class TURTLE_OT_arc(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         circumference = 2 * pi * self.r
         segment_length = circumference / ((360 / self.d) * self.s)
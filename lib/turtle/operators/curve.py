@@ -1,18 +1,23 @@
+from math import ceil, sqrt
 import bpy
-from bpy.props import FloatVectorProperty
+import bmesh
+from bpy.props import FloatVectorProperty, IntProperty, FloatProperty
 from bpy.types import Operator
 from mathutils import Vector
-from ...utils.selection import select_by_loc
+from . path import deselect_bmesh
 
 
 class TURTLE_OT_quadratic_curve(bpy.types.Operator):
     bl_idname = "turtle.quadratic_curve"
     bl_label = "Quadratic curve"
     bl_description = "moves the turtle on a path described by a quadratic Bezier curve. \
- Keyword Arguments: cp = coordinates of control point, ep = end point"
+ Keyword Arguments: cp = coordinates of control point, ep = end point, \
+ resolution = segments in curve, 0 for adaptive, tolerance = max distance from curve if adaptive"
 
     cp: FloatVectorProperty()
     ep: FloatVectorProperty()
+    resolution: IntProperty(default=12, min=0)
+    tolerance: FloatProperty(default=0.001, min=0.00001)
 
     @classmethod
     def poll(cls, context):
@@ -26,21 +31,13 @@ class TURTLE_OT_quadratic_curve(bpy.types.Operator):
             bpy.context.object['pendownp'] = True
 
         if bpy.context.object['pendownp']:
-            world = bpy.context.object
-            world_name = world.name
-            bpy.ops.curve.primitive_bezier_curve_add(
-                radius=1,
-                enter_editmode=True)
-
-            bpy.ops.curve.select_all(action='DESELECT')
-
-            # set location of first spline point and control point
-            bpy.context.active_object.data.splines[0].bezier_points[0].co = (0, 0, 0)
-            bpy.context.active_object.data.splines[0].bezier_points[0].handle_right = self.cp
-
-            # set location of second control point.
-            bpy.context.active_object.data.splines[0].bezier_points[1].co = self.ep
-            bpy.context.active_object.data.splines[0].bezier_points[1].handle_right = self.ep
+            points = quadratic_bezier_points(
+                Vector((0, 0, 0)),
+                Vector(self.cp),
+                Vector(self.ep),
+                self.resolution,
+                self.tolerance)
+            draw_curve(context.object, turtle.location, points)
 
             # set turtle location
             turtle.location = turtle.location + Vector(self.ep)
@@ -51,31 +48,6 @@ class TURTLE_OT_quadratic_curve(bpy.types.Operator):
             turtle.rotation_mode = 'QUATERNION'
             turtle.rotation_quaternion = rot_quat
             turtle.rotation_mode = 'XYZ'
-
-            bpy.ops.object.editmode_toggle()
-
-            # convert curve to mesh and join to turtle_world object
-            bpy.ops.object.convert(target='MESH')
-            bpy.data.objects[world.name].select_set(True)
-            bpy.ops.object.join()
-            bpy.context.object.name = world_name
-
-            # merge vertices
-            bpy.ops.object.editmode_toggle()
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.remove_doubles()
-
-            bpy.ops.mesh.select_all(action='DESELECT')
-
-            # select last vert of converted curve
-            lbound = turtle.location
-            ubound = turtle.location
-            select_by_loc(
-                lbound,
-                ubound,
-                select_mode='VERT',
-                coords='GLOBAL',
-                buffer=0.001)
         else:
             # set turtle location without drawing anything
             turtle.location = self.ep
@@ -94,11 +66,14 @@ class TURTLE_OT_cubic_curve(bpy.types.Operator):
     bl_idname = "turtle.cubic_curve"
     bl_label = "Cubic curve"
     bl_description = "moves the turtle on a path described by a cubic Bezier curve.\
-Keyword Arguments: cp1 / cp2 = coordinates of control points, ep = end point"
+Keyword Arguments: cp1 / cp2 = coordinates of control points, ep = end point, \
+resolution = segments in curve, 0 for adaptive, tolerance = max distance from curve if adaptive"
 
     cp1: FloatVectorProperty()
     cp2: FloatVectorProperty()
     ep: FloatVectorProperty()
+    resolution: IntProperty(default=12, min=0)
+    tolerance: FloatProperty(default=0.001, min=0.00001)
 
     @classmethod
     def poll(cls, context):
@@ -113,26 +88,14 @@ Keyword Arguments: cp1 / cp2 = coordinates of control points, ep = end point"
             bpy.context.object['pendownp'] = True
 
         if bpy.context.object['pendownp']:
-            canvas = bpy.context.object
-            canvas_name = canvas.name
-            bpy.ops.curve.primitive_bezier_curve_add(
-                radius=1,
-                enter_editmode=True)
-            bpy.ops.curve.select_all(action='DESELECT')
-            p0 = bpy.context.active_object.data.splines[0].bezier_points[0]
-            p1 = bpy.context.active_object.data.splines[0].bezier_points[1]
-
-            # set location of first spline point and control point
-            p0.co = (0, 0, 0)
-            bpy.ops.curve.select_all(action='DESELECT')
-            p0.select_right_handle = True
-            p0.handle_right = self.cp1
-
-            # set location of second spline point and control point
-            p1.co = self.ep
-            bpy.ops.curve.select_all(action='DESELECT')
-            p1.select_left_handle = True
-            p1.handle_left = self.cp2
+            points = cubic_bezier_points(
+                Vector((0, 0, 0)),
+                Vector(self.cp1),
+                Vector(self.cp2),
+                Vector(self.ep),
+                self.resolution,
+                self.tolerance)
+            draw_curve(context.object, turtle.location, points)
 
             # set turtle location
             turtle.location = turtle.location + Vector(self.ep)
@@ -143,31 +106,6 @@ Keyword Arguments: cp1 / cp2 = coordinates of control points, ep = end point"
             turtle.rotation_mode = 'QUATERNION'
             turtle.rotation_quaternion = rot_quat
             turtle.rotation_mode = 'XYZ'
-
-            bpy.ops.object.editmode_toggle()
-
-            # convert curve to mesh and join to canvas
-            bpy.ops.object.convert(target='MESH')
-            bpy.data.objects[canvas.name].select_set(True)
-            bpy.ops.object.join()
-            bpy.context.object.name = canvas_name
-
-            # merge vertices
-            bpy.ops.object.editmode_toggle()
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.remove_doubles()
-
-            bpy.ops.mesh.select_all(action='DESELECT')
-
-            # select last vert of converted curve
-            lbound = turtle.location
-            ubound = turtle.location
-            select_by_loc(
-                lbound,
-                ubound,
-                select_mode='VERT',
-                coords='GLOBAL',
-                buffer=0.001)
         else:
             # set turtle location without drawing anything
             turtle.location = self.ep
@@ -180,3 +118,95 @@ Keyword Arguments: cp1 / cp2 = coordinates of control points, ep = end point"
             turtle.rotation_mode = 'XYZ'
 
         return {'FINISHED'}
+
+
+def quadratic_bezier_points(p0, p1, p2, resolution=12, tolerance=0.001):
+    """Returns points along a quadratic Bezier curve from p0 to p2.
+
+    If resolution is 0 we use just enough segments to keep within
+    tolerance of the curve"""
+    if resolution == 0:
+        # max distance of a segment from the curve is |B''| / 8n^2
+        # and |B''| = 2|p0 - 2p1 + p2| everywhere on the curve
+        resolution = adaptive_resolution((p0 - 2 * p1 + p2).length / 4, tolerance)
+
+    points = []
+    for i in range(resolution + 1):
+        t = i / resolution
+        u = 1 - t
+        points.append(u * u * p0 + 2 * u * t * p1 + t * t * p2)
+    return points
+
+
+def cubic_bezier_points(p0, p1, p2, p3, resolution=12, tolerance=0.001):
+    """Returns points along a cubic Bezier curve from p0 to p3.
+
+    If resolution is 0 we use just enough segments to keep within
+    tolerance of the curve"""
+    if resolution == 0:
+        # |B''| is at most 6 times the largest second difference
+        # of the control points
+        second_diff = max(
+            (p0 - 2 * p1 + p2).length,
+            (p1 - 2 * p2 + p3).length)
+        resolution = adaptive_resolution(second_diff * 3 / 4, tolerance)
+
+    points = []
+    for i in range(resolution + 1):
+        t = i / resolution
+        u = 1 - t
+        points.append(
+            u * u * u * p0
+            + 3 * u * u * t * p1
+            + 3 * u * t * t * p2
+            + t * t * t * p3)
+    return points
+
+
+def adaptive_resolution(deviation, tolerance):
+    """Returns the number of segments n so deviation / n^2 <= tolerance"""
+    return max(1, ceil(sqrt(deviation / tolerance)))
+
+
+def draw_curve(obj, start, points, merge_dist=0.001):
+    """Draws a chain of edges through points into obj's edit mesh.
+
+    points are relative to start, in world axes. The first point is
+    joined to the frontier vert at start if there is one, and the last
+    vert becomes the new frontier and the only selected vert.
+    """
+    mesh = obj.data
+    bm = bmesh.from_edit_mesh(mesh)
+    world_to_local = obj.matrix_world.inverted()
+
+    prev = frontier_vert(bm, world_to_local @ start, merge_dist)
+    if prev is None:
+        prev = bm.verts.new(world_to_local @ start)
+
+    for point in points[1:]:
+        vert = bm.verts.new(world_to_local @ (start + point))
+        bm.edges.new((prev, vert))
+        prev = vert
+
+    # only the end vert is left selected, as the other turtle commands do
+    deselect_bmesh(bm)
+    bm.select_history.clear()
+    prev.select_set(True)
+    bm.select_history.add(prev)
+    bmesh.update_edit_mesh(mesh)
+
+
+def frontier_vert(bm, co, merge_dist=0.001):
+    """Returns the vert at co the turtle last left selected.
+
+    We check the selection history first so consecutive curves don't
+    need to look through the whole mesh"""
+    for elem in reversed(bm.select_history):
+        if isinstance(elem, bmesh.types.BMVert) and elem.is_valid and elem.select:
+            if (elem.co - co).length <= merge_dist:
+                return elem
+
+    for vert in bm.verts:
+        if vert.select and (vert.co - co).length <= merge_dist:
+            return vert
+    return None
@@ -1,6 +1,7 @@
 import bpy
 import bmesh
 from bpy.props import FloatProperty
+from ...utils.utils import editmode_toggle
 
 
 class TURTLE_OT_merge(bpy.types.Operator):
@@ -15,8 +16,8 @@ class TURTLE_OT_merge(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         bpy.ops.mesh.remove_doubles(threshold=self.t)
 
@@ -33,8 +34,8 @@ class TURTLE_OT_bridge(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         bpy.ops.mesh.bridge_edge_loops()
         return {'FINISHED'}
@@ -56,7 +57,7 @@ class TURTLE_OT_add_vert(bpy.types.Operator):
 
         from bpy_extras import object_utils
         object_utils.object_data_add(context, mesh, operator=None)
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         return {'FINISHED'}
@@ -1,4 +1,6 @@
 import bpy
+import bmesh
+from ...utils.selection import select_verts
 
 
 class TURTLE_OT_begin_path(bpy.types.Operator):
@@ -11,11 +13,8 @@ class TURTLE_OT_begin_path(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
-
-        verts = bpy.context.object.data.vertices
-        bpy.context.object['beginpath_active_vert'] = verts.values()[-1].index
+        bm = bmesh.from_edit_mesh(context.object.data)
+        context.object['beginpath_active_vert'] = len(bm.verts) - 1
 
         return {'FINISHED'}
 
@@ -30,26 +29,19 @@ class TURTLE_OT_stroke_path(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        if bpy.context.object.get('beginpath_active_vert') is None:
+        if context.object.get('beginpath_active_vert') is None:
             return {'PASS_THROUGH'}
 
-        bpy.ops.object.editmode_toggle()
-
-        verts = bpy.context.object.data.vertices
-
-        bpy.context.object.data.vertices[-1].select = True
-        bpy.context.object.data.vertices[bpy.context.object['beginpath_active_vert']].select = True
-
-        bpy.ops.object.editmode_toggle()
-
-        bpy.ops.mesh.edge_face_add()
-        bpy.ops.mesh.select_all(action='DESELECT')
+        mesh = context.object.data
+        bm = bmesh.from_edit_mesh(mesh)
+        verts = path_verts(bm, context.object['beginpath_active_vert'])
 
-        bpy.ops.object.editmode_toggle()
+        if len(verts) > 1 and bm.edges.get((verts[0], verts[-1])) is None:
+            bm.edges.new((verts[0], verts[-1]))
 
-        bpy.context.object.data.vertices[-1].select = True
-
-        bpy.ops.object.editmode_toggle()
+        deselect_bmesh(bm)
+        verts[-1].select = True
+        bmesh.update_edit_mesh(mesh)
 
         return {'FINISHED'}
 
@@ -64,30 +56,38 @@ class TURTLE_OT_fill_path(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-
-        if bpy.context.object.get('beginpath_active_vert') is None:
+        if context.object.get('beginpath_active_vert') is None:
             return {'PASS_THROUGH'}
 
-        bpy.ops.object.editmode_toggle()
-
-        verts = bpy.context.object.data.vertices
+        mesh = context.object.data
+        bm = bmesh.from_edit_mesh(mesh)
+        verts = path_verts(bm, context.object['beginpath_active_vert'])
 
-        i = bpy.context.object['beginpath_active_vert']
+        # like calling mesh.edge_face_add twice, first closes the path then fills it
+        geom = select_verts(verts)
+        ret = bmesh.ops.contextual_create(bm, geom=geom)
+        if not ret['faces']:
+            bmesh.ops.contextual_create(bm, geom=geom + ret['edges'])
 
-        while i <= verts.values()[-1].index:
-            bpy.context.object.data.vertices[i].select = True
-            i += 1
+        deselect_bmesh(bm)
+        verts[-1].select = True
+        bmesh.update_edit_mesh(mesh)
 
-        bpy.ops.object.editmode_toggle()
+        return {'FINISHED'}
 
-        bpy.ops.mesh.edge_face_add()
-        bpy.ops.mesh.edge_face_add()
 
-        bpy.ops.mesh.select_all(action='DESELECT')
+def path_verts(bm, start_index):
+    """Returns the verts drawn since begin_path.
 
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+    Verts are drawn in index order so a path is the range of indices from
+    the begin_path vert to the last vert and we don't need to search the mesh
+    """
+    bm.verts.ensure_lookup_table()
+    return bm.verts[start_index:]
 
-        bpy.context.object.data.vertices[-1].select = True
 
-        return {'FINISHED'}
+def deselect_bmesh(bm):
+    """Deselects all verts, edges and faces of bm"""
+    for elems in (bm.verts, bm.edges, bm.faces):
+        for elem in elems:
+            elem.select = False
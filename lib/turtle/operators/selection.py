@@ -2,7 +2,9 @@ import bpy
 from bpy.props import StringProperty, FloatProperty, FloatVectorProperty, IntProperty, EnumProperty, BoolProperty
 import bmesh
 from mathutils import Vector
-from ...utils.selection import select_by_loc, select, activate
+from ...utils.selection import select_by_loc, select, activate, select_verts
+from .path import path_verts
+from ...utils.utils import editmode_toggle
 from bpy.types import Operator
 
 
@@ -16,16 +18,10 @@ class TURTLE_OT_select_path(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-
-        verts = bpy.context.object.data.vertices
-
-        i = bpy.context.object['beginpath_active_vert']
-        while i <= verts.values()[-1].index:
-            bpy.context.object.data.vertices[i].select = True
-            i += 1
-
-        bpy.ops.object.editmode_toggle()
+        mesh = context.object.data
+        bm = bmesh.from_edit_mesh(mesh)
+        select_verts(path_verts(bm, context.object['beginpath_active_vert']))
+        bmesh.update_edit_mesh(mesh)
 
         return {'FINISHED'}
 
@@ -42,8 +38,8 @@ class TURTLE_OT_select_all(bpy.types.Operator):
     def execute(self, context):
         bpy.ops.mesh.select_all(action='SELECT')
 
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         return {'FINISHED'}
 
@@ -65,8 +61,8 @@ class TURTLE_OT_select_by_location(bpy.types.Operator):
 
     def execute(self, context):
         select_by_loc(lbound=self.lbound, ubound=self.ubound, select_mode=self.select_mode, buffer=self.buffer, additive=self.additive)
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
         return {'FINISHED'}
 
 
@@ -87,8 +83,8 @@ class TURTLE_OT_select_at_cursor(bpy.types.Operator):
         turtle = bpy.context.scene.cursor
 
         select_by_loc(lbound=turtle.location, ubound=turtle.location, select_mode=self.select_mode, buffer=self.buffer, additive=self.additive)
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
         return {'FINISHED'}
 
 
@@ -103,6 +99,6 @@ class TURTLE_OT_deselect_all(bpy.types.Operator):
 
     def execute(self, context):
         bpy.ops.mesh.select_all(action='DESELECT')
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
         return {'FINISHED'}
@@ -1,5 +1,6 @@
 import bpy
 from bpy.props import StringProperty
+from ...utils.utils import editmode_toggle
 
 
 class TURTLE_OT_new_vert_group(bpy.types.Operator):
@@ -31,8 +32,8 @@ class TURTLE_OT_select_vert_group(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         bpy.ops.object.vertex_group_set_active(group=self.vg)
         bpy.ops.object.vertex_group_select()
@@ -52,8 +53,8 @@ class TURTLE_OT_deselect_vert_group(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         bpy.ops.object.vertex_group_set_active(group=self.vg)
         bpy.ops.object.vertex_group_deselect()
@@ -73,8 +74,8 @@ class TURTLE_OT_add_to_vert_group(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         bpy.ops.object.vertex_group_set_active(group=self.vg)
         bpy.ops.object.vertex_group_assign()
@@ -94,8 +95,8 @@ class TURTLE_OT_remove_from_vert_group(bpy.types.Operator):
         return context.object.mode == 'EDIT'
 
     def execute(self, context):
-        bpy.ops.object.editmode_toggle()
-        bpy.ops.object.editmode_toggle()
+        editmode_toggle()
+        editmode_toggle()
 
         bpy.ops.object.vertex_group_set_active(group=self.vg)
         bpy.ops.object.vertex_group_remove_from()
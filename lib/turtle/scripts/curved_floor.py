@@ -1,6 +1,6 @@
 from math import sqrt, radians, degrees, cos, acos
 import bpy
-from ...utils.utils import mode
+from ...utils.utils import mode, editmode_toggle
 from ...utils.selection import deselect_all
 
 outer_w = 0.2362                 # outer ring width
@@ -44,14 +44,14 @@ def draw_openlock_pos_curved_base(length, segments, angle, height):
     t.select_all()
     t.merge(t=0.01)
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     # save outer loop vert indices
     outer_loop = []
     for vert in bpy.context.object.data.vertices:
         if vert.select is True:
             outer_loop.append(vert.index)
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
     t.deselect_all()
     t.pu()
 
@@ -81,8 +81,8 @@ def draw_openlock_pos_curved_base(length, segments, angle, height):
 
     # add vert at projected intersection of last two edges
     bpy.ops.maketile.vertintersect()
-    bpy.ops.object.editmode_toggle()
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
+    editmode_toggle()
 
     # save vert location
     new_vert_loc = bpy.context.object.data.vertices[len(bpy.context.object.data.vertices) - 1].co.copy()
@@ -150,8 +150,8 @@ def draw_openlock_pos_curved_base(length, segments, angle, height):
     t.fd(d=0.01)
     t.select_path()
     bpy.ops.maketile.vertintersect()
-    bpy.ops.object.editmode_toggle()
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
+    editmode_toggle()
     new_vert_2_loc = bpy.context.object.data.vertices[len(bpy.context.object.data.vertices) - 1].co.copy()
     bpy.ops.mesh.delete(type='VERT')
     t.set_position(v=new_vert_2_loc)
@@ -170,32 +170,32 @@ def draw_openlock_pos_curved_base(length, segments, angle, height):
     t.select_all()
     t.merge(t=0.01)
     t.deselect_all()
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     for vert in bpy.context.object.data.vertices:
         if vert.index not in outer_loop:
             vert.select = True
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     # add face to inner loop
     bpy.ops.mesh.edge_face_add()
     t.deselect_all()
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     # select inner loop
     for vert in bpy.context.object.data.vertices:
         if vert.index not in outer_loop and vert.index not in loop_2:
             vert.select = True
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     # extrude inner loop up
     t.pd()
     t.up(d=slot_h)
 
-    bpy.ops.object.editmode_toggle()
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
+    editmode_toggle()
 
     # save inner loop top verts
     inner_top_verts = []
@@ -206,32 +206,32 @@ def draw_openlock_pos_curved_base(length, segments, angle, height):
     # delete top face
     bpy.ops.mesh.delete(type='ONLY_FACE')
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     # select loop 2 and extrude up
     for vert in bpy.context.object.data.vertices:
         if vert.index in loop_2:
             vert.select = True
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
     t.up(d=slot_h)
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     for vert in bpy.context.object.data.vertices:
         if vert.index in inner_top_verts:
             vert.select = True
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
     # bridge between loop 2 top and inner loop top
     t.bridge()
     t.deselect_all()
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     # select outer loop extrude up and add face
     for vert in bpy.context.object.data.vertices:
         if vert.index in outer_loop:
             vert.select = True
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
     t.up(d=height)
     bpy.ops.mesh.edge_face_add()
 
@@ -1,5 +1,6 @@
 import bpy
 from math import sqrt, pi, degrees, radians
+from ...utils.utils import editmode_toggle
 
 
 def draw_openlock_curved_base(radius, segments, angle, height, clip_side):
@@ -63,47 +64,47 @@ def draw_openlock_curved_base(radius, segments, angle, height, clip_side):
         if vert.index not in inner_loop and vert.index not in outer_loop:
             slot_loop.append(vert.index)
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     for vert in bpy.context.object.data.vertices:
         if vert.index in slot_loop:
             vert.select = True
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
     bpy.ops.mesh.edge_face_add()
     bpy.ops.mesh.delete(type='ONLY_FACE')
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     for vert in bpy.context.object.data.vertices:
         if vert.index in slot_loop:
             vert.select = True
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     t.pd()
     t.up(d=slot_h)
     bpy.ops.mesh.edge_face_add()
     t.deselect_all()
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     for vert in bpy.context.object.data.vertices:
         if vert.index in slot_loop or vert.index in inner_loop or vert.index in outer_loop:
             vert.select = True
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     t.bridge()
     t.deselect_all()
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     for vert in bpy.context.object.data.vertices:
         if vert.index in inner_loop or vert.index in outer_loop:
             vert.select = True
 
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
     t.pd()
     t.up(d=height)
     bpy.ops.mesh.edge_face_add()
@@ -113,6 +114,6 @@ def draw_openlock_curved_base(radius, segments, angle, height, clip_side):
     bpy.ops.mesh.normals_make_consistent()
 
     t.home()
-    bpy.ops.object.editmode_toggle()
+    editmode_toggle()
 
     return bpy.context.object
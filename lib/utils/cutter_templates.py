@@ -0,0 +1,103 @@
+"""Registry of cutter objects loaded from asset libraries.
+
+Rather than loading fresh copies of a cutter from a .blend file for every
+tile we load each cutter once per session and keep it as a template. New
+cutters are copies of the template that share its mesh data. Templates
+are reloaded if the .blend file has changed on disk or if they have been
+deleted, for example because a new file has been opened.
+"""
+import os
+import bpy
+
+# blend file path: {'mtime': modification time, 'objects': {cutter name: template name}}
+templates = {}
+
+
+def get_templates(blend_path, names):
+    """Returns the template objects called names from blend_path,
+    loading any we haven't already got"""
+    blend_path = bpy.path.abspath(blend_path)
+    mtime = os.path.getmtime(blend_path)
+
+    entry = templates.get(blend_path)
+    if entry is None or entry['mtime'] != mtime:
+        if entry is not None:
+            remove_templates(entry)
+        entry = {'mtime': mtime, 'objects': {}}
+        templates[blend_path] = entry
+
+    missing = [name for name in names if get_template(entry, name) is None]
+    if missing:
+        with bpy.data.libraries.load(blend_path) as (data_from, data_to):
+            data_to.objects = missing
+
+        for name, obj in zip(missing, data_to.objects):
+            # keep template when file is saved even though it isn't in the scene
+            obj.use_fake_user = True
+            obj['mt_template'] = blend_path + ':' + name
+            entry['objects'][name] = obj.name
+
+    return [get_template(entry, name) for name in names]
+
+
+def get_template(entry, name):
+    """Returns the template object for name or None if it no longer exists"""
+    obj_name = entry['objects'].get(name)
+    if obj_name is None:
+        return None
+
+    obj = bpy.data.objects.get(obj_name)
+    if obj is None or not obj.get('mt_template', '').endswith(':' + name):
+        return None
+    return obj
+
+
+def remove_templates(entry):
+    """Removes the template objects in entry. Cutters copied from them keep their mesh"""
+    for name in entry['objects']:
+        obj = get_template(entry, name)
+        if obj is not None:
+            bpy.data.objects.remove(obj)
+
+
+def new_cutters(blend_path, names, unique_data=False):
+    """Returns new cutter objects, copied from the templates called names in blend_path.
+
+    Like objects loaded with bpy.data.libraries.load the cutters are not
+    linked to a collection. Modifiers and parents that point at one of the
+    templates are pointed at its copy.
+
+    Keyword arguments:
+    unique_data -- BOOL, give each cutter its own copy of the mesh. Needed if
+    the mesh is going to be changed, for example by applying a transform
+    """
+    cutter_templates = get_templates(blend_path, names)
+
+    copies = {}
+    for template in cutter_templates:
+        cutter = template.copy()
+        if unique_data and cutter.data is not None:
+            cutter.data = template.data.copy()
+        cutter.use_fake_user = False
+        del cutter['mt_template']
+        copies[template] = cutter
+
+    for cutter in copies.values():
+        if cutter.parent in copies:
+            cutter.parent = copies[cutter.parent]
+
+        for mod in cutter.modifiers:
+            for prop in mod.bl_rna.properties:
+                if prop.type == 'POINTER' and getattr(prop.fixed_type, 'identifier', None) == 'Object':
+                    target = getattr(mod, prop.identifier)
+                    if target in copies:
+                        setattr(mod, prop.identifier, copies[target])
+
+    return [copies[template] for template in cutter_templates]
+
+
+def clear_templates():
+    """Removes all templates so they are reloaded when next used"""
+    for entry in templates.values():
+        remove_templates(entry)
+    templates.clear()
@@ -0,0 +1,231 @@
+"""Opt in profiler for turtle commands.
+
+When Profile Turtle is switched on in the addon preferences every
+TURTLE_OT_* operator and every bmturtle.Turtle command is timed while
+scene.make_tile runs. For each call we record the wall time, the number
+of verts in the mesh before and after, the number of edit mode toggles
+and the script that called it. A report is printed to the console at
+the end of the run and saved as JSON or as a Chrome trace that can be
+opened in chrome://tracing or https://ui.perfetto.dev
+"""
+import os
+import sys
+import json
+from time import perf_counter, strftime
+from functools import wraps
+import bpy
+import bmesh
+
+
+class TurtleProfiler:
+    """Records calls to turtle commands between start and stop"""
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self.stack = []
+        self.toggles = 0
+        self.start_time = 0
+
+    def start(self):
+        self.records = []
+        self.stack = []
+        self.toggles = 0
+        self.start_time = perf_counter()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        return self.records
+
+    def call(self, name, func, count_verts, *args, **kwargs):
+        """Calls func, recording it under name.
+
+        count_verts -- function that returns the number of verts in the mesh
+        """
+        record = {
+            'name': name,
+            'script': calling_script(),
+            'depth': len(self.stack),
+            'verts_before': count_verts(),
+            'toggles': self.toggles,
+            'children': 0.0}
+
+        self.stack.append(record)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = perf_counter()
+            self.stack.pop()
+
+            record['start'] = start - self.start_time
+            record['time'] = end - start
+            record['self_time'] = record['time'] - record.pop('children')
+            record['verts_after'] = count_verts()
+            record['toggles'] = self.toggles - record['toggles']
+
+            if self.stack:
+                self.stack[-1]['children'] += record['time']
+            self.records.append(record)
+
+
+profiler = TurtleProfiler()
+
+
+def count_toggle():
+    """Counts an edit mode toggle"""
+    if profiler.enabled:
+        profiler.toggles += 1
+
+
+def calling_script():
+    """Returns the name of the outermost turtle script function on the call stack"""
+    script = ''
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if '.scripts.' in module:
+            script = frame.f_code.co_name
+        frame = frame.f_back
+    return script
+
+
+def edit_mesh_verts():
+    """Returns the number of verts in the active object's mesh"""
+    obj = bpy.context.object
+    if obj is None or obj.type != 'MESH':
+        return 0
+    if obj.mode == 'EDIT':
+        return len(bmesh.from_edit_mesh(obj.data).verts)
+    return len(obj.data.vertices)
+
+
+def profile_operator(cls):
+    """Wraps the execute method of an operator class so it is profiled"""
+    execute = cls.execute
+    if getattr(execute, 'profiled', False):
+        return cls
+
+    @wraps(execute)
+    def wrapper(self, context):
+        if not profiler.enabled:
+            return execute(self, context)
+        return profiler.call(cls.bl_idname, execute, edit_mesh_verts, self, context)
+
+    wrapper.profiled = True
+    cls.execute = wrapper
+    return cls
+
+
+def profile_method(name, func):
+    """Returns a wrapper for a bmturtle.Turtle method that profiles it"""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not profiler.enabled:
+            return func(self, *args, **kwargs)
+
+        def count_verts():
+            return len(self.bm.verts) if self.bm is not None else 0
+        return profiler.call(name, func, count_verts, self, *args, **kwargs)
+
+    wrapper.profiled = True
+    return wrapper
+
+
+def summarise(records, key=('script', 'name'), sort_by='time'):
+    """Returns a list of dicts summing records that share key, sorted by sort_by"""
+    rows = {}
+    for record in records:
+        row_key = tuple(record[k] for k in key)
+        row = rows.setdefault(row_key, {
+            **{k: record[k] for k in key},
+            'calls': 0,
+            'time': 0.0,
+            'self_time': 0.0,
+            'verts_added': 0,
+            'toggles': 0})
+        row['calls'] += 1
+        row['time'] += record['time']
+        row['self_time'] += record['self_time']
+        row['verts_added'] += record['verts_after'] - record['verts_before']
+        row['toggles'] += record['toggles']
+
+    return sorted(rows.values(), key=lambda row: row[sort_by], reverse=True)
+
+
+def format_report(records, sort_by='self_time'):
+    """Returns a report of records summed per script and command"""
+    lines = ['{:<36} {:<32} {:>7} {:>10} {:>10} {:>8} {:>8}'.format(
+        'script', 'command', 'calls', 'time', 'self', 'verts', 'toggles')]
+    for row in summarise(records, sort_by=sort_by):
+        lines.append('{:<36} {:<32} {:>7} {:>10.4f} {:>10.4f} {:>8} {:>8}'.format(
+            row['script'] or '-',
+            row['name'],
+            row['calls'],
+            row['time'],
+            row['self_time'],
+            row['verts_added'],
+            row['toggles']))
+    return '\n'.join(lines)
+
+
+def chrome_trace(records):
+    """Returns records in Chrome trace event format"""
+    return {
+        'traceEvents': [{
+            'name': record['name'],
+            'cat': record['script'] or 'turtle',
+            'ph': 'X',
+            'ts': record['start'] * 1e6,
+            'dur': record['time'] * 1e6,
+            'pid': 0,
+            'tid': 0,
+            'args': {
+                'verts_before': record['verts_before'],
+                'verts_after': record['verts_after'],
+                'toggles': record['toggles']}} for record in records],
+        'displayTimeUnit': 'ms'}
+
+
+def write_profile(records, folder, name, file_format='JSON'):
+    """Writes records to folder as JSON or a Chrome trace and returns the file path"""
+    folder = bpy.path.abspath(folder)
+    os.makedirs(folder, exist_ok=True)
+    filename = bpy.path.clean_name(name) + strftime('_%Y%m%d_%H%M%S')
+
+    if file_format == 'CHROME':
+        data = chrome_trace(records)
+        filepath = os.path.join(folder, filename + '.trace.json')
+    else:
+        data = {
+            'records': records,
+            'summary': summarise(records)}
+        filepath = os.path.join(folder, filename + '.json')
+
+    with open(filepath, 'w') as f:
+        json.dump(data, f, indent=1)
+    return filepath
+
+
+def register():
+    from ..turtle.operators import (
+        basic_commands,
+        curve,
+        helpers,
+        path,
+        selection,
+        vertex_group)
+    from ..bmturtle.bmturtle import Turtle
+
+    for module in (basic_commands, curve, helpers, path, selection, vertex_group):
+        for name, value in vars(module).items():
+            if name.startswith('TURTLE_OT_') and hasattr(value, 'execute'):
+                profile_operator(value)
+
+    # recorded turtle commands and finalise
+    for name, value in list(vars(Turtle).items()):
+        if getattr(value, 'profiled', False):
+            continue
+        if hasattr(value, '__wrapped__') or name == 'finalise':
+            setattr(Turtle, name, profile_method(name, value))
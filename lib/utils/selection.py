@@ -1,6 +1,7 @@
 import bpy
 import bmesh
-from mathutils import Vector
+import numpy as np
+from mathutils import Vector, kdtree
 
 
 def select_all():
@@ -71,6 +72,66 @@ def in_bbox(lbound, ubound, vert, buffer=0.001):
         lbound[2] - buffer <= vert[2] <= ubound[2] + buffer
 
 
+def select_verts(verts):
+    """Selects bmesh verts and any edges and faces between them.
+
+    Only touches geometry linked to verts so the cost depends on the
+    number of verts rather than the size of the mesh.
+    Returns the newly selected verts, edges and faces
+    """
+    for v in verts:
+        v.select = True
+
+    edges = {e for v in verts for e in v.link_edges if e.verts[0].select and e.verts[1].select}
+    for e in edges:
+        e.select = True
+
+    faces = {f for e in edges for f in e.link_faces if all(v.select for v in f.verts)}
+    for f in faces:
+        f.select = True
+
+    return list(verts) + list(edges) + list(faces)
+
+
+def vert_kdtree(bm, matrix=None):
+    """Returns a KDTree of the verts in bm so we can find verts by location
+    without looping over bm.verts. The tree is only valid until the
+    geometry of bm changes
+
+    Keyword arguments:
+    matrix -- MATRIX to transform vert coords by e.g. obj.matrix_world
+    """
+    bm.verts.index_update()
+    bm.verts.ensure_lookup_table()
+
+    kd = kdtree.KDTree(len(bm.verts))
+    for v in bm.verts:
+        if matrix is None:
+            kd.insert(v.co, v.index)
+        else:
+            kd.insert(matrix @ v.co, v.index)
+    kd.balance()
+    return kd
+
+
+def select_vert_at(bm, kd, co, tolerance=0.0001):
+    """Selects the vert in bm at co. Returns the vert or None if there
+    isn't a vert within tolerance of co on each axis
+
+    Keyword arguments:
+    kd -- KDTree of bm returned by vert_kdtree
+    """
+    found, index, dist = kd.find(co)
+    if index is None or any(abs(a - b) > tolerance for a, b in zip(found, co)):
+        return None
+
+    # operators run on the edit mesh between lookups can leave the table dirty
+    bm.verts.ensure_lookup_table()
+    vert = bm.verts[index]
+    vert.select = True
+    return vert
+
+
 def select_by_loc(
         lbound=(0, 0, 0),
         ubound=(0, 0, 0),
@@ -88,71 +149,13 @@ def select_by_loc(
     select_mode -- default 'VERT'
     coords -- default 'GLOBAL'
     buffer - buffer around selection default = 0.001
+    Returns a numpy array of the indices of the selected elements
     """
-
-    # set selection mode
+    obj = bpy.context.object
     bpy.ops.mesh.select_mode(type=select_mode)
-    # grab the transformation matrix
-    world = bpy.context.object.matrix_world
-
-    # instantiate a bmesh object and ensure lookup table (bm.faces.ensure... works for all)
-    bm = bmesh.from_edit_mesh(bpy.context.object.data)
-    bm.faces.ensure_lookup_table()
-
-    # initialise list of verts and parts to be selected
-    verts = []
-    to_select = []
-
-    # for VERT, EDGE or FACE
-    # grab list of global or local coords
-    # test if the piece is entirely within the rectangular
-    # prism defined by lbound and ubound
-    # select each piece that returned TRUE and deselect each piece that returned FALSE
-
-    if select_mode == 'VERT':
-        if coords == 'GLOBAL':
-            [verts.append((world @ v.co).to_tuple())for v in bm.verts]
-        elif coords == 'LOCAL':
-            [verts.append(v.co.to_tuple())for v in bm.verts]
-
-        [to_select.append(in_bbox(lbound, ubound, v, buffer))for v in verts]
-
-        for vert_obj, select in zip(bm.verts, to_select):
-            if additive:
-                vert_obj.select |= select
-            else:
-                vert_obj.select = select
-
-    if select_mode == 'EDGE':
-        if coords == 'GLOBAL':
-            [verts.append([(world @ v.co).to_tuple() for v in e.verts]) for e in bm.edges]
-        elif coords == 'LOCAL':
-            [verts.append([v.co.to_tuple()for v in e.verts]) for e in bm.edges]
-
-        [to_select.append(all(in_bbox(lbound, ubound, v, buffer)for v in e)) for e in verts]
-
-        for edge_obj, select in zip(bm.edges, to_select):
-            if additive:
-                edge_obj.select |= select
-            else:
-                edge_obj.select = select
-
-    if select_mode == 'FACE':
-        if coords == 'GLOBAL':
-            [verts.append([(world @ v.co).to_tuple() for v in f.verts])for f in bm.faces]
-        elif coords == 'LOCAL':
-            [verts.append([v.co.to_tuple()for v in f.verts]) for f in bm.faces]
-
-        [to_select.append(all(in_bbox(lbound, ubound, v, buffer) for v in f))for f in verts]
-
-        for face_obj, select in zip(bm.faces, to_select):
-            if additive:
-                face_obj.select |= select
-            else:
-                face_obj.select = select
-
-    # update the edit mesh so we get live highlighting
-    bmesh.update_edit_mesh(bpy.context.object.data)
+    indices = indices_by_loc(obj, lbound, ubound, select_mode, coords, buffer)
+    set_selection(obj, select_mode, indices, additive)
+    return indices
 
 
 def select_inverse_by_loc(
@@ -172,85 +175,108 @@ def select_inverse_by_loc(
     select_mode -- default 'VERT'
     coords -- default 'GLOBAL'
     buffer - buffer around selection default = 0.001
+    Returns a numpy array of the indices of the selected elements
     """
-
-    # set selection mode
+    obj = bpy.context.object
     bpy.ops.mesh.select_mode(type=select_mode)
-    # grab the transformation matrix
-    world = bpy.context.object.matrix_world
+    indices = indices_by_loc(obj, lbound, ubound, select_mode, coords, buffer, inverse=True)
+    set_selection(obj, select_mode, indices, additive)
+    return indices
 
-    # instantiate a bmesh object and ensure lookup table (bm.faces.ensure... works for all)
-    bm = bmesh.from_edit_mesh(bpy.context.object.data)
-    bm.faces.ensure_lookup_table()
 
-    # initialise list of verts and parts to be selected
-    verts = []
-    to_select = []
+def indices_by_loc(
+        obj,
+        lbound=(0, 0, 0),
+        ubound=(0, 0, 0),
+        select_mode='VERT',
+        coords='GLOBAL',
+        buffer=0.001,
+        inverse=False):
+    """Returns a numpy array of the indices of the faces, edges or verts
+    of obj that are wholly within a bounding cuboid. Doesn't change the
+    selection.
 
-    # for VERT, EDGE or FACE
-    # grab list of global or local coords
-    # test if the piece is entirely within the rectangular
-    # prism defined by lbound and ubound
-    # select each piece that returned TRUE and deselect each piece that returned FALSE
+    The coordinates are read once with foreach_get and tested as arrays.
+    In EDIT mode the edit mesh is written to obj.data first
 
-    if select_mode == 'VERT':
-        if coords == 'GLOBAL':
-            [verts.append((world @ v.co).to_tuple())for v in bm.verts]
-        elif coords == 'LOCAL':
-            [verts.append(v.co.to_tuple())for v in bm.verts]
+    Keyword arguments:
+    lbound -- lower left bound of bounding box
+    ubound -- upper right bound of bounding box
+    select_mode -- 'VERT', 'EDGE' or 'FACE'
+    coords -- 'GLOBAL' or 'LOCAL'
+    buffer -- buffer around bounding box
+    inverse -- return the elements that are not within the bounding box
+    """
+    if obj.mode == 'EDIT':
+        obj.update_from_editmode()
+    mesh = obj.data
 
-        [to_select.append(in_bbox(lbound, ubound, v, buffer))for v in verts]
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape(-1, 3)
 
-        for vert_obj, select in zip(bm.verts, to_select):
-            if select is True:
-                select = False
-            else:
-                select = True
+    if coords == 'GLOBAL':
+        world = np.array(obj.matrix_world)
+        co = co @ world[:3, :3].T + world[:3, 3]
 
-            if additive:
-                vert_obj.select |= select
-            else:
-                vert_obj.select = select
+    inside = np.all(
+        (co >= np.array(lbound) - buffer) & (co <= np.array(ubound) + buffer),
+        axis=1)
 
     if select_mode == 'EDGE':
-        if coords == 'GLOBAL':
-            [verts.append([(world @ v.co).to_tuple() for v in e.verts]) for e in bm.edges]
-        elif coords == 'LOCAL':
-            [verts.append([v.co.to_tuple()for v in e.verts]) for e in bm.edges]
+        edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get('vertices', edge_verts)
+        inside = inside[edge_verts.reshape(-1, 2)].all(axis=1)
+
+    elif select_mode == 'FACE':
+        if len(mesh.polygons) == 0:
+            inside = np.zeros(0, dtype=bool)
+        else:
+            loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get('vertex_index', loop_verts)
+            loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get('loop_start', loop_start)
+            inside = np.logical_and.reduceat(inside[loop_verts], loop_start)
 
-        [to_select.append(all(in_bbox(lbound, ubound, v, buffer)for v in e)) for e in verts]
+    if inverse:
+        inside = ~inside
 
-        for edge_obj, select in zip(bm.edges, to_select):
+    return np.flatnonzero(inside)
 
-            if select is True:
-                select = False
-            else:
-                select = True
 
-            if additive:
-                edge_obj.select |= select
-            else:
-                edge_obj.select = select
+def set_selection(obj, select_mode, indices, additive=False):
+    """Selects the verts, edges or faces of the edit mesh of obj with indices
+    and, unless additive, deselects the rest.
 
-    if select_mode == 'FACE':
-        if coords == 'GLOBAL':
-            [verts.append([(world @ v.co).to_tuple() for v in f.verts])for f in bm.faces]
-        elif coords == 'LOCAL':
-            [verts.append([v.co.to_tuple()for v in f.verts]) for f in bm.faces]
+    Only elements whose selection changes are touched. Expects obj.data to
+    be up to date with the edit mesh, as it is after indices_by_loc
+    """
+    if select_mode == 'VERT':
+        elements = obj.data.vertices
+    elif select_mode == 'EDGE':
+        elements = obj.data.edges
+    else:
+        elements = obj.data.polygons
 
-        [to_select.append(all(in_bbox(lbound, ubound, v, buffer) for v in f))for f in verts]
+    current = np.empty(len(elements), dtype=bool)
+    elements.foreach_get('select', current)
 
-        for face_obj, select in zip(bm.faces, to_select):
+    new = np.zeros(len(elements), dtype=bool)
+    new[indices] = True
+    if additive:
+        new |= current
 
-            if select is True:
-                select = False
-            else:
-                select = True
+    bm = bmesh.from_edit_mesh(obj.data)
+    if select_mode == 'VERT':
+        seq = bm.verts
+    elif select_mode == 'EDGE':
+        seq = bm.edges
+    else:
+        seq = bm.faces
+    seq.ensure_lookup_table()
 
-            if additive:
-                face_obj.select |= select
-            else:
-                face_obj.select = select
+    for index in np.flatnonzero(new != current):
+        seq[index].select = bool(new[index])
 
     # update the edit mesh so we get live highlighting
-    bmesh.update_edit_mesh(bpy.context.object.data)
+    bmesh.update_edit_mesh(obj.data)
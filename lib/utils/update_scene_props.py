@@ -1,36 +1,19 @@
-import os
 import bpy
 from bpy.app.handlers import persistent
-from ... utils.registration import get_prefs
-from ... materials.materials import (
-    get_blend_filenames,
-    load_materials)
+from ... materials.library import update_library_index
+from . vertex_groups import vert_group_indexes_handler
 
 
 # revolting, disgusting hack to get around the fucking stupid _RestrictData bullshit
 def load_materials_on_addon_activation(dummy):
     bpy.app.handlers.depsgraph_update_pre.remove(load_materials_on_addon_activation)
-    prefs = get_prefs()
-    default_materials_path = os.path.join(prefs.assets_path, "materials")
-    user_materials_path = os.path.join(prefs.user_assets_path, "materials")
-
-    blend_filenames = get_blend_filenames(default_materials_path)
-    load_materials(default_materials_path, blend_filenames)
-
-    blend_filenames = get_blend_filenames(user_materials_path)
-    load_materials(user_materials_path, blend_filenames)
+    update_library_index()
 
 @persistent
 def load_material_libraries(dummy):
-    prefs = get_prefs()
-    default_materials_path = os.path.join(prefs.assets_path, "materials")
-    user_materials_path = os.path.join(prefs.user_assets_path, "materials")
-
-    blend_filenames = get_blend_filenames(default_materials_path)
-    load_materials(default_materials_path, blend_filenames)
-
-    blend_filenames = get_blend_filenames(user_materials_path)
-    load_materials(user_materials_path, blend_filenames)
+    """Updates the index of the materials in the material libraries.
+    Materials are appended when they are first assigned to a tile"""
+    update_library_index()
 
 @persistent
 def update_mt_scene_props_handler(dummy):
@@ -79,7 +62,9 @@ def update_mt_scene_props_handler(dummy):
             scene_props.mt_width_native_subdivisions = tile_props.width_native_subdivisions
 
             scene_props.mt_openlock_column_type = tile_props.openlock_column_type
+            scene_props.mt_live_booleans = tile_props.live_booleans
 
 bpy.app.handlers.depsgraph_update_post.append(update_mt_scene_props_handler)
+bpy.app.handlers.depsgraph_update_post.append(vert_group_indexes_handler)
 bpy.app.handlers.load_post.append(load_material_libraries)
 bpy.app.handlers.depsgraph_update_pre.append(load_materials_on_addon_activation)
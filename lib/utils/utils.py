@@ -1,9 +1,10 @@
-from math import radians, sqrt, cos, acos, degrees, isclose
+from math import radians, sqrt, sin, cos, acos, degrees, isclose
 import bpy
 import bmesh
 from mathutils import Vector, Euler, Matrix
 from . selection import select, activate, deselect_all, select_all
 from . collections import add_object_to_collection
+from . profiler import count_toggle
 
 
 def mode(mode_name):
@@ -13,11 +14,18 @@ def mode(mode_name):
     elif mode_name == bpy.context.object.mode:
         return False
     else:
+        count_toggle()
         bpy.ops.object.mode_set(mode=mode_name)
         if mode_name == "EDIT":
             bpy.ops.mesh.select_all(action="DESELECT")
 
 
+def editmode_toggle():
+    """toggles edit mode, counting the toggle if the turtle profiler is running"""
+    count_toggle()
+    bpy.ops.object.editmode_toggle()
+
+
 def delete_all():
     """delete all objects or verts / edges /faces"""
     if len(bpy.data.objects) != 0:
@@ -99,40 +107,83 @@ def get_tile_props(obj):
     return tile_props
 
 
-def loopcut_and_add_deform_modifiers(obj, segments=8, degrees_of_arc=90, axis='Z', show_render=False):
-    # uses loopcut to subdivide a mesh and adds a deform modifier
-    deselect_all()
-    select(obj.name)
-    activate(obj.name)
+def segment_and_bend(obj, segments=8, degrees_of_arc=90):
+    """Cuts a mesh into segments along its x axis and bends it around its z axis.
 
-    # loopcut
-    mode('EDIT')
-    region, rv3d, v3d, area = view3d_find(True)
-
-    override = {
-        'scene': bpy.context.scene,
-        'region': region,
-        'area': area,
-        'space': v3d
-    }
-
-    bpy.ops.mesh.loopcut(
-        override,
-        number_cuts=segments - 2,
-        smoothness=0,
-        falloff='INVERSE_SQUARE',
-        object_index=0,
-        edge_index=2)
-
-    mode('OBJECT')
-
-    curve_mod = obj.modifiers.new("curve", "SIMPLE_DEFORM")
-    curve_mod.deform_method = 'BEND'
-    curve_mod.deform_axis = axis
-    curve_mod.show_render = show_render
-    curve_mod.angle = radians(degrees_of_arc)
-
-    return curve_mod
+    Bends the mesh the same way a SIMPLE_DEFORM modifier in BEND mode
+    would but moves the verts themselves, so nothing needs to be
+    evaluated when the object or anything it cuts is updated.
+    We bisect the mesh rather than using loopcut so we don't need a 3D view
+
+    Keyword arguments:
+    obj -- bpy.types.Object
+    segments -- INT, number of segments to cut the mesh into
+    degrees_of_arc -- FLOAT, angle the full length of the mesh is bent through
+    """
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+
+    min_x = min(v.co[0] for v in bm.verts)
+    max_x = max(v.co[0] for v in bm.verts)
+
+    for i in range(1, segments - 1):
+        x = min_x + (max_x - min_x) * i / (segments - 1)
+        bmesh.ops.bisect_plane(
+            bm,
+            geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
+            plane_co=(x, 0, 0),
+            plane_no=(1, 0, 0))
+
+    # each vert turns through an angle proportional to its x coordinate
+    # around a center 1 / factor along the y axis
+    factor = radians(degrees_of_arc) / max(max_x - min_x, 0.000001)
+    if abs(factor) > 0.0000001:
+        for v in bm.verts:
+            x, y, z = v.co
+            theta = x * factor
+            v.co = (
+                -(y - 1 / factor) * sin(theta),
+                (y - 1 / factor) * cos(theta) + 1 / factor,
+                z)
+
+    bm.normal_update()
+    bm.to_mesh(obj.data)
+    bm.free()
+    obj.data.update()
+
+
+def rotate_objects(objs, angle, axis='Z', center=(0, 0, 0)):
+    """Rotates objects around an axis through center.
+
+    Does the same as calling bpy.ops.transform.rotate with orient_type='GLOBAL'
+    and center_override=center on the objects but doesn't need a 3D view,
+    so a positive angle is clockwise looking down the axis like the operator.
+
+    Keyword arguments:
+    objs -- list of bpy.types.Object
+    angle -- FLOAT, radians
+    axis -- STR, 'X', 'Y' or 'Z'
+    center -- VECTOR [X, Y, Z]
+    """
+    bpy.context.view_layer.update()
+    center = Vector(center)
+    mat = Matrix.Translation(center) @ Matrix.Rotation(-angle, 4, axis) @ Matrix.Translation(-center)
+    for obj in objs:
+        obj.matrix_world = mat @ obj.matrix_world
+
+
+def mirror_objects(objs, axis='Y'):
+    """Mirrors objects along a global axis around the median of their origins.
+
+    Does the same as bpy.ops.transform.mirror with the default pivot point
+    but doesn't need a 3D view
+    """
+    bpy.context.view_layer.update()
+    center = sum((obj.matrix_world.translation for obj in objs), Vector()) / len(objs)
+    scale = Matrix.Scale(-1, 4, Vector([1 if a == axis else 0 for a in 'XYZ']))
+    mat = Matrix.Translation(center) @ scale @ Matrix.Translation(-center)
+    for obj in objs:
+        obj.matrix_world = mat @ obj.matrix_world
 
 
 def distance_between_two_verts(first, second):
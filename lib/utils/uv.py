@@ -0,0 +1,234 @@
+"""Unwraps tile cores without uv.smart_project.
+
+Rather than running smart project we put faces that share an edge and
+face within angle_limit of each other into one island. Flat islands are
+projected onto their plane. Islands that wrap round an axis, like the
+curved side of a semicircle floor, are unrolled along their arc so the
+texture runs round the curve without seams. The islands are then packed
+into rows. It is all done with numpy on arrays read with foreach_get, so
+the same core always gets the same UVs whichever version of Blender
+made it.
+"""
+from math import sqrt, cos, radians, pi
+import numpy as np
+
+# faces that share an edge are put in the same island if the angle
+# between their normals is less than this, as with smart project
+angle_limit = radians(66)
+
+
+def project_uvs(obj, island_margin=0.01):
+    '''Unwraps the mesh of obj into its active UV map.
+
+    Keyword arguments:
+    island_margin -- space between islands as a fraction of the UV square
+    '''
+    mesh = obj.data
+    num_faces = len(mesh.polygons)
+    if num_faces == 0:
+        return
+
+    co = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape(-1, 3)
+
+    normals = np.empty(num_faces * 3)
+    mesh.polygons.foreach_get('normal', normals)
+    normals = normals.reshape(-1, 3)
+
+    loop_total = np.empty(num_faces, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_total)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('edge_index', loop_edges)
+
+    island = face_islands(normals, loop_total, loop_edges)
+    num_islands = island.max() + 1
+
+    # project every island flat first
+    u_axes, v_axes, island_normals = island_axes(normals, island, num_islands)
+
+    # loops are stored face by face in the same order as the faces
+    loop_island = np.repeat(island, loop_total)
+    loop_co = co[loop_verts]
+    uvs = np.column_stack((
+        (loop_co * u_axes[loop_island]).sum(axis=1),
+        (loop_co * v_axes[loop_island]).sum(axis=1)))
+
+    # then unroll islands that aren't flat
+    min_dots = np.ones(num_islands)
+    np.minimum.at(min_dots, island, (normals * island_normals[island]).sum(axis=1))
+    for i in np.flatnonzero(min_dots < 0.9999):
+        faces = np.flatnonzero(island == i)
+        on_island = loop_island == i
+        loop_face = np.repeat(np.arange(len(faces)), loop_total[faces])
+        band = band_uvs(loop_co[on_island], normals[faces], loop_face)
+        if band is not None:
+            uvs[on_island] = band
+
+    mins = np.full((num_islands, 2), np.inf)
+    maxs = np.full((num_islands, 2), -np.inf)
+    np.minimum.at(mins, loop_island, uvs)
+    np.maximum.at(maxs, loop_island, uvs)
+
+    offsets, scale = pack_islands(maxs - mins, island_margin)
+    uvs = (uvs - mins[loop_island]) * scale + offsets[loop_island]
+
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is None:
+        uv_layer = mesh.uv_layers.new(name='UVMap')
+    uv_layer.data.foreach_set('uv', uvs.astype(np.float32).ravel())
+    mesh.update()
+
+
+def face_islands(normals, loop_total, loop_edges):
+    '''Returns the island index of each face.
+
+    Faces are in the same island if they are joined by edges between
+    faces whose normals are within angle_limit of each other'''
+    num_faces = len(normals)
+    loop_face = np.repeat(np.arange(num_faces), loop_total)
+
+    # faces either side of an edge are next to each other when sorted by edge
+    order = np.argsort(loop_edges, kind='stable')
+    edges = loop_edges[order]
+    faces = loop_face[order]
+    shared = np.flatnonzero(edges[1:] == edges[:-1])
+    face_a = faces[shared]
+    face_b = faces[shared + 1]
+    close = (normals[face_a] * normals[face_b]).sum(axis=1) >= cos(angle_limit)
+
+    # union find
+    parent = list(range(num_faces))
+    for a, b in zip(face_a[close].tolist(), face_b[close].tolist()):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+
+    roots = []
+    for f in range(num_faces):
+        while parent[f] != f:
+            f = parent[f]
+        roots.append(f)
+
+    return np.unique(roots, return_inverse=True)[1].ravel()
+
+
+def band_uvs(loop_co, face_normals, loop_face):
+    '''Returns the UVs of the loops of faces that wrap round an axis, with u
+    running along the arc and v along the axis, or None if the faces
+    don't wrap round an axis.
+
+    Keyword arguments:
+    loop_co -- coords of the loops of the faces
+    face_normals -- normals of the faces
+    loop_face -- index into face_normals of the face of each loop
+    '''
+    # the axis is the direction all the normals are perpendicular to
+    axis = np.linalg.svd(face_normals)[2][-1]
+    if np.abs(face_normals @ axis).max() > 0.05:
+        return None
+    if axis[2] < 0:
+        axis = -axis
+
+    e1 = face_normals[0] - axis * (face_normals[0] @ axis)
+    e1 /= np.linalg.norm(e1)
+    e2 = np.cross(axis, e1)
+
+    # faces facing the same way make up a column of the band
+    angles = np.arctan2(face_normals @ e2, face_normals @ e1)
+    angles, column = np.unique(np.round(angles, 3), return_inverse=True)
+    column = column.ravel()
+    num_columns = len(angles)
+
+    # start after the biggest gap so a band that doesn't go all the way
+    # round is laid out in one piece
+    gaps = np.diff(np.append(angles, angles[0] + 2 * pi))
+    order = np.roll(np.arange(num_columns), -((gaps.argmax() + 1) % num_columns))
+
+    # u runs across each column the way the normals turn, which
+    # keeps the island the right way round seen from outside
+    tangents = np.outer(-np.sin(angles), e1) + np.outer(np.cos(angles), e2)
+    loop_column = column[loop_face]
+    u = (loop_co * tangents[loop_column]).sum(axis=1)
+
+    mins = np.full(num_columns, np.inf)
+    maxs = np.full(num_columns, -np.inf)
+    np.minimum.at(mins, loop_column, u)
+    np.maximum.at(maxs, loop_column, u)
+
+    # lay the columns side by side in order round the axis
+    starts = np.zeros(num_columns)
+    starts[order] = np.concatenate(((0,), np.cumsum((maxs - mins)[order])[:-1]))
+
+    return np.column_stack((
+        starts[loop_column] + u - mins[loop_column],
+        loop_co @ axis))
+
+
+def island_axes(normals, island, num_islands):
+    '''Returns the u and v axes and the average normal of each island.
+
+    Sides are projected with u running horizontally and v up so textures
+    aren't rotated. Tops and bottoms are projected with u along x.
+    Islands are seen from the outside so they are not mirrored'''
+    island_normals = np.zeros((num_islands, 3))
+    np.add.at(island_normals, island, normals)
+    lengths = np.linalg.norm(island_normals, axis=1)
+    island_normals /= np.maximum(lengths, 0.000001)[:, None]
+
+    u_axes = np.cross((0, 0, 1), island_normals)
+    flat = np.linalg.norm(u_axes, axis=1) < 0.001
+    u_axes[flat] = (1, 0, 0)
+    u_axes /= np.linalg.norm(u_axes, axis=1)[:, None]
+    v_axes = np.cross(island_normals, u_axes)
+
+    return u_axes, v_axes, island_normals
+
+
+def pack_islands(sizes, island_margin):
+    '''Returns the offset of each island of size (u, v), packing them
+    into rows tallest first, and the scale to apply to the islands so
+    they fit in the UV square.
+
+    island_margin is a fraction of the UV square so it is added after scaling'''
+    area = (sizes[:, 0] * sizes[:, 1]).sum()
+    row_width = max(sqrt(area), sizes[:, 0].max())
+
+    # split the islands into rows no wider than row_width
+    rows = []
+    row = []
+    u = 0
+    for i in np.argsort(-sizes[:, 1], kind='stable'):
+        width = sizes[i, 0]
+        if row and u + width > row_width:
+            rows.append(row)
+            row = []
+            u = 0
+        row.append(i)
+        u += width
+    rows.append(row)
+
+    # scale the islands so each row and the stack of rows fit with their margins
+    row_heights = [sizes[row, 1].max() for row in rows]
+    limits = [(1 - island_margin * (len(row) - 1)) / max(sizes[row, 0].sum(), 0.0001)
+              for row in rows]
+    limits.append((1 - island_margin * (len(rows) - 1)) / max(sum(row_heights), 0.0001))
+    scale = max(min(limits), 0.0001)
+
+    offsets = np.zeros_like(sizes)
+    v = 0
+    for row, row_height in zip(rows, row_heights):
+        u = 0
+        for i in row:
+            offsets[i] = (u, v)
+            u += sizes[i, 0] * scale + island_margin
+        v += row_height * scale + island_margin
+
+    return offsets, scale
@@ -1,5 +1,7 @@
 import bpy
 import bmesh
+import numpy as np
+from bpy.app.handlers import persistent
 from . selection import (
     select_by_loc,
     select_inverse_by_loc,
@@ -8,9 +10,14 @@ from . selection import (
 from . utils import mode, view3d_find
 
 
+# key: object name, value: (signature, {vertex group index: vert indexes})
+vert_group_indexes = {}
+
+
 def clear_vert_group(vert_group, obj):
     indexes = get_vert_indexes_in_vert_group(vert_group.name, obj)
     vert_group.remove(indexes)
+    invalidate_vert_group_index(obj)
 
 
 def get_verts_with_material(obj, material_name):
@@ -26,28 +33,77 @@ def get_verts_with_material(obj, material_name):
     return verts
 
 
+def vert_group_index(obj):
+    '''Returns a dict of vertex group index: numpy array of the indexes of the verts in it.
+
+    The dict is built in one pass over the verts and reused until the mesh,
+    its vert count or the object's vertex groups change'''
+    mesh = obj.data
+    signature = (
+        mesh.as_pointer(),
+        len(mesh.vertices),
+        tuple(group.name for group in obj.vertex_groups))
+
+    cached = vert_group_indexes.get(obj.name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    members = {group.index: [] for group in obj.vertex_groups}
+    for v in mesh.vertices:
+        for g in v.groups:
+            members.setdefault(g.group, []).append(v.index)
+
+    index = {}
+    for group, verts in members.items():
+        index[group] = np.array(verts, dtype=np.int32)
+        index[group].flags.writeable = False
+
+    # verts in edit mode aren't written back to the mesh until we leave it
+    if obj.mode != 'EDIT':
+        vert_group_indexes[obj.name] = (signature, index)
+    return index
+
+
+def invalidate_vert_group_index(obj=None):
+    '''Forgets the cached vertex group membership of obj, or of all objects.
+    Call this after adding or removing verts from a vertex group'''
+    if obj is None:
+        vert_group_indexes.clear()
+    else:
+        vert_group_indexes.pop(obj.name, None)
+
+
+@persistent
+def vert_group_indexes_handler(scene, depsgraph):
+    '''Forgets the vertex group membership of objects whose geometry has changed'''
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            vert_group_indexes.pop(update.id.name, None)
+
+
 def get_vert_indexes_in_vert_group(vert_group_name, obj):
     '''returns a list of vert indexes in a vert group'''
     vg_index = obj.vertex_groups[vert_group_name].index
-    vert_indices = [v.index for v in obj.data.vertices if vg_index in [vg.group for vg in v.groups]]
-    return vert_indices
+    return vert_group_index(obj)[vg_index].tolist()
 
 
 def get_verts_in_vert_group(vert_group_name, obj):
     '''return a list of vert objects in a vert group'''
     vg_index = obj.vertex_groups[vert_group_name].index
-    verts = [v for v in obj.data.vertices if vg_index in [vg.group for vg in v.groups]]
-    return verts
+    verts = obj.data.vertices
+    return [verts[i] for i in vert_group_index(obj)[vg_index].tolist()]
 
 
 def remove_verts_from_group(vert_group_name, obj, vert_indices):
     '''object mode only'''
     obj.vertex_groups[vert_group_name].remove(vert_indices)
+    invalidate_vert_group_index(obj)
 
 
 def add_verts_to_group(vert_group_name, obj, vert_indices):
     '''object mode only'''
     obj.vertex_groups[vert_group_name].add(vert_indices)
+    invalidate_vert_group_index(obj)
 
 
 def get_selected_face_indices(obj):
@@ -62,30 +118,62 @@ def get_selected_face_indices(obj):
     return face_list
 
 
-def find_vertex_group_of_polygon(polygon, obj):
-    # Get all the vertex groups of all the vertices of this polygon
-    all_vertex_groups = [g.group for v in polygon.vertices
-                         for g in obj.data.vertices[v].groups]
+def polygon_vertex_groups(obj):
+    '''Returns a numpy array of the index of the vertex group most of the verts
+    of each polygon are in, or -1 if none of its verts are in a group.
 
-    # Find the most frequent (mode) of all vertex groups
-    counts = [all_vertex_groups.count(index) for index in all_vertex_groups]
-    mode_index = counts.index(max(counts))
-    av_mode = all_vertex_groups[mode_index]
+    Ties go to the group with the lowest index'''
+    mesh = obj.data
+    num_faces = len(mesh.polygons)
+
+    loop_start = np.empty(num_faces, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_start)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+
+    dominant = np.full(num_faces, -1, dtype=np.int32)
+    if num_faces == 0:
+        return dominant
+    best_count = np.zeros(num_faces, dtype=np.int32)
+    in_group = np.zeros(len(mesh.vertices), dtype=np.int32)
+
+    # count each polygon's verts in each group, keeping the largest count
+    for group, verts in sorted(vert_group_index(obj).items()):
+        in_group[:] = 0
+        in_group[verts] = 1
+        counts = np.add.reduceat(in_group[loop_verts], loop_start)
+        more = counts > best_count
+        dominant[more] = group
+        best_count[more] = counts[more]
+
+    return dominant
+
+
+def assign_material_to_vert_groups(obj, vert_group_indexes, material_index, dominant=None):
+    '''Assigns material_index to the polygons whose dominant vertex group
+    is in vert_group_indexes.
+
+    Keyword arguments:
+    dominant -- array returned by polygon_vertex_groups, if already calculated
+    '''
+    mesh = obj.data
+    if dominant is None:
+        dominant = polygon_vertex_groups(obj)
 
-    return av_mode
+    material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('material_index', material_indices)
+    material_indices[np.isin(dominant, vert_group_indexes)] = material_index
+    mesh.polygons.foreach_set('material_index', material_indices)
+    mesh.update()
 
 
 def assign_material_to_faces(obj, face_list, material_index):
-    # find the current polygon's vertex group index
-    for face in face_list:
-        vertex_group_index = find_vertex_group_of_polygon(obj.data.polygons[face], obj)
-
-    # iterate over all polys and change their material
-    for poly in obj.data.polygons:
-        poly_vertex_group_index = find_vertex_group_of_polygon(poly, obj)
-
-        if poly_vertex_group_index == vertex_group_index:
-            poly.material_index = material_index
+    '''Assigns material_index to every polygon with the same dominant
+    vertex group as a face in face_list'''
+    dominant = polygon_vertex_groups(obj)
+    groups = np.unique(dominant[np.asarray(face_list, dtype=np.int32)])
+    groups = groups[groups >= 0]
+    assign_material_to_vert_groups(obj, groups, material_index, dominant)
 
 
 def construct_displacement_mod_vert_group(obj, textured_vert_group_names):
@@ -97,98 +185,12 @@ def construct_displacement_mod_vert_group(obj, textured_vert_group_names):
 
     for group in all_vert_groups:
         if group.name in textured_vert_group_names:
-            verts = get_verts_in_vert_group(group.name, obj)
-            indices = [i.index for i in verts]
+            indices = get_vert_indexes_in_vert_group(group.name, obj)
             disp_mod_vert_group.add(index=indices, weight=1, type='ADD')
+    invalidate_vert_group_index(obj)
     return disp_mod_vert_group.name
 
 
-def tri_prism_to_vert_groups(obj, dim, height):
-    """Keyword arguments:
-    obj - bpy.types.Object
-    dim - DICT
-    height - float"""
-    # make vertex groups
-    obj.vertex_groups.new(name='Side b')
-    obj.vertex_groups.new(name='Side a')
-    obj.vertex_groups.new(name='Side c')
-    obj.vertex_groups.new(name='Bottom')
-    obj.vertex_groups.new(name='Top')
-
-    mode('EDIT')
-
-    deselect_all()
-    select_by_loc(
-        lbound=dim['loc_C'],
-        ubound=(
-            dim['loc_C'][0],
-            dim['loc_C'][1],
-            dim['loc_C'][2] + height),
-        additive=True
-    )
-    select_by_loc(
-        lbound=dim['loc_B'],
-        ubound=(
-            dim['loc_B'][0],
-            dim['loc_B'][1],
-            dim['loc_B'][2] + height),
-        additive=True
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side a')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=dim['loc_A'],
-        ubound=(
-            dim['loc_B'][0],
-            dim['loc_B'][1],
-            dim['loc_B'][2] + height),
-        additive=True
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side b')
-    bpy.ops.object.vertex_group_assign()
-
-    select_by_loc(
-        lbound=dim['loc_A'],
-        ubound=(
-            dim['loc_C'][0],
-            dim['loc_C'][1],
-            dim['loc_C'][2] + height)
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side c')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=(
-            dim['loc_A'][0],
-            dim['loc_A'][1],
-            dim['loc_A'][2] + height),
-        ubound=(
-            dim['loc_B'][0] + dim['a'],
-            dim['loc_B'][1],
-            dim['loc_B'][2] + height),
-        additive=True
-    )
-    bpy.ops.object.vertex_group_set_active(group='Top')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=(
-            dim['loc_A'][0],
-            dim['loc_A'][1],
-            dim['loc_A'][2]),
-        ubound=(
-            dim['loc_B'][0] + dim['a'],
-            dim['loc_B'][1],
-            dim['loc_B'][2]),
-        additive=True
-    )
-    bpy.ops.object.vertex_group_set_active(group='Bottom')
-    bpy.ops.object.vertex_group_assign()
-
 def cuboid_sides_to_vert_groups(obj):
     """makes a vertex group for each side of cuboid
     and assigns vertices to it"""
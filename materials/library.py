@@ -0,0 +1,201 @@
+"""Index of the materials in the material asset libraries.
+
+Appending every material from every .blend in the material folders when a
+file is opened is slow and gets slower as the libraries grow. Instead we
+keep an index of the materials in each .blend, and of the node groups they
+use, saved in the user assets folder. Only .blend files that have changed
+since they were indexed are opened, and a material is only appended to the
+file the first time it is assigned to a tile.
+"""
+import os
+import json
+import bpy
+from .. utils.registration import get_prefs
+
+# key: .blend file path, value: {'mtime': float, 'materials': {material name: [node group names]}}
+library_index = {}
+
+# items of the material enum and the key they were made for. Blender doesn't
+# copy the strings returned by enum items callbacks so we keep them here
+material_enum_cache = {'key': None, 'items': []}
+
+
+def get_blend_filenames(directory_path):
+    blend_filenames = [name for name in os.listdir(directory_path)
+                       if name.endswith('.blend')]
+    return blend_filenames
+
+
+def material_directories():
+    """Returns the default and user material folders"""
+    prefs = get_prefs()
+    return [
+        os.path.join(prefs.assets_path, "materials"),
+        os.path.join(prefs.user_assets_path, "materials")]
+
+
+def get_index_path():
+    """Returns the path of the saved index"""
+    prefs = get_prefs()
+    return os.path.join(bpy.path.abspath(prefs.user_assets_path), 'material_index.json')
+
+
+def load_index():
+    """Returns the index saved on disk or an empty dict"""
+    try:
+        with open(get_index_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index():
+    """Saves the index to disk"""
+    path = get_index_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(library_index, f, indent=1)
+    except OSError:
+        pass
+
+
+def update_library_index():
+    """Indexes .blend files in the material folders that are new or have
+    changed since they were last indexed and forgets removed ones"""
+    old_index = library_index.copy() if library_index else load_index()
+    new_index = {}
+
+    for directory in material_directories():
+        if not os.path.isdir(directory):
+            continue
+        for filename in get_blend_filenames(directory):
+            file_path = os.path.join(directory, filename)
+            mtime = os.path.getmtime(file_path)
+            entry = old_index.get(file_path)
+            if entry is None or entry['mtime'] != mtime:
+                entry = {'mtime': mtime, 'materials': read_library(file_path)}
+            new_index[file_path] = entry
+
+    library_index.clear()
+    library_index.update(new_index)
+    if new_index != old_index:
+        save_index()
+        material_enum_cache['key'] = None
+
+
+def read_library(file_path):
+    """Returns a dict of material name: names of the node groups it uses
+    for the materials in a .blend file"""
+    linked_libraries = {lib.filepath for lib in bpy.data.libraries}
+
+    with bpy.data.libraries.load(file_path, link=True) as (data_from, data_to):
+        data_to.materials = list(data_from.materials)
+
+    materials = {}
+    library = None
+    for material in data_to.materials:
+        if material is None:
+            continue
+        materials[material.name] = sorted(node_group_dependencies(material.node_tree))
+        library = material.library
+
+    # don't remove a library the file was already linked to
+    if library is not None and library.filepath not in linked_libraries:
+        bpy.data.libraries.remove(library)
+
+    return materials
+
+
+def node_group_dependencies(node_tree):
+    """Returns the names of the node groups used by node_tree and the node groups inside them"""
+    groups = set()
+    if node_tree is None:
+        return groups
+
+    for node in node_tree.nodes:
+        if node.type == 'GROUP' and node.node_tree is not None and node.node_tree.name not in groups:
+            groups.add(node.node_tree.name)
+            groups |= node_group_dependencies(node.node_tree)
+    return groups
+
+
+def indexed_material_names():
+    """Returns the names of the materials in the index"""
+    names = []
+    seen = set()
+    for file_path in sorted(library_index):
+        for name in library_index[file_path]['materials']:
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+    return names
+
+
+def material_enum_items(excluded=()):
+    """Returns the enum items for the local and indexed materials, sorted by name.
+
+    The items are only rebuilt when materials are added, removed or renamed
+    or the index changes. Sorting keeps their order the same when an indexed
+    material is appended
+
+    Keyword arguments:
+    excluded -- names of materials to leave out
+    """
+    key = (tuple(bpy.data.materials.keys()), tuple(excluded))
+    if material_enum_cache['key'] != key:
+        names = set(bpy.data.materials.keys()) | set(indexed_material_names())
+        names.difference_update(excluded)
+        material_enum_cache['items'] = [(name, name, "") for name in sorted(names)]
+        material_enum_cache['key'] = key
+    return material_enum_cache['items']
+
+
+def find_material(name):
+    """Returns the .blend file the material called name is in and the node
+    groups it uses, or (None, []) if it isn't in the index"""
+    for file_path in sorted(library_index):
+        materials = library_index[file_path]['materials']
+        if name in materials:
+            return file_path, materials[name]
+    return None, []
+
+
+def get_material(name):
+    """Returns the material called name, appending it from the material
+    libraries if it isn't in the file yet. Raises KeyError if there is no
+    material called name"""
+    material = bpy.data.materials.get(name)
+    if material is not None:
+        return material
+
+    file_path, node_groups = find_material(name)
+    if file_path is None or not os.path.isfile(file_path):
+        return bpy.data.materials[name]
+
+    old_groups = set(bpy.data.node_groups.keys())
+
+    with bpy.data.libraries.load(file_path) as (data_from, data_to):
+        data_to.materials = [name]
+
+    for group_name in set(bpy.data.node_groups.keys()) - old_groups:
+        reuse_node_group(bpy.data.node_groups[group_name], file_path, node_groups, old_groups)
+
+    return data_to.materials[0]
+
+
+def reuse_node_group(group, file_path, node_groups, old_groups):
+    """Replaces a node group appended along with a material with the copy
+    appended from the same file by an earlier material, if there is one.
+
+    Appending materials one at a time would otherwise add a copy of
+    each shared node group every time"""
+    base_name, _, suffix = group.name.rpartition('.')
+    if suffix.isdigit() and base_name in node_groups and base_name in old_groups:
+        existing = bpy.data.node_groups[base_name]
+        if existing.get('mt_library') == file_path:
+            group.user_remap(existing)
+            bpy.data.node_groups.remove(group)
+            return
+
+    group['mt_library'] = file_path
@@ -1,33 +1,10 @@
-import os
 import bpy
+import numpy as np
 from .. utils.registration import get_prefs
 # from .. lib.utils.utils import mode
 # from .. lib.utils.selection import deselect_all, select_all, select, activate
-from .. lib.utils.vertex_groups import get_verts_in_vert_group, get_vert_indexes_in_vert_group
-
-
-def load_materials(directory_path, blend_filenames):
-    for filename in blend_filenames:
-        file_path = os.path.join(directory_path, filename)
-        get_materials_from_file(file_path)
-
-
-def get_blend_filenames(directory_path):
-    blend_filenames = [name for name in os.listdir(directory_path)
-                       if name.endswith('.blend')]
-    return blend_filenames
-
-
-def get_materials_from_file(file_path):
-    unique_materials = []
-    with bpy.data.libraries.load(file_path) as (data_from, data_to):
-        i = 0
-        for material in data_from.materials:
-            if material not in bpy.data.materials:
-                unique_materials.append(data_from.materials[i])
-            i += 1
-        data_to.materials = unique_materials
-    return data_to.materials
+from .. lib.utils.vertex_groups import vert_group_index
+from . library import get_blend_filenames, get_material
 
 
 def load_secondary_material():
@@ -47,15 +24,28 @@ def get_material_index(obj, material):
 
 
 def assign_mat_to_vert_group(vert_group, obj, material):
-    vert_group = get_vert_indexes_in_vert_group(vert_group, obj)
+    '''Assigns material to the faces whose verts are all in vert_group'''
+    mesh = obj.data
+    num_faces = len(mesh.polygons)
+    if num_faces == 0:
+        return
+
+    in_group = np.zeros(len(mesh.vertices), dtype=bool)
+    in_group[vert_group_index(obj)[obj.vertex_groups[vert_group].index]] = True
     material_index = get_material_index(obj, material)
-    for poly in obj.data.polygons:
-        count = 0
-        for vert in poly.vertices:
-            if vert in vert_group:
-                count += 1
-        if count == len(poly.vertices):
-            poly.material_index = material_index
+
+    loop_start = np.empty(num_faces, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_start)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    material_indices = np.empty(num_faces, dtype=np.int32)
+    mesh.polygons.foreach_get('material_index', material_indices)
+
+    # loops are stored face by face so reduce each face's run of loops
+    in_faces = np.logical_and.reduceat(in_group[loop_verts], loop_start)
+    material_indices[in_faces] = material_index
+    mesh.polygons.foreach_set('material_index', material_indices)
+    mesh.update()
 
 
 def add_preview_mesh_subsurf(obj):
@@ -74,7 +64,7 @@ def add_preview_mesh_subsurf(obj):
 
 
 def update_displacement_material_2(obj, primary_material_name):
-    primary_material = bpy.data.materials[primary_material_name]
+    primary_material = get_material(primary_material_name)
     obj['primary_material'] = primary_material
     obj.data.materials.append(primary_material)
 
@@ -82,7 +72,7 @@ def update_displacement_material_2(obj, primary_material_name):
 def update_preview_material_2(obj, primary_material_name):
     textured_groups = obj['textured_groups']
 
-    primary_material = bpy.data.materials[primary_material_name]
+    primary_material = get_material(primary_material_name)
     obj['primary_material'] = primary_material
     secondary_material = obj['secondary_material']
     obj.data.materials.append(secondary_material)
@@ -150,12 +140,12 @@ def assign_texture_to_areas(obj, primary_material, secondary_material):
     textured_vert_groups = obj.mt_textured_areas_coll
 
     if secondary_material not in material_slots:
-        obj.data.materials.append(bpy.data.materials[secondary_material])
+        obj.data.materials.append(get_material(secondary_material))
     if primary_material not in material_slots:
-        obj.data.materials.append(bpy.data.materials[primary_material])
+        obj.data.materials.append(get_material(primary_material))
 
     for group in textured_vert_groups:
         if group.value is False:
-            assign_mat_to_vert_group(group.name, obj, bpy.data.materials[secondary_material])
+            assign_mat_to_vert_group(group.name, obj, get_material(secondary_material))
         else:
-            assign_mat_to_vert_group(group.name, obj, bpy.data.materials[primary_material])
+            assign_mat_to_vert_group(group.name, obj, get_material(primary_material))
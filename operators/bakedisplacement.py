@@ -2,9 +2,11 @@
 import bpy
 from .. materials.materials import (
     assign_mat_to_vert_group)
+from .. materials.library import get_material
 from .. lib.utils.vertex_groups import (
     get_verts_with_material,
-    clear_vert_group)
+    clear_vert_group,
+    invalidate_vert_group_index)
 from .. utils.registration import get_prefs
 
 
@@ -26,7 +28,7 @@ class MT_OT_Assign_Material_To_Vert_Group(bpy.types.Operator):
         vert_group_name = active_obj.vertex_groups.active.name
 
         primary_material = context.object.active_material
-        secondary_material = bpy.data.materials[prefs.secondary_material]
+        secondary_material = get_material(prefs.secondary_material)
 
         selected_objects = context.selected_objects
 
@@ -54,6 +56,7 @@ class MT_OT_Assign_Material_To_Vert_Group(bpy.types.Operator):
                     disp_vert_group = disp_obj.vertex_groups['disp_mod_vert_group']
                     clear_vert_group(disp_vert_group, disp_obj)
                     disp_vert_group.add(index=list(textured_verts), weight=1, type='ADD')
+                    invalidate_vert_group_index(disp_obj)
                 else:
                     disp_vert_group = obj.vertex_groups.new(name='disp_mod_vert_group')
                     disp_vert_group.add(index=list(textured_verts), weight=1, type='ADD')
@@ -79,7 +82,7 @@ class MT_OT_Remove_Material_From_Vert_Group(bpy.types.Operator):
         active_obj = context.active_object
         vert_group_name = active_obj.vertex_groups.active.name
 
-        secondary_material = bpy.data.materials[prefs.secondary_material]
+        secondary_material = get_material(prefs.secondary_material)
 
         selected_objects = context.selected_objects
 
@@ -254,6 +257,6 @@ def bake_displacement_map(preview_obj, disp_obj):
 
     for material in disp_obj.data.materials:
         disp_obj.data.materials.pop(index=0)
-    disp_obj.data.materials.append(bpy.data.materials[prefs.secondary_material])
+    disp_obj.data.materials.append(get_material(prefs.secondary_material))
 
     return disp_image, disp_obj
@@ -0,0 +1,68 @@
+"""Operator class to generate tiles from a manifest"""
+import os
+import bpy
+from .. tile_creation.batch import run_batch, format_batch_report
+
+
+class MT_OT_Batch_Generate_Tiles(bpy.types.Operator):
+    """Generate the tiles listed in a CSV or JSON manifest in background Blender processes"""
+    bl_idname = "scene.mt_batch_generate_tiles"
+    bl_label = "Batch generate tiles"
+    bl_options = {'REGISTER'}
+
+    manifest_path: bpy.props.StringProperty(
+        name="Manifest",
+        description="CSV or JSON file listing the tiles to generate",
+        subtype="FILE_PATH"
+    )
+
+    out_dir: bpy.props.StringProperty(
+        name="Output Folder",
+        description="Folder to save generated .blend and .stl files to",
+        subtype="DIR_PATH"
+    )
+
+    workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of Blender processes to run at once",
+        default=os.cpu_count() or 1,
+        min=1
+    )
+
+    save_blend: bpy.props.BoolProperty(
+        name="Save .blend Files",
+        description="Save the tiles built by each worker as a .blend file",
+        default=True
+    )
+
+    export_stl: bpy.props.BoolProperty(
+        name="Export .stl Files",
+        description="Export each tile as an .stl",
+        default=False
+    )
+
+    def invoke(self, context, event):
+        if not self.out_dir:
+            self.out_dir = context.scene.mt_export_path
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        if not os.path.isfile(bpy.path.abspath(self.manifest_path)):
+            self.report({'ERROR'}, 'Manifest not found')
+            return {'CANCELLED'}
+
+        records = run_batch(
+            self.manifest_path,
+            self.out_dir,
+            workers=self.workers,
+            save_blend=self.save_blend,
+            export_stl=self.export_stl)
+
+        print(format_batch_report(records))
+
+        failed = [record for record in records if record['error']]
+        if failed:
+            self.report({'WARNING'}, str(len(failed)) + ' of ' + str(len(records)) + ' tiles failed. See console')
+        else:
+            self.report({'INFO'}, str(len(records)) + ' tiles generated')
+        return {'FINISHED'}
@@ -6,6 +6,7 @@ from .. materials.materials import (
     assign_displacement_materials,
     assign_preview_materials,
     add_preview_mesh_subsurf)
+from .. materials.library import get_material
 from .. lib.utils.selection import (
     deselect_all,
     select_all,
@@ -110,8 +111,8 @@ class MT_OT_Convert_To_MT_Obj(bpy.types.Operator):
         # Get prefs from scene
         prefs = get_prefs()
 
-        primary_material = bpy.data.materials[bpy.context.scene.mt_scene_props.mt_tile_material_1]
-        secondary_material = bpy.data.materials[prefs.secondary_material]
+        primary_material = get_material(bpy.context.scene.mt_scene_props.mt_tile_material_1)
+        secondary_material = get_material(prefs.secondary_material)
 
         image_size = bpy.context.scene.mt_scene_props.mt_tile_resolution
 
@@ -1,6 +1,6 @@
 import bpy
 from .. lib.utils.selection import select, deselect_all, select_all, activate
-from .. lib.utils.utils import mode, loopcut_and_add_deform_modifiers, calc_tri
+from .. lib.utils.utils import mode, segment_and_bend, calc_tri
 from mathutils import Vector
 from .. lib.turtle.scripts.primitives import draw_cuboid, draw_tri_prism, draw_curved_slab
 from math import radians
@@ -209,7 +209,7 @@ def create_curved_wall_tile_trimmers(
 
     for trimmer in z_trimmers:
         bpy.ops.object.origin_set(type='ORIGIN_CURSOR', center='MEDIAN')
-        loopcut_and_add_deform_modifiers(trimmer, tile_props.segments, arc_adjusted)
+        segment_and_bend(trimmer, tile_props.segments, arc_adjusted)
 
     trimmers = [
         x_neg_trimmer,
@@ -1,7 +1,7 @@
 import os
 import shutil
 import bpy
-from bpy.props import StringProperty, EnumProperty, BoolProperty
+from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty
 from . utils.registration import get_path
 from . utils.system import makedir, abspath
 from . enums.enums import tile_main_systems, base_systems, tile_blueprints, units
@@ -15,6 +15,8 @@ class MT_MakeTilePreferences(bpy.types.AddonPreferences):
     user_path = os.path.expanduser('~')
     export_path = os.path.join(user_path, 'MakeTile')
     user_assets_path = os.path.join(user_path, 'MakeTile', 'UserAssets')
+    mesh_cache_path = os.path.join(user_path, 'MakeTile', 'Cache')
+    profile_path = os.path.join(user_path, 'MakeTile', 'Profiles')
 
     # asset libraries
     def update_assetspath(self, context):
@@ -70,6 +72,49 @@ class MT_MakeTilePreferences(bpy.types.AddonPreferences):
         default=export_path,
     )
 
+    mesh_cache_path: StringProperty(
+        name="Mesh Cache",
+        subtype='DIR_PATH',
+        description="Folder to save the meshes of tile parts to so they can be reused",
+        default=mesh_cache_path,
+    )
+
+    use_mesh_cache: BoolProperty(
+        name="Cache Meshes on Disk",
+        description="Save the meshes of tile parts to the mesh cache folder",
+        default=True,
+    )
+
+    mesh_cache_size: IntProperty(
+        name="Mesh Cache Size (MB)",
+        description="The least recently used meshes are removed from the mesh cache folder when it grows bigger than this",
+        default=200,
+        min=1,
+    )
+
+    profile_turtle: BoolProperty(
+        name="Profile Turtle",
+        description="Time turtle commands while making tiles and save a report",
+        default=False,
+    )
+
+    profile_path: StringProperty(
+        name="Profile Folder",
+        subtype='DIR_PATH',
+        description="Folder to save turtle profiles to",
+        default=profile_path,
+    )
+
+    profile_format: EnumProperty(
+        items=[
+            ('REPORT', 'Report', 'Only print a report to the console'),
+            ('JSON', 'JSON', 'Save every call and a summary as JSON'),
+            ('CHROME', 'Chrome Trace', 'Save a trace that can be opened in chrome://tracing')],
+        name="Profile Format",
+        description="How to save turtle profiles",
+        default='JSON',
+    )
+
     old_path: StringProperty(
         name="Old Path",
         subtype='DIR_PATH',
@@ -109,6 +154,12 @@ class MT_MakeTilePreferences(bpy.types.AddonPreferences):
         layout.prop(self, 'assets_path')
         layout.prop(self, 'user_assets_path')
         layout.prop(self, 'default_export_path')
+        layout.prop(self, 'mesh_cache_path')
+        layout.prop(self, 'use_mesh_cache')
+        layout.prop(self, 'mesh_cache_size')
+        layout.prop(self, 'profile_turtle')
+        layout.prop(self, 'profile_path')
+        layout.prop(self, 'profile_format')
         layout.prop(self, 'default_units')
         layout.prop(self, 'default_tile_blueprint')
         layout.prop(self, 'default_tile_main_system')
@@ -10,12 +10,16 @@ from .. enums.enums import (
     tile_blueprints,
     curve_types,
     geometry_types,
+    tile_parts,
     base_socket_side,
     units,
     material_mapping,
     openlock_column_types)
 
 from .. lib.utils.update_scene_props import load_material_libraries
+from .. materials.library import material_enum_items
+from .. lib.utils.uv import project_uvs
+from .. lib.bmturtle.scripts.grid_core import unwrap_grid_core
 
 
 # Radio buttons used in menus
@@ -238,7 +242,7 @@ class MT_Scene_Properties(PropertyGroup):
                     mapping_node.inputs['Vector'])
 
     def update_UV_island_margin(self, context):
-        '''Reruns UV smart project for preview and displacement object'''
+        '''Unwraps the preview and displacement object again with the new margin'''
 
         if len(bpy.context.selected_editable_objects) > 0:
             obj = bpy.context.object
@@ -254,13 +258,12 @@ class MT_Scene_Properties(PropertyGroup):
                     UV_island_margin = scene_props.mt_UV_island_margin
                     tile_props.UV_island_margin = UV_island_margin
 
+                    # lay cores out the same way they were unwrapped when they were built
                     for ob in (obj, linked_obj):
-                        ctx = {
-                            'object': ob,
-                            'active_object': ob,
-                            'selected_objects': [ob]
-                        }
-                        bpy.ops.uv.smart_project(ctx, island_margin=UV_island_margin)
+                        if ob.data.get('mt_uv_unwrap') == 'GRID':
+                            unwrap_grid_core(ob, UV_island_margin)
+                        else:
+                            project_uvs(ob, UV_island_margin)
 
                     if obj_props.geometry_type == 'DISPLACEMENT':
                         bpy.ops.scene.mt_return_to_preview()
@@ -277,13 +280,8 @@ class MT_Scene_Properties(PropertyGroup):
 
         prefs = get_prefs()
 
-        materials = bpy.data.materials
-        for material in materials:
-            # prevent make-tile adding the default material to the list
-            if material.name != prefs.secondary_material and material.name != 'Material':
-                enum = (material.name, material.name, "")
-                enum_items.append(enum)
-        return enum_items
+        # prevent make-tile adding the default material to the list
+        return material_enum_items(excluded=(prefs.secondary_material, 'Material'))
 
     mt_is_just_activated: bpy.props.BoolProperty(
         description="Has the add-on just been activated. Used to populate materials list first time round",
@@ -341,6 +339,12 @@ class MT_Scene_Properties(PropertyGroup):
         update=update_UV_island_margin
     )
 
+    mt_live_booleans: bpy.props.BoolProperty(
+        name="Live Base Booleans",
+        default=False,
+        description="Keep the boolean cutters on OpenLOCK bases editable. Slower in the viewport and on export"
+    )
+
     # Native Subdivisions #
     mt_x_native_subdivisions: bpy.props.IntProperty(
         name="X",
@@ -583,6 +587,12 @@ class MT_Object_Properties(PropertyGroup):
         items=geometry_types
     )
 
+    tile_part: bpy.props.EnumProperty(
+        name="Tile Part",
+        items=tile_parts,
+        description="The part of the tile that created this object. Used to rebuild only the parts of a tile that have changed"
+    )
+
     # Collection of cutters that can be turned on or off
     # by MakeTile.
     cutters_collection: bpy.props.CollectionProperty(
@@ -696,6 +706,12 @@ class MT_Tile_Properties(PropertyGroup):
         description="Tweak this if you have gaps at edges of tiles when you Make3D"
     )
 
+    live_booleans: bpy.props.BoolProperty(
+        name="Live Base Booleans",
+        default=False,
+        description="Keep the boolean cutters on OpenLOCK bases editable rather than applying them"
+    )
+
     # Dimensions #
     tile_size: bpy.props.FloatVectorProperty(
         name="Tile Size"
@@ -1,20 +1,27 @@
 import os
+from math import radians
+from mathutils import Vector
 import bpy
 from .. utils.registration import get_prefs
 from . create_displacement_mesh import create_displacement_object
 from .. lib.utils.vertex_groups import construct_displacement_mod_vert_group
 from .. lib.utils.collections import add_object_to_collection
+from .. lib.utils.cutter_templates import new_cutters
 from .. lib.utils.selection import select, deselect_all, activate
-from .. lib.turtle.scripts.primitives import draw_cuboid
+from .. lib.bmturtle.scripts.primitives import draw_cuboid
+from .. lib.bmturtle.scripts.grid_core import draw_column_core
 from .. materials.materials import (
     assign_displacement_materials,
     assign_preview_materials,
     add_preview_mesh_subsurf)
+from .. materials.library import get_material
 from .create_tile import MT_Tile
-from ..lib.bmturtle.bmturtle import *
 
 
 class MT_Connecting_Column_Tile(MT_Tile):
+    # columns build their base and cores together so are always rebuilt in full
+    part_dependencies = None
+
     def __init__(self, tile_props):
         self.tile_props = tile_props
         scene = bpy.context.scene
@@ -56,7 +63,7 @@ class MT_Connecting_Column_Tile(MT_Tile):
         tile_name = tile_props.tile_name
 
         # make base
-        base = draw_cuboid(base_size) # TODO: Replace with bmturtle script
+        base = draw_cuboid(base_size)
         base.name = tile_name + '.base'
         add_object_to_collection(base, tile_name)
 
@@ -208,13 +215,12 @@ class MT_Connecting_Column_Tile(MT_Tile):
             "openlock.blend")
 
         # load side cutter
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = ['openlock.wall.cutter.side']
+        cutter_objs = new_cutters(booleans_path, ['openlock.wall.cutter.side'])
 
-        for obj in data_to.objects:
+        for obj in cutter_objs:
             add_object_to_collection(obj, tile_name)
 
-        cutter = data_to.objects[0]
+        cutter = cutter_objs[0]
 
         array_mod = cutter.modifiers.new('Array', 'ARRAY')
         array_mod.use_relative_offset = False
@@ -226,7 +232,8 @@ class MT_Connecting_Column_Tile(MT_Tile):
     def create_openlock_single_core_cutter_frame(self, tile_props):
         tile_name = tile_props.tile_name
 
-        obj = draw_cuboid((0.25, 0.06, 0.63), 'openlock.connecting_column.cutter_frame.side')
+        obj = draw_cuboid((0.25, 0.06, 0.63))
+        obj.name = 'openlock.connecting_column.cutter_frame.side'
 
         add_object_to_collection(obj, tile_name)
         array_mod = obj.modifiers.new('Array', 'ARRAY')
@@ -253,7 +260,6 @@ class MT_Connecting_Column_Tile(MT_Tile):
         }
 
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
 
         obj_props = core.mt_object_props
         obj_props.is_mt_object = True
@@ -265,7 +271,7 @@ class MT_Connecting_Column_Tile(MT_Tile):
         # Assign secondary material to our base if its a mesh
         if base.type == 'MESH':
             prefs = get_prefs()
-            base.data.materials.append(bpy.data.materials[prefs.secondary_material])
+            base.data.materials.append(get_material(prefs.secondary_material))
 
         # Add subsurf modifier to our cores
         '''
@@ -295,81 +301,9 @@ class MT_Connecting_Column_Tile(MT_Tile):
             tile_size[1],
             tile_size[2] - base_size[2])
 
-        bm, obj = create_turtle('Column', ['Top', 'Bottom', 'Sides'])
-
-        bm.verts.layers.deform.verify()
-        deform_layer = bm.verts.layers.deform.active
-
-        bm.select_mode = {'VERT'}
-
-        bottom_verts = []
-        side_verts = []
-
-        # draw bottom
-        subdiv_dist = col_size[1] / native_subdivisions[1]
-        for i in range(native_subdivisions[1]):
-            fd(bm, subdiv_dist)
-        bm.select_mode = {'EDGE'}
-        bm_select_all(bm)
-
-        subdiv_dist = col_size[0] / native_subdivisions[0]
-        for i in range(native_subdivisions[0]):
-            ri(bm, subdiv_dist)
-
-        # store verts to add to bottom vert group later.
-        # If we add them now then verts created by extruding these verts will
-        # also be added to vert group
-
-        for v in bm.verts:
-            bottom_verts.append(v)
-
-        pu(bm)
-        home(obj)
-        pd(bm)
-
-        # draw faces
-        bm.select_mode = {'FACE'}
-        bm_select_all(bm)
+        obj = draw_column_core(col_size, native_subdivisions, tile_props.UV_island_margin)
 
-        # save index last vert we drew
-        bm.verts.ensure_lookup_table()
-        start_index = bm.verts[-1].index
-        # draw ring so side verts don't project in wrong direction
-        # because this is the first laye we don;t want to delete the original
-        # geometry
-        up(bm, 0.001, False)
+        # the column sits on top of the base
+        obj.location[2] += base_size[2]
 
-        subdiv_dist = (col_size[2] - 0.002) / native_subdivisions[2]
-        for i in range(native_subdivisions[2]):
-            up(bm, subdiv_dist)
-
-        bm.verts.ensure_lookup_table()
-        for v in bm.verts:
-            if v.index > start_index and v.index <= bm.verts[-1].index:
-                side_verts.append(v)
-
-        up(bm, 0.001)
-
-        bmesh.ops.translate(bm, vec=Vector((0, 0, base_size[2])), verts=bm.verts)
-        # assign vertex groups
-        for v in bm.verts:
-            if v.select:
-                groups = v[deform_layer]
-                groups[0] = 1
-
-        for v in bottom_verts:
-            if v.is_valid:
-                groups = v[deform_layer]
-                groups[1] = 1
-
-        for v in side_verts:
-            if v.is_valid:
-                groups = v[deform_layer]
-                groups[2] = 1
-
-        pu(bm)
-        home(obj)
-
-        finalise_turtle(bm, obj)
-
-        return(obj)
\ No newline at end of file
+        return obj
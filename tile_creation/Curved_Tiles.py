@@ -3,23 +3,45 @@ from math import radians, pi, modf
 from mathutils import Vector
 import bpy
 from .. lib.utils.collections import add_object_to_collection
+from .. lib.utils.cutter_templates import new_cutters
 from .. utils.registration import get_prefs
-from .. lib.turtle.scripts.openlock_curved_wall_base import draw_openlock_curved_base
-from .. lib.turtle.scripts.straight_tile import draw_straight_wall_core
+from .. lib.bmturtle.scripts.primitives import draw_curved_slab
+from .. lib.bmturtle.scripts.openlock_curved_wall_base import draw_openlock_curved_base
+from .. lib.bmturtle.scripts.grid_core import draw_straight_floor_core, draw_straight_wall_core
 
 from .. lib.utils.selection import (
     deselect_all,
     select,
     activate)
 
-from .. lib.utils.utils import (add_circle_array)
+from .. lib.utils.utils import add_circle_array, rotate_objects
 from . create_tile import MT_Tile
-from . Rectangular_Tiles import rect_floor_to_vert_groups
-from . Straight_Tiles import straight_wall_to_vert_groups
 
 
 # MIXIN #
 class MT_Curved_Tile:
+    part_dependencies = {
+        'BASE': (
+            'base_blueprint',
+            'live_booleans',
+            'base_size',
+            'tile_size',
+            'base_radius',
+            'base_socket_side',
+            'degrees_of_arc',
+            'curve_native_subdivisions'),
+        'CORE': (
+            'main_part_blueprint',
+            'tile_size',
+            'base_size',
+            'base_radius',
+            'wall_radius',
+            'degrees_of_arc',
+            'curve_native_subdivisions',
+            'y_native_subdivisions',
+            'z_native_subdivisions',
+            'UV_island_margin')}
+
     def create_plain_base(self, tile_props):
         radius = tile_props.base_radius
         segments = tile_props.curve_native_subdivisions
@@ -27,21 +49,7 @@ class MT_Curved_Tile:
         height = tile_props.base_size[2]
         width = tile_props.base_size[1]
 
-        t = bpy.ops.turtle
-
-        t.add_turtle()
-        t.pd()
-        t.arc(r=radius, d=angle, s=segments)
-        t.arc(r=radius + width, d=angle, s=segments)
-        t.select_all()
-        t.bridge()
-        t.pd()
-        t.select_all()
-        t.up(d=height)
-        t.home()
-        bpy.ops.object.editmode_toggle()
-
-        base = bpy.context.object
+        base = draw_curved_slab(radius, angle, height, width, segments)
         base.name = tile_props.tile_name + '.base'
 
         obj_props = base.mt_object_props
@@ -89,10 +97,13 @@ class MT_Curved_Tile:
             "openlock.blend")
 
 
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = ['openlock.wall.base.cutter.clip_single']
+        # we apply the cutter's rotation so it needs its own mesh
+        cutter_objs = new_cutters(
+            booleans_path,
+            ['openlock.wall.base.cutter.clip_single'],
+            unique_data=True)
 
-        clip_cutter = data_to.objects[0]
+        clip_cutter = cutter_objs[0]
 
         add_object_to_collection(clip_cutter, tile_props.tile_name)
 
@@ -114,10 +125,11 @@ class MT_Curved_Tile:
         else:
             initial_rot = 22.5
 
-        bpy.ops.transform.rotate(
-            value=radians(initial_rot),
-            orient_axis='Z',
-            center_override=circle_center)
+        rotate_objects(
+            bpy.context.selected_editable_objects,
+            radians(initial_rot),
+            'Z',
+            circle_center)
 
         bpy.ops.object.transform_apply(
             location=False,
@@ -153,8 +165,8 @@ class MT_Curved_Tile:
 
 
 class MT_Curved_Floor_Tile(MT_Curved_Tile, MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_plain_base(self, tile_props):
         base = MT_Curved_Tile.create_plain_base(self, tile_props)
@@ -205,11 +217,12 @@ class MT_Curved_Floor_Tile(MT_Curved_Tile, MT_Tile):
         # displacement texture by disabling it in render and thus being able to use
         # standard projections
 
-        core = draw_straight_wall_core(
+        core = draw_straight_floor_core(
             (wall_length,
              width,
              height),
-            native_subdivisions)
+            native_subdivisions,
+            tile_props.UV_island_margin)
 
         core.name = tile_name + '.core'
         add_object_to_collection(core, tile_props.tile_name)
@@ -221,10 +234,8 @@ class MT_Curved_Floor_Tile(MT_Curved_Tile, MT_Tile):
         }
 
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
 
         tile_props.tile_size[0] = wall_length
-        rect_floor_to_vert_groups(core)
 
         core.location = (
             core.location[0],
@@ -246,8 +257,8 @@ class MT_Curved_Floor_Tile(MT_Curved_Tile, MT_Tile):
 
 
 class MT_Curved_Wall_Tile(MT_Curved_Tile, MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_plain_base(self, tile_props):
         base = MT_Curved_Tile.create_plain_base(self, tile_props)
@@ -341,22 +352,13 @@ class MT_Curved_Wall_Tile(MT_Curved_Tile, MT_Tile):
             (wall_length,
              width,
              height),
-            native_subdivisions)
+            native_subdivisions,
+            tile_props.UV_island_margin)
 
         core.name = tile_name + '.core'
 
         add_object_to_collection(core, tile_props.tile_name)
 
-        ctx = {
-            'object': core,
-            'active_object': core,
-            'selected_objects': [core]
-        }
-
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
-
-        straight_wall_to_vert_groups(core)
-
         core.location = (
             core.location[0],
             core.location[1] + radius,
@@ -388,15 +390,14 @@ class MT_Curved_Wall_Tile(MT_Curved_Tile, MT_Tile):
             "openlock.blend")
 
         # load side cutter
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = ['openlock.wall.cutter.side']
+        cutter_objs = new_cutters(booleans_path, ['openlock.wall.cutter.side'])
 
         core_location = core.location.copy()
 
         cutters = []
 
         # left side cutters
-        left_cutter_bottom = data_to.objects[0].copy()
+        left_cutter_bottom = cutter_objs[0].copy()
         left_cutter_bottom.name = 'X Neg Bottom.' + tile_name
 
         add_object_to_collection(left_cutter_bottom, tile_props.tile_name)
@@ -439,11 +440,11 @@ class MT_Curved_Wall_Tile(MT_Curved_Tile, MT_Tile):
         select(right_cutter_bottom.name)
         activate(right_cutter_bottom.name)
 
-        bpy.ops.transform.rotate(
-            value=radians(tile_props.degrees_of_arc),
-            orient_axis='Z',
-            orient_type='GLOBAL',
-            center_override=circle_center)
+        rotate_objects(
+            bpy.context.selected_editable_objects,
+            radians(tile_props.degrees_of_arc),
+            'Z',
+            circle_center)
 
         right_cutter_top = right_cutter_bottom.copy()
         add_object_to_collection(right_cutter_top, tile_props.tile_name)
@@ -4,15 +4,19 @@ import bpy
 import bmesh
 from mathutils import Vector
 from .. lib.utils.collections import add_object_to_collection
+from .. lib.utils.cutter_templates import new_cutters
 from .. lib.utils.vertex_groups import (
     get_vert_indexes_in_vert_group,
     remove_verts_from_group)
-from .. lib.utils.utils import mode, vectors_are_close
+from .. lib.utils.utils import mode, rotate_objects, mirror_objects
+from .. lib.utils.uv import project_uvs
 from .. utils.registration import get_prefs
 from .. lib.utils.selection import (
     deselect_all,
-    select)
-from .. lib.turtle.scripts.L_tile import (
+    select,
+    vert_kdtree,
+    select_vert_at)
+from .. lib.bmturtle.scripts.L_Tile import (
     draw_corner_3D,
     draw_corner_wall_core,
     calculate_corner_wall_triangles,
@@ -22,6 +26,28 @@ from . create_tile import MT_Tile
 
 # MIXIN
 class MT_L_Tile:
+    part_dependencies = {
+        'BASE': (
+            'base_blueprint',
+            'live_booleans',
+            'base_size',
+            'tile_size',
+            'angle',
+            'leg_1_len',
+            'leg_2_len'),
+        'CORE': (
+            'main_part_blueprint',
+            'tile_size',
+            'base_size',
+            'angle',
+            'leg_1_len',
+            'leg_2_len',
+            'leg_1_native_subdivisions',
+            'leg_2_native_subdivisions',
+            'width_native_subdivisions',
+            'z_native_subdivisions',
+            'UV_island_margin')}
+
     def create_plain_base(self, tile_props):
         leg_1_len = tile_props.leg_1_len
         leg_2_len = tile_props.leg_2_len
@@ -74,11 +100,11 @@ class MT_L_Tile:
         corner_loc = base.location
         clip_cutter_1 = self.create_openlock_base_clip_cutter(leg_len, corner_loc, 0.25, tile_props)
         select(clip_cutter_1.name)
-        bpy.ops.transform.rotate(
-            value=radians(tile_props.angle - 90),
-            orient_axis='Z',
-            orient_type='GLOBAL',
-            center_override=corner_loc)
+        rotate_objects(
+            bpy.context.selected_editable_objects,
+            radians(tile_props.angle - 90),
+            'Z',
+            corner_loc)
 
         # clip cutters - leg 2
         leg_len = base_triangles['c_adj']
@@ -89,12 +115,12 @@ class MT_L_Tile:
             -0.25,
             tile_props)
         select(clip_cutter_2.name)
-        bpy.ops.transform.mirror(constraint_axis=(False, True, False))
-        bpy.ops.transform.rotate(
-            value=radians(-90),
-            orient_axis='Z',
-            orient_type='GLOBAL',
-            center_override=corner_loc)
+        mirror_objects(bpy.context.selected_editable_objects, 'Y')
+        rotate_objects(
+            bpy.context.selected_editable_objects,
+            radians(-90),
+            'Z',
+            corner_loc)
 
         cutters = [clip_cutter_1, clip_cutter_2]
         for cutter in cutters:
@@ -130,18 +156,17 @@ class MT_L_Tile:
             "openlock.blend")
 
         # load base cutters
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = [
-                'openlock.wall.base.cutter.clip',
-                'openlock.wall.base.cutter.clip.cap.start',
-                'openlock.wall.base.cutter.clip.cap.end']
+        cutter_objs = new_cutters(booleans_path, [
+            'openlock.wall.base.cutter.clip',
+            'openlock.wall.base.cutter.clip.cap.start',
+            'openlock.wall.base.cutter.clip.cap.end'])
 
-        for obj in data_to.objects:
+        for obj in cutter_objs:
             add_object_to_collection(obj, tile_props.tile_name)
 
-        clip_cutter = data_to.objects[0]
-        cutter_start_cap = data_to.objects[1]
-        cutter_end_cap = data_to.objects[2]
+        clip_cutter = cutter_objs[0]
+        cutter_start_cap = cutter_objs[1]
+        cutter_end_cap = cutter_objs[2]
 
         cutter_start_cap.hide_viewport = True
         cutter_end_cap.hide_viewport = True
@@ -208,8 +233,8 @@ class MT_L_Tile:
 
 
 class MT_L_Floor(MT_L_Tile, MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_plain_base(self, tile_props):
         base = MT_L_Tile.create_plain_base(self, tile_props)
@@ -306,15 +331,15 @@ class MT_L_Floor(MT_L_Tile, MT_Tile):
         }
 
         mode('OBJECT')
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+        project_uvs(core, tile_props.UV_island_margin)
         bpy.context.scene.cursor.location = (0, 0, 0)
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
         return core
 
 
 class MT_L_Wall(MT_L_Tile, MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_plain_base(self, tile_props):
         base = MT_L_Tile.create_plain_base(self, tile_props)
@@ -368,10 +393,11 @@ class MT_L_Wall(MT_L_Tile, MT_Tile):
                 cutter.location[1],
                 cutter.location[2])
             select(cutter.name)
-        bpy.ops.transform.rotate(
-            value=radians(tile_props.angle - 90),
-            orient_axis='Z',
-            center_override=cursor.location)
+        rotate_objects(
+            bpy.context.selected_editable_objects,
+            radians(tile_props.angle - 90),
+            'Z',
+            cursor.location)
 
         deselect_all()
 
@@ -482,7 +508,7 @@ class MT_L_Wall(MT_L_Tile, MT_Tile):
         mode('OBJECT')
         bpy.context.scene.cursor.location = (0, 0, 0)
 
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+        project_uvs(core, tile_props.UV_island_margin)
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
         return core
 
@@ -502,14 +528,13 @@ class MT_L_Wall(MT_L_Tile, MT_Tile):
             "openlock.blend")
 
         # load side cutter
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = ['openlock.wall.cutter.side']
+        cutter_objs = new_cutters(booleans_path, ['openlock.wall.cutter.side'])
 
         core_location = core.location.copy()
 
         cutters = []
         # left side cutters
-        left_cutter_bottom = data_to.objects[0].copy()
+        left_cutter_bottom = cutter_objs[0].copy()
         left_cutter_bottom.name = 'X Neg Bottom.' + tile_name
 
         add_object_to_collection(left_cutter_bottom, tile_name)
@@ -545,7 +570,7 @@ class MT_L_Wall(MT_L_Tile, MT_Tile):
 
         # right side cutters
 
-        right_cutter_bottom = data_to.objects[0].copy()
+        right_cutter_bottom = cutter_objs[0].copy()
         right_cutter_bottom.name = 'X Pos Bottom.' + tile_name
 
         add_object_to_collection(right_cutter_bottom, tile_name)
@@ -620,6 +645,9 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
     bm = bmesh.from_edit_mesh(bpy.context.object.data)
     bm.faces.ensure_lookup_table()
 
+    # look verts up by location rather than looping over bm.verts for each coord
+    kd = vert_kdtree(bm)
+
     # Inner and outer faces
     groups = ('Leg 1 Outer', 'Leg 2 Outer', 'Leg 1 Inner', 'Leg 2 Inner')
 
@@ -632,20 +660,14 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
         subdiv_dist = (obj.dimensions[2] - 0.002) / native_subdivisions[3]
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
 
         for index, coord in enumerate(vert_coords):
             vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
 
         i = 0
         while i <= native_subdivisions[3]:
@@ -653,10 +675,7 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
                 vert_coords[index] = Vector((0, 0, subdiv_dist)) + coord
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
             i += 1
 
         bpy.ops.object.vertex_group_assign(ctx)
@@ -673,10 +692,7 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
         subdiv_dist = (obj.dimensions[2] - 0.002) / native_subdivisions[3]
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
 
@@ -687,10 +703,7 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
             vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
 
@@ -703,10 +716,7 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
                 vert_coords[index] = Vector((0, 0, subdiv_dist)) + coord
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
 
@@ -718,10 +728,7 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
             vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
 
@@ -737,15 +744,9 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
     # TODO: Work out why, if we create a corner in Cycles mode, the two lists end up different lengths!
     i = 0
     while i < len(outer_vert_locs) and i < len(inner_vert_locs):
-        for v in bm.verts:
-            if vectors_are_close(v.co, inner_vert_locs[i], 0.0001):
-                v.select = True
-                break
+        select_vert_at(bm, kd, inner_vert_locs[i])
 
-        for v in bm.verts:
-            if vectors_are_close(v.co, outer_vert_locs[i], 0.0001):
-                v.select = True
-                break
+        select_vert_at(bm, kd, outer_vert_locs[i])
 
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
@@ -764,15 +765,9 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
 
     i = 0
     while i < len(outer_vert_locs) and i < len(inner_vert_locs):
-        for v in bm.verts:
-            if (vectors_are_close(v.co, inner_vert_locs[i], 0.0001)):
-                v.select = True
-                break
+        select_vert_at(bm, kd, inner_vert_locs[i])
 
-        for v in bm.verts:
-            if (vectors_are_close(v.co, outer_vert_locs[i], 0.0001)):
-                v.select = True
-                break
+        select_vert_at(bm, kd, outer_vert_locs[i])
 
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
@@ -799,15 +794,9 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
 
     i = 0
     while i < len(outer_vert_locs) and i < len(inner_vert_locs):
-        for v in bm.verts:
-            if vectors_are_close(v.co, inner_vert_locs[i], 0.0001):
-                v.select = True
-                break
+        select_vert_at(bm, kd, inner_vert_locs[i])
 
-        for v in bm.verts:
-            if vectors_are_close(v.co, outer_vert_locs[i], 0.0001):
-                v.select = True
-                break
+        select_vert_at(bm, kd, outer_vert_locs[i])
 
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
@@ -832,14 +821,8 @@ def corner_wall_to_vert_groups(obj, vert_locs, native_subdivisions):
 
     i = 0
     while i < len(outer_vert_locs) and i < len(inner_vert_locs):
-        for v in bm.verts:
-            if vectors_are_close(v.co, inner_vert_locs[i], 0.0001):
-                v.select = True
-                break
-        for v in bm.verts:
-            if vectors_are_close(v.co, outer_vert_locs[i], 0.0001):
-                v.select = True
-                break
+        select_vert_at(bm, kd, inner_vert_locs[i])
+        select_vert_at(bm, kd, outer_vert_locs[i])
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
         for v in bm.verts:
@@ -881,6 +864,9 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
     bm = bmesh.from_edit_mesh(bpy.context.object.data)
     bm.faces.ensure_lookup_table()
 
+    # look verts up by location rather than looping over bm.verts for each coord
+    kd = vert_kdtree(bm)
+
     # Inner and outer faces
     groups = ('Leg 1 Outer', 'Leg 2 Outer', 'Leg 1 Inner', 'Leg 2 Inner')
 
@@ -893,20 +879,14 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
         subdiv_dist = (obj.dimensions[2] - 0.002) / native_subdivisions[3]
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
 
         for index, coord in enumerate(vert_coords):
             vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
 
         i = 0
         while i <= native_subdivisions[3]:
@@ -914,10 +894,7 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
                 vert_coords[index] = Vector((0, 0, subdiv_dist)) + coord
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
             i += 1
 
         bpy.ops.object.vertex_group_assign(ctx)
@@ -934,10 +911,7 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
         subdiv_dist = (obj.dimensions[2] - 0.002) / native_subdivisions[3]
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
 
@@ -948,10 +922,7 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
             vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
 
@@ -964,10 +935,7 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
                 vert_coords[index] = Vector((0, 0, subdiv_dist)) + coord
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
 
@@ -979,10 +947,7 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
             vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
         for coord in vert_coords:
-            for v in bm.verts:
-                if (vectors_are_close(v.co, coord, 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, coord)
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
 
@@ -997,15 +962,9 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
 
     i = 0
     while i < len(outer_vert_locs) and i < len(inner_vert_locs):
-        for v in bm.verts:
-            if vectors_are_close(v.co, inner_vert_locs[i], 0.0001):
-                v.select = True
-                break
+        select_vert_at(bm, kd, inner_vert_locs[i])
 
-        for v in bm.verts:
-            if vectors_are_close(v.co, outer_vert_locs[i], 0.0001):
-                v.select = True
-                break
+        select_vert_at(bm, kd, outer_vert_locs[i])
 
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
@@ -1024,15 +983,9 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
 
     i = 0
     while i < len(outer_vert_locs) and i < len(inner_vert_locs):
-        for v in bm.verts:
-            if (vectors_are_close(v.co, inner_vert_locs[i], 0.0001)):
-                v.select = True
-                break
+        select_vert_at(bm, kd, inner_vert_locs[i])
 
-        for v in bm.verts:
-            if (vectors_are_close(v.co, outer_vert_locs[i], 0.0001)):
-                v.select = True
-                break
+        select_vert_at(bm, kd, outer_vert_locs[i])
 
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
@@ -1059,15 +1012,9 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
 
     i = 0
     while i < len(outer_vert_locs) and i < len(inner_vert_locs):
-        for v in bm.verts:
-            if (vectors_are_close(v.co, inner_vert_locs[i], 0.0005)):
-                v.select = True
-                break
+        select_vert_at(bm, kd, inner_vert_locs[i], 0.0005)
 
-        for v in bm.verts:
-            if (vectors_are_close(v.co, outer_vert_locs[i], 0.0005)):
-                v.select = True
-                break
+        select_vert_at(bm, kd, outer_vert_locs[i], 0.0005)
 
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
@@ -1092,13 +1039,9 @@ def corner_floor_to_vert_groups(obj, vert_locs, native_subdivisions):
 
     i = 0
     while i < len(outer_vert_locs) and i < len(inner_vert_locs):
-        for v in bm.verts:
-            if vectors_are_close(v.co, inner_vert_locs[i], 0.0005):
-                v.select = True
+        select_vert_at(bm, kd, inner_vert_locs[i], 0.0005)
 
-        for v in bm.verts:
-            if vectors_are_close(v.co, outer_vert_locs[i], 0.0005):
-                v.select = True
+        select_vert_at(bm, kd, outer_vert_locs[i], 0.0005)
 
         bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
         bpy.ops.object.vertex_group_assign(ctx)
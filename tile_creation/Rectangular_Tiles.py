@@ -3,16 +3,31 @@ import math
 import bpy
 from mathutils import Vector
 from . create_tile import MT_Tile
-from .. lib.turtle.scripts.primitives import draw_cuboid
+from .. lib.bmturtle.scripts.primitives import draw_cuboid
 from .. lib.utils.collections import add_object_to_collection
+from .. lib.utils.cutter_templates import new_cutters
 from .. lib.utils.utils import mode
 from .. utils.registration import get_prefs
-from .. lib.turtle.scripts.straight_tile import draw_rectangular_floor_core
-from .. lib.turtle.scripts.openlock_floor_base import draw_openlock_rect_floor_base
-from .. lib.utils.selection import deselect_all, select_by_loc
+from .. lib.bmturtle.scripts.grid_core import draw_rectangular_floor_core
+from .. lib.bmturtle.scripts.openlock_floor_base import draw_openlock_rect_floor_base
 
 
 class MT_Rectangular_Tile:
+    part_dependencies = {
+        'BASE': (
+            'base_blueprint',
+            'live_booleans',
+            'base_size',
+            'tile_size'),
+        'CORE': (
+            'main_part_blueprint',
+            'tile_size',
+            'base_size',
+            'x_native_subdivisions',
+            'y_native_subdivisions',
+            'z_native_subdivisions',
+            'UV_island_margin')}
+
     def create_plain_base(self, tile_props):
         base_size = tile_props.base_size
         tile_name = tile_props.tile_name
@@ -108,18 +123,17 @@ class MT_Rectangular_Tile:
             "booleans",
             "openlock.blend")
 
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = [
-                'openlock.wall.base.cutter.clip',
-                'openlock.wall.base.cutter.clip.cap.start',
-                'openlock.wall.base.cutter.clip.cap.end']
+        cutter_objs = new_cutters(booleans_path, [
+            'openlock.wall.base.cutter.clip',
+            'openlock.wall.base.cutter.clip.cap.start',
+            'openlock.wall.base.cutter.clip.cap.end'])
 
-        for obj in data_to.objects:
+        for obj in cutter_objs:
             add_object_to_collection(obj, tile_props.tile_name)
 
-        clip_cutter = data_to.objects[0]
-        cutter_start_cap = data_to.objects[1]
-        cutter_end_cap = data_to.objects[2]
+        clip_cutter = cutter_objs[0]
+        cutter_start_cap = cutter_objs[1]
+        cutter_end_cap = cutter_objs[2]
 
         cutter_start_cap.hide_viewport = True
         cutter_end_cap.hide_viewport = True
@@ -200,8 +214,8 @@ class MT_Rectangular_Tile:
 
 
 class MT_Rectangular_Floor_Tile(MT_Rectangular_Tile, MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_empty_base(self, tile_props):
         tile_props.base_size = (
@@ -257,7 +271,8 @@ class MT_Rectangular_Floor_Tile(MT_Rectangular_Tile, MT_Tile):
             [tile_size[0],
              tile_size[1],
              tile_size[2] - base_size[2]],
-            native_subdivisions)
+            native_subdivisions,
+            tile_props.UV_island_margin)
 
         core.name = tile_name + '.core'
         add_object_to_collection(core, tile_name)
@@ -271,123 +286,9 @@ class MT_Rectangular_Floor_Tile(MT_Rectangular_Tile, MT_Tile):
         }
 
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
-
-        rect_floor_to_vert_groups(core)
 
         obj_props = core.mt_object_props
         obj_props.is_mt_object = True
         obj_props.tile_name = tile_props.tile_name
 
         return core
-
-
-def rect_floor_to_vert_groups(obj):
-    """makes a vertex group for each side of floor
-    and assigns vertices to it. Corrects for displacement map distortion"""
-
-    mode('OBJECT')
-    dim = obj.dimensions / 2
-
-    # get original location of object origin and of cursor
-    obj_original_loc = obj.location.copy()
-    cursor_original_loc = bpy.context.scene.cursor.location.copy()
-
-    # set origin to center of bounds
-    bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-    # make vertex groups
-    obj.vertex_groups.new(name='Left')
-    obj.vertex_groups.new(name='Right')
-    obj.vertex_groups.new(name='Front')
-    obj.vertex_groups.new(name='Back')
-    obj.vertex_groups.new(name='Top')
-    obj.vertex_groups.new(name='Bottom')
-
-    mode('EDIT')
-
-    # select X- and assign to X-
-    select_by_loc(
-        lbound=[-dim[0], -dim[1], -dim[2]],
-        ubound=[-dim[0] + 0.001, dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-
-    bpy.ops.object.vertex_group_set_active(group='Left')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select X+ and assign to X+
-    select_by_loc(
-        lbound=[dim[0] - 0.001, -dim[1], -dim[2]],
-        ubound=[dim[0], dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Right')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Y- and assign to Y-
-    select_by_loc(
-        lbound=[-dim[0], -dim[1], -dim[2]],
-        ubound=[dim[0], -dim[1] + 0.001, dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Front')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Y+ and assign to Y+
-    select_by_loc(
-        lbound=[-dim[0], dim[1] - 0.001, -dim[2]],
-        ubound=[dim[0], dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Back')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Z- and assign to Z-
-    select_by_loc(
-        lbound=[-dim[0] + 0.001, -dim[1] + 0.001, -dim[2]],
-        ubound=[dim[0] - 0.001, dim[1] - 0.001, -dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Bottom')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Z+ and assign to Z+
-    select_by_loc(
-        lbound=[-dim[0] + 0.001, -dim[1] + 0.001, dim[2]],
-        ubound=[dim[0] - 0.001, dim[1] - 0.001, dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Top')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    mode('OBJECT')
-
-    # reset cursor and object origin
-    bpy.context.scene.cursor.location = obj_original_loc
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-    bpy.context.scene.cursor.location = cursor_original_loc
@@ -3,25 +3,49 @@ from math import radians
 import bpy
 from . create_tile import MT_Tile
 
-from .. lib.turtle.scripts.curved_floor import (
+from .. lib.bmturtle.scripts.curved_floor import (
     draw_neg_curved_slab,
     draw_pos_curved_slab,
     draw_openlock_pos_curved_base)
-from .. lib.turtle.scripts.L_tile import (
+from .. lib.bmturtle.scripts.L_Tile import (
     calculate_corner_wall_triangles,
     move_cursor_to_wall_start,
     draw_corner_3D)
-from .. lib.utils.vertex_groups import (
-    get_vert_indexes_in_vert_group,
-    remove_verts_from_group
-)
 from .. utils.registration import get_prefs
-from .. lib.utils.selection import select, deselect_all, select_by_loc, select_inverse_by_loc
-from .. lib.utils.utils import mode
+from .. lib.utils.selection import select, deselect_all
+from .. lib.utils.utils import mode, rotate_objects
 from .. lib.utils.collections import add_object_to_collection
+from .. lib.utils.cutter_templates import new_cutters
+from .. lib.utils.uv import project_uvs
 
 
 class MT_Semi_Circ_Tile:
+    part_dependencies = {
+        'BASE': (
+            'base_blueprint',
+            'live_booleans',
+            'base_size',
+            'tile_size',
+            'angle',
+            'base_radius',
+            'curve_type',
+            'curve_native_subdivisions',
+            'x_native_subdivisions',
+            'y_native_subdivisions',
+            'z_native_subdivisions'),
+        'CORE': (
+            'main_part_blueprint',
+            'tile_size',
+            'base_size',
+            'angle',
+            'base_radius',
+            'curve_type',
+            'curve_native_subdivisions',
+            'x_native_subdivisions',
+            'y_native_subdivisions',
+            'z_native_subdivisions',
+            'UV_island_margin')}
+
     def create_plain_base(self, tile_props):
         radius = tile_props.base_radius
         segments = tile_props.curve_native_subdivisions
@@ -185,17 +209,17 @@ class MT_Semi_Circ_Tile:
                 preferences.assets_path,
                 "meshes", "booleans", "openlock.blend")
 
-            with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-                data_to.objects = ['openlock.wall.base.cutter.clip',
-                                   'openlock.wall.base.cutter.clip.cap.start',
-                                   'openlock.wall.base.cutter.clip.cap.end']
+            cutter_objs = new_cutters(booleans_path, [
+                'openlock.wall.base.cutter.clip',
+                'openlock.wall.base.cutter.clip.cap.start',
+                'openlock.wall.base.cutter.clip.cap.end'])
 
-            for obj in data_to.objects:
+            for obj in cutter_objs:
                 add_object_to_collection(obj, tile_props.tile_name)
 
-            clip_cutter_1 = data_to.objects[0]
-            cutter_start_cap = data_to.objects[1]
-            cutter_end_cap = data_to.objects[2]
+            clip_cutter_1 = cutter_objs[0]
+            cutter_start_cap = cutter_objs[1]
+            cutter_end_cap = cutter_objs[2]
 
             cutter_start_cap.hide_viewport = True
             cutter_end_cap.hide_viewport = True
@@ -225,11 +249,11 @@ class MT_Semi_Circ_Tile:
             deselect_all()
             select(clip_cutter_1.name)
 
-            bpy.ops.transform.rotate(
-                value=(radians(angle - 90)),
-                orient_axis='Z',
-                orient_type='GLOBAL',
-                center_override=cursor_orig_loc)
+            rotate_objects(
+                bpy.context.selected_editable_objects,
+                radians(angle - 90),
+                'Z',
+                cursor_orig_loc)
 
             cutters.append(clip_cutter_1)
             # cutter 2
@@ -259,9 +283,8 @@ class MT_Semi_Circ_Tile:
             deselect_all()
 
         if tile_props.curve_type == 'POS':
-            with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-                data_to.objects = ['openlock.wall.base.cutter.clip_single']
-            clip_cutter_3 = data_to.objects[0]
+            cutter_objs = new_cutters(booleans_path, ['openlock.wall.base.cutter.clip_single'])
+            clip_cutter_3 = cutter_objs[0]
             add_object_to_collection(clip_cutter_3, tile_props.tile_name)
 
             deselect_all()
@@ -269,11 +292,11 @@ class MT_Semi_Circ_Tile:
 
             clip_cutter_3.rotation_euler = (0, 0, radians(180))
             clip_cutter_3.location[1] = cursor_orig_loc[1] + radius - 0.25
-            bpy.ops.transform.rotate(
-                value=(radians(angle / 2)),
-                orient_axis='Z',
-                orient_type='GLOBAL',
-                center_override=cursor_orig_loc)
+            rotate_objects(
+                bpy.context.selected_editable_objects,
+                radians(angle / 2),
+                'Z',
+                cursor_orig_loc)
 
             cutters.append(clip_cutter_3)
 
@@ -287,8 +310,8 @@ class MT_Semi_Circ_Tile:
 
 
 class MT_Semi_Circ_Floor_Tile(MT_Semi_Circ_Tile, MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
         if tile_props.tile_blueprint == 'OPENLOCK' or \
                 tile_props.base_blueprint == 'OPENLOCK':
@@ -340,24 +363,13 @@ class MT_Semi_Circ_Floor_Tile(MT_Semi_Circ_Tile, MT_Tile):
                 angle,
                 height,
                 native_subdivisions)
-            curved_floor_to_vert_groups(
-                core,
-                height,
-                radius)
         else:
-            core, vert_locs = draw_neg_curved_slab(
+            core = draw_neg_curved_slab(
                 radius,
                 segments,
                 angle,
                 height,
-                native_subdivisions,
-                return_vert_locs=True)
-            neg_curved_floor_to_vert_groups(
-                core,
-                height,
-                radius,
-                vert_locs
-            )
+                native_subdivisions)
 
         core.location[2] = core.location[2] + base_size[2]
         core.name = tile_props.tile_name + '.core'
@@ -369,7 +381,7 @@ class MT_Semi_Circ_Floor_Tile(MT_Semi_Circ_Tile, MT_Tile):
             'active_object': core
         }
 
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+        project_uvs(core, tile_props.UV_island_margin)
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
 
         obj_props = core.mt_object_props
@@ -377,213 +389,3 @@ class MT_Semi_Circ_Floor_Tile(MT_Semi_Circ_Tile, MT_Tile):
         obj_props.tile_name = tile_props.tile_name
         return core
 
-
-def neg_curved_floor_to_vert_groups(obj, height, side_length, vert_locs):
-    ctx = {
-        'object': obj,
-        'active_object': obj,
-        'selected_objects': [obj]
-    }
-
-    obj.vertex_groups.new(name='Side a')
-    obj.vertex_groups.new(name='Side b')
-    obj.vertex_groups.new(name='Side c')
-    obj.vertex_groups.new(name='Bottom')
-    obj.vertex_groups.new(name='Top')
-    select(obj.name)
-    mode('EDIT')
-    deselect_all()
-
-    select_by_loc(
-        lbound=(obj.location),
-        ubound=(
-            obj.location[0] + side_length,
-            obj.location[1] + side_length,
-            obj.location[2]),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-    bpy.ops.object.vertex_group_set_active(group='Bottom')
-    bpy.ops.object.vertex_group_assign()
-    deselect_all()
-
-    select_by_loc(
-        lbound=(
-            obj.location[0],
-            obj.location[1],
-            obj.location[2] + height),
-        ubound=(
-            obj.location[0] + side_length,
-            obj.location[1] + side_length,
-            obj.location[2] + height),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-    bpy.ops.object.vertex_group_set_active(group='Top')
-    bpy.ops.object.vertex_group_assign()
-    deselect_all()
-
-    for key, value in vert_locs.items():
-        if key == 'side_a':
-            for v in value:
-                select_by_loc(
-                    lbound=v,
-                    ubound=(v[0], v[1], v[2] + height),
-                    select_mode='VERT',
-                    coords='GLOBAL',
-                    additive=True,
-                    buffer=0.0001
-                )
-
-    select_by_loc(
-        lbound=(
-            obj.location[0],
-            obj.location[1] + side_length,
-            obj.location[2]),
-        ubound=(
-            obj.location[0],
-            obj.location[1] + side_length,
-            obj.location[2] + height),
-        buffer=0.0001,
-        additive=True,
-        coords='GLOBAL'
-    )
-
-    bpy.ops.object.vertex_group_set_active(ctx, group='Side a')
-    bpy.ops.object.vertex_group_assign(ctx)
-    deselect_all()
-
-    # side b
-    select_by_loc(
-        lbound=(
-            obj.location[0],
-            obj.location[1],
-            obj.location[2]),
-        ubound=(
-            obj.location[0],
-            obj.location[1] + side_length,
-            obj.location[2] + height),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-
-    bpy.ops.object.vertex_group_set_active(group='Side b')
-    bpy.ops.object.vertex_group_assign()
-    deselect_all()
-
-    select_by_loc(
-        lbound=(
-            obj.location[0],
-            obj.location[1],
-            obj.location[2]),
-        ubound=(
-            obj.location[0] + side_length,
-            obj.location[1],
-            obj.location[2] + height),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side c')
-    bpy.ops.object.vertex_group_assign()
-    deselect_all()
-
-    mode('OBJECT')
-
-    # get verts in side groups
-    side_groups = ['Side a', 'Side b', 'Side c']
-    side_vert_indices = []
-
-    for group in side_groups:
-        verts = get_vert_indexes_in_vert_group(group, bpy.context.object)
-        side_vert_indices.extend(verts)
-
-    remove_verts_from_group('Top', bpy.context.object, side_vert_indices)
-
-
-def curved_floor_to_vert_groups(obj, height, side_length):
-    obj.vertex_groups.new(name='Side a')
-    obj.vertex_groups.new(name='Side b')
-    obj.vertex_groups.new(name='Side c')
-    obj.vertex_groups.new(name='Bottom')
-    obj.vertex_groups.new(name='Top')
-    select(obj.name)
-    mode('EDIT')
-
-    deselect_all()
-    select_by_loc(
-        lbound=(obj.location),
-        ubound=(
-            obj.location[0] + side_length,
-            obj.location[1] + side_length,
-            obj.location[2]),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-    bpy.ops.object.vertex_group_set_active(group='Bottom')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=(
-            obj.location[0],
-            obj.location[1],
-            obj.location[2] + height),
-        ubound=(
-            obj.location[0] + side_length,
-            obj.location[1] + side_length,
-            obj.location[2] + height),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-    bpy.ops.object.vertex_group_set_active(group='Top')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=(
-            obj.location[0],
-            obj.location[1],
-            obj.location[2]),
-        ubound=(
-            obj.location[0] + side_length,
-            obj.location[1],
-            obj.location[2] + height),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side c')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_by_loc(
-        lbound=(
-            obj.location[0],
-            obj.location[1],
-            obj.location[2]),
-        ubound=(
-            obj.location[0],
-            obj.location[1] + side_length,
-            obj.location[2] + height),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side b')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    select_inverse_by_loc(
-        lbound=(
-            obj.location[0],
-            obj.location[1],
-            obj.location[2]),
-        ubound=(
-            obj.location[0],
-            obj.location[1],
-            obj.location[2] + height),
-        buffer=0.0001,
-        coords='GLOBAL'
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side a')
-    bpy.ops.object.vertex_group_assign()
-
-    mode('OBJECT')
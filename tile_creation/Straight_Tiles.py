@@ -6,15 +6,30 @@ import bpy
 from . create_tile import MT_Tile
 from .. utils.registration import get_prefs
 from .. lib.utils.collections import add_object_to_collection
-from .. lib.turtle.scripts.primitives import draw_cuboid
-from .. lib.turtle.scripts.straight_tile import draw_straight_floor_core, draw_straight_wall_core
+from .. lib.utils.cutter_templates import new_cutters
+from .. lib.bmturtle.scripts.primitives import draw_cuboid
+from .. lib.bmturtle.scripts.grid_core import draw_straight_floor_core, draw_straight_wall_core
 from .. lib.utils.utils import mode
-from .. lib.utils.selection import deselect_all, select_by_loc
-from .Rectangular_Tiles import rect_floor_to_vert_groups
 
 
 # MIXIN
 class MT_Straight_Tile:
+    part_dependencies = {
+        'BASE': (
+            'base_blueprint',
+            'live_booleans',
+            'main_part_blueprint',
+            'base_size',
+            'tile_size'),
+        'CORE': (
+            'main_part_blueprint',
+            'tile_size',
+            'base_size',
+            'x_native_subdivisions',
+            'y_native_subdivisions',
+            'z_native_subdivisions',
+            'UV_island_margin')}
+
     def create_plain_base(self, tile_props):
         base_size = tile_props.base_size
         tile_name = tile_props.tile_name
@@ -143,18 +158,17 @@ class MT_Straight_Tile:
             "openlock.blend")
 
         # load base cutters
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = [
-                'openlock.wall.base.cutter.clip',
-                'openlock.wall.base.cutter.clip.cap.start',
-                'openlock.wall.base.cutter.clip.cap.end']
+        cutter_objs = new_cutters(booleans_path, [
+            'openlock.wall.base.cutter.clip',
+            'openlock.wall.base.cutter.clip.cap.start',
+            'openlock.wall.base.cutter.clip.cap.end'])
 
-        for obj in data_to.objects:
+        for obj in cutter_objs:
             add_object_to_collection(obj, tile_props.tile_name)
 
-        clip_cutter = data_to.objects[0]
-        cutter_start_cap = data_to.objects[1]
-        cutter_end_cap = data_to.objects[2]
+        clip_cutter = cutter_objs[0]
+        cutter_start_cap = cutter_objs[1]
+        cutter_end_cap = cutter_objs[2]
 
         cutter_start_cap.hide_viewport = True
         cutter_end_cap.hide_viewport = True
@@ -181,8 +195,8 @@ class MT_Straight_Tile:
 
 
 class MT_Straight_Floor_Tile(MT_Straight_Tile, MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_plain_base(self, tile_props):
         """Returns a plain base for a straight wall tile
@@ -245,7 +259,8 @@ class MT_Straight_Floor_Tile(MT_Straight_Tile, MT_Tile):
             [tile_size[0],
              tile_size[1],
              tile_size[2] - base_size[2]],
-            native_subdivisions)
+            native_subdivisions,
+            tile_props.UV_island_margin)
 
         core.name = tile_name + '.core'
         add_object_to_collection(core, tile_name)
@@ -262,9 +277,6 @@ class MT_Straight_Floor_Tile(MT_Straight_Tile, MT_Tile):
         }
 
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
-
-        rect_floor_to_vert_groups(core)
 
         obj_props = core.mt_object_props
         obj_props.is_mt_object = True
@@ -275,8 +287,8 @@ class MT_Straight_Floor_Tile(MT_Straight_Tile, MT_Tile):
 
 class MT_Straight_Wall_Tile(MT_Straight_Tile, MT_Tile):
 
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_plain_base(self, tile_props):
         """Returns a plain base for a straight wall tile
@@ -365,7 +377,8 @@ class MT_Straight_Wall_Tile(MT_Straight_Tile, MT_Tile):
             [tile_size[0],
              tile_size[1],
              tile_size[2] - base_size[2]],
-            native_subdivisions)
+            native_subdivisions,
+            tile_props.UV_island_margin)
 
         core.name = tile_name + '.core'
         add_object_to_collection(core, tile_name)
@@ -383,9 +396,6 @@ class MT_Straight_Wall_Tile(MT_Straight_Tile, MT_Tile):
         }
 
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
-
-        straight_wall_to_vert_groups(core)
 
         obj_props = core.mt_object_props
         obj_props.is_mt_object = True
@@ -409,14 +419,13 @@ class MT_Straight_Wall_Tile(MT_Straight_Tile, MT_Tile):
             "openlock.blend")
 
         # load side cutter
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = ['openlock.wall.cutter.side']
+        cutter_objs = new_cutters(booleans_path, ['openlock.wall.cutter.side'])
 
         core_location = core.location.copy()
 
         cutters = []
         # left side cutters
-        left_cutter_bottom = data_to.objects[0].copy()
+        left_cutter_bottom = cutter_objs[0].copy()
         left_cutter_bottom.name = 'X Neg Bottom.' + tile_name
 
         add_object_to_collection(left_cutter_bottom, tile_name)
@@ -452,7 +461,7 @@ class MT_Straight_Wall_Tile(MT_Straight_Tile, MT_Tile):
 
         # right side cutters
 
-        right_cutter_bottom = data_to.objects[0].copy()
+        right_cutter_bottom = cutter_objs[0].copy()
         right_cutter_bottom.name = 'X Pos Bottom.' + tile_name
 
         add_object_to_collection(right_cutter_bottom, tile_name)
@@ -488,114 +497,3 @@ class MT_Straight_Wall_Tile(MT_Straight_Tile, MT_Tile):
         cutters.extend([right_cutter_bottom, right_cutter_top])
 
         return cutters
-
-
-def straight_wall_to_vert_groups(obj):
-    """makes a vertex group for each side of wall
-    and assigns vertices to it. Corrects for displacement map distortion"""
-
-    mode('OBJECT')
-    dim = obj.dimensions / 2
-
-    # get original location of object origin and of cursor
-    obj_original_loc = obj.location.copy()
-    cursor_original_loc = bpy.context.scene.cursor.location.copy()
-
-    # set origin to center of bounds
-    bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-    # make vertex groups
-    obj.vertex_groups.new(name='Left')
-    obj.vertex_groups.new(name='Right')
-    obj.vertex_groups.new(name='Front')
-    obj.vertex_groups.new(name='Back')
-    obj.vertex_groups.new(name='Top')
-    obj.vertex_groups.new(name='Bottom')
-
-    mode('EDIT')
-
-    # select X- and assign to X-
-    select_by_loc(
-        lbound=[-dim[0] - 0.01, -dim[1], -dim[2] + 0.001],
-        ubound=[-dim[0] + 0.01, dim[1], dim[2] - 0.001],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-
-    bpy.ops.object.vertex_group_set_active(group='Left')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select X+ and assign to X+
-    select_by_loc(
-        lbound=[dim[0] - 0.01, -dim[1], -dim[2] + 0.001],
-        ubound=[dim[0] + 0.01, dim[1], dim[2] - 0.001],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Right')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Y- and assign to Y-
-    select_by_loc(
-        lbound=[-dim[0] + 0.001, -dim[1], -dim[2] + 0.001],
-        ubound=[dim[0] - 0.001, -dim[1], dim[2] - 0.001],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Front')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Y+ and assign to Y+
-    select_by_loc(
-        lbound=[-dim[0] + 0.001, dim[1], -dim[2] + 0.001],
-        ubound=[dim[0] - 0.001, dim[1], dim[2] - 0.001],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Back')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Z- and assign to Z-
-    select_by_loc(
-        lbound=[-dim[0] + 0.001, -dim[1], -dim[2]],
-        ubound=[dim[0] - 0.001, dim[1], -dim[2] + 0.01],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Bottom')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    # select Z+ and assign to Z+
-    select_by_loc(
-        lbound=[-dim[0] + 0.001, -dim[1], dim[2] - 0.012],
-        ubound=[dim[0] - 0.001, dim[1], dim[2]],
-        select_mode='VERT',
-        coords='LOCAL',
-        buffer=0.0001,
-        additive=True)
-    bpy.ops.object.vertex_group_set_active(group='Top')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-
-    mode('OBJECT')
-
-    # reset cursor and object origin
-    bpy.context.scene.cursor.location = obj_original_loc
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-    bpy.context.scene.cursor.location = cursor_original_loc
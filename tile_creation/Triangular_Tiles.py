@@ -3,21 +3,40 @@ from math import radians
 import bpy
 from . create_tile import MT_Tile
 from .. utils.registration import get_prefs
-from .. lib.turtle.scripts.triangular_tile import (
+from .. lib.bmturtle.scripts.triangular_tile import (
     draw_plain_triangular_base,
     draw_tri_floor_core,
     draw_openlock_tri_floor_base)
 from .. lib.utils.collections import add_object_to_collection
-from .. lib.utils.utils import mode
-from .. lib.utils.selection import select, deselect_all, select_by_loc
-from .. lib.utils.vertex_groups import (
-    get_vert_indexes_in_vert_group,
-    remove_verts_from_group)
+from .. lib.utils.cutter_templates import new_cutters
+from .. lib.utils.utils import mode, rotate_objects
+from .. lib.utils.selection import select, deselect_all
+from .. lib.utils.uv import project_uvs
 
 
 class MT_Triangular_Floor_Tile(MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    part_dependencies = {
+        'BASE': (
+            'base_blueprint',
+            'live_booleans',
+            'base_size',
+            'tile_size',
+            'angle',
+            'leg_1_len',
+            'leg_2_len'),
+        'CORE': (
+            'main_part_blueprint',
+            'tile_size',
+            'base_size',
+            'angle',
+            'leg_1_len',
+            'leg_2_len',
+            'opposite_native_subdivisions',
+            'z_native_subdivisions',
+            'UV_island_margin')}
+
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_plain_base(self, tile_props):
         tile_name = tile_props.tile_name
@@ -110,15 +129,6 @@ class MT_Triangular_Floor_Tile(MT_Tile):
         core.name = tile_name + '.core'
         add_object_to_collection(core, tile_name)
 
-        tri_floor_to_vert_groups(
-            core,
-            dimensions,
-            tile_props.tile_size[2] - tile_props.base_size[2],
-            tile_props.base_size[2],
-            native_subdivisions)
-
-        mode('OBJECT')
-
         core.location[2] = core.location[2] + tile_props.base_size[2]
 
         ctx = {
@@ -128,7 +138,7 @@ class MT_Triangular_Floor_Tile(MT_Tile):
         }
 
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+        project_uvs(core, tile_props.UV_island_margin)
         obj_props = core.mt_object_props
         obj_props.is_mt_object = True
         obj_props.tile_name = tile_props.tile_name
@@ -147,18 +157,17 @@ class MT_Triangular_Floor_Tile(MT_Tile):
                 "openlock.blend")
 
             cutters = []
-            with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-                data_to.objects = [
-                    'openlock.wall.base.cutter.clip',
-                    'openlock.wall.base.cutter.clip.cap.start',
-                    'openlock.wall.base.cutter.clip.cap.end']
+            cutter_objs = new_cutters(booleans_path, [
+                'openlock.wall.base.cutter.clip',
+                'openlock.wall.base.cutter.clip.cap.start',
+                'openlock.wall.base.cutter.clip.cap.end'])
 
-            for obj in data_to.objects:
+            for obj in cutter_objs:
                 add_object_to_collection(obj, tile_props.tile_name)
 
-            clip_cutter_1 = data_to.objects[0]
-            cutter_start_cap = data_to.objects[1]
-            cutter_end_cap = data_to.objects[2]
+            clip_cutter_1 = cutter_objs[0]
+            cutter_start_cap = cutter_objs[1]
+            cutter_end_cap = cutter_objs[2]
 
             cutter_start_cap.hide_viewport = True
             cutter_end_cap.hide_viewport = True
@@ -198,11 +207,11 @@ class MT_Triangular_Floor_Tile(MT_Tile):
 
                 deselect_all()
                 select(clip_cutter_1.name)
-                bpy.ops.transform.rotate(
-                    value=(radians(dimensions['A'] - 90)),
-                    orient_axis='Z',
-                    orient_type='GLOBAL',
-                    center_override=dimensions['loc_A'])
+                rotate_objects(
+                    bpy.context.selected_editable_objects,
+                    radians(dimensions['A'] - 90),
+                    'Z',
+                    dimensions['loc_A'])
 
                 deselect_all()
 
@@ -274,11 +283,11 @@ class MT_Triangular_Floor_Tile(MT_Tile):
                 deselect_all()
                 select(clip_cutter_3.name)
 
-                bpy.ops.transform.rotate(
-                    value=(-radians(90 + dimensions['C'])),
-                    orient_axis='Z',
-                    orient_type='GLOBAL',
-                    center_override=dimensions['loc_C'])
+                rotate_objects(
+                    bpy.context.selected_editable_objects,
+                    -radians(90 + dimensions['C']),
+                    'Z',
+                    dimensions['loc_C'])
 
                 deselect_all()
                 cutters.append(clip_cutter_3)
@@ -288,136 +297,3 @@ class MT_Triangular_Floor_Tile(MT_Tile):
         else:
             return None
 
-
-def tri_floor_to_vert_groups(obj, dim, height, base_height, native_subdivisions):
-    # make vertex groups
-    obj.vertex_groups.new(name='Top')
-    obj.vertex_groups.new(name='Bottom')
-    obj.vertex_groups.new(name='Side a')
-    obj.vertex_groups.new(name='Side b')
-    obj.vertex_groups.new(name='Side c')
-
-    mode('EDIT')
-
-    deselect_all()
-    select_by_loc(
-        lbound=(
-            dim['loc_A'][0],
-            dim['loc_A'][1],
-            dim['loc_A'][2] + height),
-        ubound=(
-            dim['loc_B'][0] + dim['a'],
-            dim['loc_B'][1],
-            dim['loc_B'][2] + height),
-        buffer=0.0001,
-        select_mode='FACE'
-    )
-
-    bpy.ops.object.vertex_group_set_active(group='Top')
-    bpy.ops.object.vertex_group_assign()
-    deselect_all()
-
-    select_by_loc(
-        lbound=(
-            dim['loc_A'][0],
-            dim['loc_A'][1],
-            dim['loc_A'][2]),
-        ubound=(
-            dim['loc_B'][0] + dim['a'],
-            dim['loc_B'][1],
-            dim['loc_B'][2]),
-    )
-    bpy.ops.object.vertex_group_set_active(group='Bottom')
-    bpy.ops.object.vertex_group_assign()
-    deselect_all()
-
-    subdivided_height = height / native_subdivisions[1]
-    bpy.ops.object.vertex_group_set_active(group='Side a')
-    i = 0
-    while i <= native_subdivisions[1]:
-        select_by_loc(
-            lbound=(
-                dim['loc_C'][0],
-                dim['loc_C'][1],
-                dim['loc_C'][2] + (subdivided_height * i)),
-            ubound=(
-                dim['loc_C'][0],
-                dim['loc_C'][1],
-                dim['loc_C'][2] + (subdivided_height * i)),
-            buffer=0.0001,
-            additive=True
-        )
-
-        select_by_loc(
-            lbound=(
-                dim['loc_B'][0],
-                dim['loc_B'][1],
-                dim['loc_B'][2] + (subdivided_height * i)),
-            ubound=(
-                dim['loc_B'][0],
-                dim['loc_B'][1],
-                dim['loc_B'][2] + (subdivided_height * i)),
-            buffer=0.0001,
-            additive=True
-        )
-        bpy.ops.mesh.shortest_path_select(edge_mode='SELECT')
-        bpy.ops.object.vertex_group_assign()
-        deselect_all()
-        i += 1
-
-    bpy.ops.object.vertex_group_set_active(group='Side b')
-
-    i = 0
-    while i <= native_subdivisions[1]:
-        select_by_loc(
-            lbound=(
-                dim['loc_A'][0],
-                dim['loc_A'][1],
-                dim['loc_A'][2] + (subdivided_height * i)),
-            ubound=(
-                dim['loc_A'][0],
-                dim['loc_A'][1],
-                dim['loc_A'][2] + (subdivided_height * i)),
-            additive=True,
-            buffer=0.0001
-        )
-
-        select_by_loc(
-            lbound=(
-                dim['loc_C'][0],
-                dim['loc_C'][1],
-                dim['loc_C'][2] + (subdivided_height * i)),
-            ubound=(
-                dim['loc_C'][0],
-                dim['loc_C'][1],
-                dim['loc_C'][2] + (subdivided_height * i)),
-            buffer=0.0001,
-            additive=True
-        )
-        bpy.ops.mesh.shortest_path_select(edge_mode='SELECT')
-        bpy.ops.object.vertex_group_assign()
-        deselect_all()
-        i += 1
-
-    select_by_loc(
-        lbound=dim['loc_A'],
-        ubound=(
-            dim['loc_B'][0],
-            dim['loc_B'][1],
-            dim['loc_B'][2] + base_height),
-        buffer=0.0001
-    )
-    bpy.ops.object.vertex_group_set_active(group='Side c')
-    bpy.ops.object.vertex_group_assign()
-
-    deselect_all()
-    mode('OBJECT')
-
-    side_verts = []
-    sides = ['Side a', 'Side b', 'Side c']
-
-    for side in sides:
-        verts = get_vert_indexes_in_vert_group(side, bpy.context.object)
-        side_verts.extend(verts)
-
-    remove_verts_from_group('Top', bpy.context.object, side_verts)
@@ -3,16 +3,42 @@ from math import radians
 import bpy
 import bmesh
 from mathutils import Vector
-from .. lib.utils.utils import mode, vectors_are_close
+from .. lib.utils.utils import mode
 from .. utils.registration import get_prefs
 from .. lib.utils.selection import (
     deselect_all,
-    select)
+    select,
+    vert_kdtree,
+    select_vert_at)
 from . create_tile import MT_Tile
 from .. lib.utils.collections import add_object_to_collection
+from .. lib.utils.cutter_templates import new_cutters
+from .. lib.utils.uv import project_uvs
 
 #MIXIN
 class MT_U_Tile:
+    part_dependencies = {
+        'BASE': (
+            'base_blueprint',
+            'live_booleans',
+            'base_size',
+            'tile_size',
+            'leg_1_len',
+            'leg_2_len',
+            'base_socket_side'),
+        'CORE': (
+            'main_part_blueprint',
+            'tile_size',
+            'base_size',
+            'leg_1_len',
+            'leg_2_len',
+            'leg_1_native_subdivisions',
+            'leg_2_native_subdivisions',
+            'width_native_subdivisions',
+            'x_native_subdivisions',
+            'z_native_subdivisions',
+            'UV_island_margin')}
+
     def create_plain_base(self, tile_props):
         '''
         leg_1_len and leg_2_len are the inner lengths of the legs
@@ -58,22 +84,21 @@ class MT_U_Tile:
             "booleans",
             "openlock.blend")
 
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = [
-                'openlock.u_tile.base.cutter.slot.root',
-                'openlock.u_tile.base.cutter.slot.start_cap.root',
-                'openlock.u_tile.base.cutter.slot.end_cap.root']
+        cutter_objs = new_cutters(booleans_path, [
+            'openlock.u_tile.base.cutter.slot.root',
+            'openlock.u_tile.base.cutter.slot.start_cap.root',
+            'openlock.u_tile.base.cutter.slot.end_cap.root'])
 
-        for obj in data_to.objects:
+        for obj in cutter_objs:
             add_object_to_collection(obj, tile_props.tile_name)
             obj.hide_viewport = True
 
         # The slot cutter is a 0.1 wide rectangle with an array modifier
-        slot_cutter = data_to.objects[0]
+        slot_cutter = cutter_objs[0]
 
         # the start and end caps are both made of objects with their own modifier
-        cutter_start_cap = data_to.objects[1]
-        cutter_end_cap = data_to.objects[2]
+        cutter_start_cap = cutter_objs[1]
+        cutter_end_cap = cutter_objs[2]
 
         if base_socket_side == 'OUTER':
             # gap between slot end and side
@@ -124,18 +149,17 @@ class MT_U_Tile:
             "openlock.blend")
 
         # load base cutters
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = [
-                'openlock.wall.base.cutter.clip',
-                'openlock.wall.base.cutter.clip.cap.start',
-                'openlock.wall.base.cutter.clip.cap.end']
+        cutter_objs = new_cutters(booleans_path, [
+            'openlock.wall.base.cutter.clip',
+            'openlock.wall.base.cutter.clip.cap.start',
+            'openlock.wall.base.cutter.clip.cap.end'])
 
-        for obj in data_to.objects:
+        for obj in cutter_objs:
             add_object_to_collection(obj, tile_props.tile_name)
 
-        clip_cutter = data_to.objects[0]
-        cutter_start_cap = data_to.objects[1]
-        cutter_end_cap = data_to.objects[2]
+        clip_cutter = cutter_objs[0]
+        cutter_start_cap = cutter_objs[1]
+        cutter_end_cap = cutter_objs[2]
 
         cutter_start_cap.hide_viewport = True
         cutter_end_cap.hide_viewport = True
@@ -263,8 +287,8 @@ class MT_U_Tile:
 
 
 class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
-    def __init__(self, tile_props):
-        MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        MT_Tile.__init__(self, tile_props, parts)
 
     def create_plain_base(self, tile_props):
         base = MT_U_Tile.create_plain_base(self, tile_props)
@@ -417,7 +441,7 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
         }
 
         mode('OBJECT')
-        bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+        project_uvs(core, tile_props.UV_island_margin)
         bpy.context.scene.cursor.location = (0, 0, 0)
         bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
         return core
@@ -435,13 +459,12 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
             "openlock.blend")
 
         # load side cutter
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = ['openlock.wall.cutter.side']
+        cutter_objs = new_cutters(booleans_path, ['openlock.wall.cutter.side'])
 
-        for obj in data_to.objects:
+        for obj in cutter_objs:
             add_object_to_collection(obj, tile_name)
 
-        cutter = data_to.objects[0]
+        cutter = cutter_objs[0]
 
         array_mod = cutter.modifiers.new('Array', 'ARRAY')
         array_mod.use_relative_offset = False
@@ -682,6 +705,9 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
         bm = bmesh.from_edit_mesh(bpy.context.object.data)
         bm.faces.ensure_lookup_table()
 
+        # look verts up by location rather than looping over bm.verts for each coord
+        kd = vert_kdtree(bm)
+
         # inner and outer faces
         groups = ('Leg 1 Inner', 'Leg 1 Outer', 'Leg 2 Inner', 'Leg 2 Outer', 'End Wall Inner', 'End Wall Outer')
 
@@ -694,19 +720,13 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
             subdiv_dist = (obj.dimensions[2] - 0.002) / native_subdivisions[4]
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
 
             for index, coord in enumerate(vert_coords):
                 vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
 
             i = 0
             while i <= native_subdivisions[4]:
@@ -714,10 +734,7 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
                     vert_coords[index] = Vector((0, 0, subdiv_dist)) + coord
 
                 for coord in vert_coords:
-                    for v in bm.verts:
-                        if (vectors_are_close(v.co, coord, 0.0001)):
-                            v.select = True
-                            break
+                    select_vert_at(bm, kd, coord)
                 i += 1
             bpy.ops.object.vertex_group_assign(ctx)
 
@@ -733,10 +750,7 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
             subdiv_dist = (obj.dimensions[2] - 0.002) / native_subdivisions[4]
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
 
@@ -747,10 +761,7 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
                 vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
 
@@ -763,10 +774,7 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
                     vert_coords[index] = Vector((0, 0, subdiv_dist)) + coord
 
                 for coord in vert_coords:
-                    for v in bm.verts:
-                        if (vectors_are_close(v.co, coord, 0.0001)):
-                            v.select = True
-                            break
+                    select_vert_at(bm, kd, coord)
                 bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
                 bpy.ops.object.vertex_group_assign(ctx)
                 i += 1
@@ -777,10 +785,7 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
                 vert_coords[index] = Vector((0, 0, 0.001)) + coord
 
             for coord in vert_coords:
-                for v in bm.verts:
-                    if (vectors_are_close(v.co, coord, 0.0001)):
-                        v.select = True
-                        break
+                select_vert_at(bm, kd, coord)
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
 
@@ -796,15 +801,9 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
 
         i = 0
         while i < len(outer_vert_locs):
-            for v in bm.verts:
-                if (vectors_are_close(v.co, inner_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, inner_vert_locs[i])
 
-            for v in bm.verts:
-                if (vectors_are_close(v.co, outer_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, outer_vert_locs[i])
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
             for v in bm.verts:
@@ -821,15 +820,9 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
 
         i = 0
         while i < len(inner_vert_locs):
-            for v in bm.verts:
-                if (vectors_are_close(v.co, outer_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, outer_vert_locs[i])
 
-            for v in bm.verts:
-                if (vectors_are_close(v.co, inner_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, inner_vert_locs[i])
 
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
@@ -849,15 +842,9 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
 
         i = 0
         while i < len(outer_vert_locs):
-            for v in bm.verts:
-                if (vectors_are_close(v.co, inner_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, inner_vert_locs[i])
 
-            for v in bm.verts:
-                if (vectors_are_close(v.co, outer_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, outer_vert_locs[i])
 
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
@@ -884,15 +871,9 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
 
         i = 0
         while i < len(outer_vert_locs):
-            for v in bm.verts:
-                if (vectors_are_close(v.co, inner_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, inner_vert_locs[i])
 
-            for v in bm.verts:
-                if (vectors_are_close(v.co, outer_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, outer_vert_locs[i])
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
             for v in bm.verts:
@@ -916,15 +897,9 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
 
         i = 0
         while i < len(inner_vert_locs):
-            for v in bm.verts:
-                if vectors_are_close(v.co, inner_vert_locs[i], 0.0001):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, inner_vert_locs[i])
 
-            for v in bm.verts:
-                if vectors_are_close(v.co, outer_vert_locs[i], 0.0001):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, outer_vert_locs[i])
 
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
@@ -949,15 +924,9 @@ class MT_U_Wall_Tile(MT_U_Tile, MT_Tile):
 
         i = 0
         while i < len(outer_vert_locs):
-            for v in bm.verts:
-                if (vectors_are_close(v.co, inner_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, inner_vert_locs[i])
 
-            for v in bm.verts:
-                if (vectors_are_close(v.co, outer_vert_locs[i], 0.0001)):
-                    v.select = True
-                    break
+            select_vert_at(bm, kd, outer_vert_locs[i])
 
             bpy.ops.mesh.shortest_path_select(ctx, edge_mode='SELECT')
             bpy.ops.object.vertex_group_assign(ctx)
@@ -0,0 +1,143 @@
+"""Cache of OpenLOCK base meshes with their boolean cutters applied.
+
+OpenLOCK bases are made by cutting slots and clip sockets out of a block
+with BOOLEAN modifiers. Evaluating these on every depsgraph update and
+again on export is slow, so unless a tile uses live booleans we apply the
+modifiers once, delete the cutters and keep the resulting mesh as a
+template. Every base built from the same tile properties gets a copy of
+the template so that changing the materials or mesh of one base doesn't
+change the others.
+"""
+import bpy
+from mathutils import Matrix
+
+# key: mesh name
+baked_bases = {}
+
+
+def base_key(tile_props, prop_names):
+    """Returns the cache key for a base built from the tile properties in prop_names"""
+    values = [tile_props.tile_type]
+    for name in prop_names:
+        value = getattr(tile_props, name)
+        if isinstance(value, float):
+            value = round(value, 5)
+        elif hasattr(value, '__len__') and not isinstance(value, str):
+            value = tuple(round(v, 5) for v in value)
+        values.append(name + '=' + str(value))
+    return '|'.join(values)
+
+
+def get_baked_mesh(key):
+    """Returns the template mesh baked for key or None"""
+    mesh = bpy.data.meshes.get(baked_bases.get(key, ''))
+    if mesh is not None and mesh.get('mt_baked_base') == key:
+        return mesh
+
+    # look for meshes baked before the file was saved and reopened
+    for mesh in bpy.data.meshes:
+        if mesh.get('mt_baked_base') == key:
+            baked_bases[key] = mesh.name
+            return mesh
+    return None
+
+
+def bake_base(base, key, tile_props):
+    """Applies the boolean modifiers on base, removes its cutters and caches
+    a copy of the mesh as a template.
+
+    The tile_size and base_size the base was built with and its transform
+    are stored on the template so new_baked_base can restore them
+    """
+    if not base.modifiers or any(mod.type != 'BOOLEAN' for mod in base.modifiers):
+        return base
+
+    tile_collection = bpy.data.collections[tile_props.tile_name]
+    cutters = cutter_objects(base, tile_collection)
+
+    bpy.context.view_layer.update()
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    mesh = bpy.data.meshes.new_from_object(base.evaluated_get(depsgraph))
+    mesh.name = tile_props.tile_type.lower() + '.base.baked'
+    mesh.materials.clear()
+
+    old_mesh = base.data
+    base.data = copy_template(mesh)
+    base.modifiers.clear()
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+
+    for obj in cutters:
+        data = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        if isinstance(data, bpy.types.Mesh) and data.users == 0:
+            bpy.data.meshes.remove(data)
+
+    # keep the template when no base uses it
+    mesh.use_fake_user = True
+    mesh['mt_baked_base'] = key
+    mesh['mt_base_size'] = list(tile_props.base_size)
+    mesh['mt_tile_size'] = list(tile_props.tile_size)
+    mesh['mt_matrix'] = [v for row in base.matrix_basis for v in row]
+    baked_bases[key] = mesh.name
+
+    return base
+
+
+def copy_template(mesh):
+    """Returns a copy of a baked template mesh for a base to use"""
+    copy = mesh.copy()
+    copy.name = mesh.name.replace('.baked', '')
+    copy.use_fake_user = False
+    for prop in ('mt_baked_base', 'mt_base_size', 'mt_tile_size', 'mt_matrix'):
+        if prop in copy:
+            del copy[prop]
+    return copy
+
+
+def new_baked_base(mesh, tile_props):
+    """Returns a new base object using a copy of a baked template mesh and
+    restores the tile_size and base_size it was built with"""
+    tile_name = tile_props.tile_name
+    base = bpy.data.objects.new(tile_name + '.base', copy_template(mesh))
+    bpy.data.collections[tile_name].objects.link(base)
+
+    values = mesh['mt_matrix']
+    base.matrix_basis = Matrix([values[i:i + 4] for i in range(0, 16, 4)])
+
+    tile_props.base_size = mesh['mt_base_size']
+    tile_props.tile_size = mesh['mt_tile_size']
+
+    obj_props = base.mt_object_props
+    obj_props.is_mt_object = True
+    obj_props.geometry_type = 'BASE'
+    obj_props.tile_name = tile_name
+
+    return base
+
+
+def cutter_objects(base, tile_collection):
+    """Returns the objects in tile_collection used by the modifiers of base,
+    and the objects used by their modifiers"""
+    cutters = set()
+    stack = [base]
+    while stack:
+        obj = stack.pop()
+        for mod in obj.modifiers:
+            for prop in mod.bl_rna.properties:
+                if prop.type == 'POINTER' and getattr(prop.fixed_type, 'identifier', None) == 'Object':
+                    target = getattr(mod, prop.identifier)
+                    if target is not None and target != base and target not in cutters \
+                            and target.name in tile_collection.objects:
+                        cutters.add(target)
+                        stack.append(target)
+    return cutters
+
+
+def clear_baked_bases():
+    """Forgets baked bases so new tiles rebuild their booleans"""
+    for mesh in bpy.data.meshes:
+        if 'mt_baked_base' in mesh:
+            del mesh['mt_baked_base']
+            mesh.use_fake_user = False
+    baked_bases.clear()
@@ -0,0 +1,320 @@
+"""Generate tiles listed in a manifest across several background Blender processes.
+
+A manifest is a JSON file containing a list of tile specs, or a dict with
+the list under 'tiles', or a CSV file with one tile spec per row. Each
+spec is a dict of MT_Tile_Properties names and values as passed to
+generate_tile, plus these optional keys:
+
+    name -- name of the tile collection
+    material -- name of the material to use for the tile
+    seed -- INT, seeds python's random module and the material's Seed node
+
+CSV cells are parsed as JSON where possible so sizes can be written as
+[2, 0.3, 2]. Empty cells are ignored.
+
+The manifest is split into shards which are built by separate Blender
+processes started in background mode. Each shard is saved as its own
+.blend file and each tile can optionally be exported as an .stl named
+after its index in the manifest. Per tile timings and .stl paths are
+written to batch_report.json in the output folder.
+
+Can be run from a script:
+
+    blender -b -P make_dungeon.py
+
+    from MakeTile.tile_creation.batch import run_batch, format_batch_report
+
+    records = run_batch('dungeon.csv', '/tmp/dungeon', workers=16, export_stl=True)
+    print(format_batch_report(records))
+"""
+import os
+import csv
+import json
+import random
+import subprocess
+import traceback
+from time import perf_counter
+import bpy
+from .. lib.utils.update_scene_props import load_material_libraries
+from .. materials.library import get_material
+from . generate import generate_tile
+
+# keys in a spec that aren't tile properties
+spec_extras = ('name', 'material', 'seed')
+
+
+def load_manifest(manifest_path):
+    """Returns the list of tile specs in a JSON or CSV manifest"""
+    manifest_path = bpy.path.abspath(manifest_path)
+
+    if manifest_path.lower().endswith('.csv'):
+        with open(manifest_path, newline='') as f:
+            return [parse_csv_row(row) for row in csv.DictReader(f)]
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    if isinstance(manifest, dict):
+        manifest = manifest['tiles']
+    return manifest
+
+
+def parse_csv_row(row):
+    """Returns a tile spec from a row of a CSV manifest"""
+    spec = {}
+    for key, value in row.items():
+        if key is None or value is None:
+            continue
+        key = key.strip()
+        value = value.strip()
+        if not key or not value:
+            continue
+        try:
+            spec[key] = json.loads(value)
+        except ValueError:
+            spec[key] = value
+    return spec
+
+
+def shard_specs(specs, num_shards):
+    """Splits specs into num_shards lists of (manifest index, spec).
+
+    Specs are dealt out in turn so each shard gets a similar mix of tile types
+    """
+    return [list(enumerate(specs))[i::num_shards] for i in range(num_shards)]
+
+
+def run_batch(manifest, out_dir, workers=None, blender_path=None, save_blend=True, export_stl=False):
+    """Builds the tiles in manifest in background Blender processes.
+
+    Returns a list of per tile records sorted by manifest index and saves
+    them to batch_report.json in out_dir.
+
+    Keyword arguments:
+    manifest -- path to a JSON or CSV manifest or a list of tile specs
+    out_dir -- folder to save shard .blend files, .stl files and report to
+    workers -- INT, number of Blender processes. Defaults to the number of CPUs
+    blender_path -- path to the Blender executable. Defaults to the running Blender
+    save_blend -- BOOL, save each shard as a .blend file
+    export_stl -- BOOL, export each tile as an .stl
+    """
+    if isinstance(manifest, str):
+        specs = load_manifest(manifest)
+    else:
+        specs = list(manifest)
+
+    if not specs:
+        return []
+
+    out_dir = bpy.path.abspath(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(specs)))
+
+    if blender_path is None:
+        blender_path = bpy.app.binary_path
+
+    addon_name = __package__.split('.')[0]
+    processes = []
+
+    for i, shard in enumerate(shard_specs(specs, workers)):
+        shard_name = 'shard_' + str(i).zfill(3)
+        shard_path = os.path.join(out_dir, shard_name + '.json')
+        shard_data = {
+            'tiles': shard,
+            'blend_path': os.path.join(out_dir, shard_name + '.blend') if save_blend else None,
+            'stl_dir': os.path.join(out_dir, 'stl') if export_stl else None,
+            'timings_path': os.path.join(out_dir, shard_name + '.timings.json')}
+
+        with open(shard_path, 'w') as f:
+            json.dump(shard_data, f, indent=1)
+
+        expr = (
+            "import addon_utils, importlib\n"
+            "addon_utils.enable({0!r}, default_set=False)\n"
+            "importlib.import_module({1!r}).run_shard({2!r})\n").format(
+                addon_name,
+                __name__,
+                shard_path)
+
+        processes.append((
+            shard_data,
+            subprocess.Popen([blender_path, '-b', '--python-expr', expr])))
+
+    records = []
+    for shard_data, process in processes:
+        process.wait()
+        timings_path = shard_data['timings_path']
+        if os.path.exists(timings_path):
+            with open(timings_path) as f:
+                records.extend(json.load(f))
+        else:
+            # worker died before it could save its timings
+            for index, spec in shard_data['tiles']:
+                records.append({
+                    'index': index,
+                    'tile_name': spec.get('name', ''),
+                    'tile_type': spec.get('tile_type', ''),
+                    'build_time': 0.0,
+                    'export_time': 0.0,
+                    'stl_path': None,
+                    'error': 'Worker exited with code ' + str(process.returncode)})
+
+    records.sort(key=lambda record: record['index'])
+
+    with open(os.path.join(out_dir, 'batch_report.json'), 'w') as f:
+        json.dump(records, f, indent=1)
+
+    return records
+
+
+def run_shard(shard_path):
+    """Builds the tiles in a shard file written by run_batch. Run inside a worker process"""
+    with open(shard_path) as f:
+        shard_data = json.load(f)
+
+    # start from an empty file so shards only contain tiles
+    bpy.ops.wm.read_homefile(use_empty=True)
+    load_material_libraries(dummy=None)
+
+    stl_dir = shard_data['stl_dir']
+    if stl_dir is not None:
+        os.makedirs(stl_dir, exist_ok=True)
+
+    records = []
+    x_offset = 0
+
+    for index, spec in shard_data['tiles']:
+        record = {
+            'index': index,
+            'tile_name': spec.get('name', ''),
+            'tile_type': spec.get('tile_type', ''),
+            'build_time': 0.0,
+            'export_time': 0.0,
+            'stl_path': None,
+            'error': None}
+        records.append(record)
+
+        try:
+            start = perf_counter()
+            tile_collection = build_spec(spec, (x_offset, 0, 0))
+            record['build_time'] = perf_counter() - start
+            record['tile_name'] = tile_collection.name
+
+            # lay tiles out in a row so they don't overlap in the shard's .blend
+            tile_props = tile_collection.mt_tile_props
+            x_offset += max(tile_props.tile_size[0], tile_props.base_size[0]) + 1
+
+            if stl_dir is not None:
+                start = perf_counter()
+                record['stl_path'] = export_tile_stl(tile_collection, stl_dir, index)
+                record['export_time'] = perf_counter() - start
+        except Exception:
+            traceback.print_exc()
+            record['error'] = traceback.format_exc()
+
+        print('MakeTile batch: tile ' + str(index) + ' ' + record['tile_name'] +
+              ' built in ' + format(record['build_time'], '.3f') + 's')
+
+    if shard_data['blend_path'] is not None:
+        bpy.ops.wm.save_as_mainfile(filepath=shard_data['blend_path'])
+
+    with open(shard_data['timings_path'], 'w') as f:
+        json.dump(records, f, indent=1)
+
+
+def build_spec(spec, location):
+    """Builds the tile described by a manifest spec and returns its collection"""
+    scene = bpy.context.scene
+    scene_props = scene.mt_scene_props
+    tile_spec = {key: value for key, value in spec.items() if key not in spec_extras}
+
+    seed = spec.get('seed')
+    if seed is not None:
+        random.seed(seed)
+
+    if 'material' in spec:
+        material = get_material(spec['material'])
+        if seed is not None:
+            material = seeded_material(material, seed)
+        scene_props.mt_tile_material_1 = material.name
+
+    return generate_tile(
+        tile_spec,
+        location=location,
+        scene=scene,
+        name=spec.get('name'))
+
+
+def seeded_material(material, seed):
+    """Returns a copy of material with its Seed node set to seed"""
+    name = material.name + '.seed_' + str(seed)
+    if name in bpy.data.materials:
+        return bpy.data.materials[name]
+
+    material = material.copy()
+    material.name = name
+    if material.node_tree is not None and 'Seed' in material.node_tree.nodes:
+        material.node_tree.nodes['Seed'].outputs[0].default_value = seed
+    return material
+
+
+def export_tile_stl(tile_collection, stl_dir, index):
+    """Exports the visible mesh objects in tile_collection as an .stl and returns its path.
+
+    The file name starts with the tile's index in the manifest because shards
+    are built in separate files so tiles in different shards can have the
+    same collection name"""
+    blend_units = bpy.context.scene.mt_units
+    if blend_units == 'INCHES':
+        unit_multiplier = 25.4
+    else:
+        unit_multiplier = 10
+
+    export_objects = [obj for obj in tile_collection.all_objects
+                      if obj.type == 'MESH' and obj.visible_get() is True]
+    if not export_objects:
+        return None
+
+    file_name = str(index) + '_' + bpy.path.clean_name(tile_collection.name) + '.stl'
+    file_path = os.path.join(stl_dir, file_name)
+    ctx = {
+        'selected_objects': export_objects,
+        'active_object': export_objects[0],
+        'object': export_objects[0]
+    }
+
+    bpy.ops.export_mesh.stl(
+        ctx,
+        filepath=file_path,
+        check_existing=False,
+        filter_glob="*.stl",
+        use_selection=True,
+        global_scale=unit_multiplier,
+        use_mesh_modifiers=True)
+
+    return file_path
+
+
+def format_batch_report(records):
+    """Returns a report of per tile timings"""
+    lines = ['{:>6} {:<40} {:<20} {:>10} {:>10}  {}'.format(
+        'index', 'tile', 'type', 'build', 'export', 'error')]
+    for record in records:
+        error = record['error'].strip().splitlines()[-1] if record['error'] else ''
+        lines.append('{:>6} {:<40} {:<20} {:>10.3f} {:>10.3f}  {}'.format(
+            record['index'],
+            record['tile_name'],
+            record['tile_type'],
+            record['build_time'],
+            record['export_time'],
+            error))
+
+    built = [record for record in records if not record['error']]
+    lines.append('{} of {} tiles built. Total build time {:.3f}s'.format(
+        len(built),
+        len(records),
+        sum(record['build_time'] for record in records)))
+    return '\n'.join(lines)
@@ -12,8 +12,8 @@ from .create_tile import MT_Tile
 
 
 class MT_Template_Tile(MT_Tile):
-    def __init__(self, tile_props):
-        super().MT_Tile.__init__(self, tile_props)
+    def __init__(self, tile_props, parts=None):
+        super().__init__(tile_props, parts)
 
     def create_plain_base(self, tile_props):
         return super().create_plain_base(tile_props)
@@ -0,0 +1,64 @@
+"""Checks of tile generation that need Blender to run.
+
+Run from Blender's python console with MakeTile enabled:
+
+    from MakeTile.tile_creation.checks import check_all
+    check_all()
+
+Each check builds tiles in the current file, reports OK or FAILED and
+removes what it built.
+"""
+import bpy
+from .. utils.registration import get_prefs
+from . create_tile import get_tile_base
+from . generate import generate_tile
+
+
+def check_baked_base_materials():
+    """Builds two tiles that reuse the same baked base with a different
+    secondary material each and returns True if each base kept its own
+    mesh and material"""
+    prefs = get_prefs()
+    orig_secondary_material = prefs.secondary_material
+    materials = [bpy.data.materials.new('mt_check_material_' + str(i)) for i in range(2)]
+    spec = {
+        'tile_blueprint': 'OPENLOCK',
+        'tile_type': 'STRAIGHT_WALL',
+        'live_booleans': False}
+
+    tile_collections = []
+    try:
+        for i, material in enumerate(materials):
+            prefs.secondary_material = material.name
+            tile_collections.append(generate_tile(spec, location=(i * 3, 0, 0)))
+
+        bases = [get_tile_base(tile_collection) for tile_collection in tile_collections]
+        return bases[0].data != bases[1].data and \
+            [slot.material for slot in bases[0].material_slots] == [materials[0]] and \
+            [slot.material for slot in bases[1].material_slots] == [materials[1]]
+    finally:
+        prefs.secondary_material = orig_secondary_material
+        for tile_collection in tile_collections:
+            remove_tile(tile_collection)
+        for material in materials:
+            bpy.data.materials.remove(material)
+
+
+def remove_tile(tile_collection):
+    """Removes a tile collection, its objects and their meshes"""
+    for obj in list(tile_collection.all_objects):
+        data = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        if isinstance(data, bpy.types.Mesh) and data.users == 0:
+            bpy.data.meshes.remove(data)
+    bpy.data.collections.remove(tile_collection)
+
+
+def check_all():
+    """Runs every check and prints a report"""
+    checks = [check_baked_base_materials]
+    results = {}
+    for check in checks:
+        results[check.__name__] = check()
+        print('{:<32} {}'.format(check.__name__, 'OK' if results[check.__name__] else 'FAILED'))
+    return results
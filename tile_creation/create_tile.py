@@ -4,14 +4,39 @@ from . create_displacement_mesh import create_displacement_object
 from .. lib.utils.vertex_groups import construct_displacement_mod_vert_group
 from .. lib.utils.collections import add_object_to_collection
 from .. lib.utils.selection import select, deselect_all, activate
+from . baked_bases import base_key, get_baked_mesh, new_baked_base, bake_base
 from .. materials.materials import (
     assign_displacement_materials,
     assign_preview_materials,
     add_preview_mesh_subsurf)
+from .. materials.library import get_material
 
 
 class MT_Tile:
-    def __init__(self, tile_props):
+    # The tile properties each part of the tile is built from. regenerate_tile
+    # uses these to rebuild only the parts whose properties have changed
+    part_dependencies = {
+        'BASE': (
+            'base_blueprint',
+            'live_booleans',
+            'base_size'),
+        'CORE': (
+            'main_part_blueprint',
+            'tile_size',
+            'base_size',
+            'x_native_subdivisions',
+            'y_native_subdivisions',
+            'z_native_subdivisions',
+            'UV_island_margin')}
+
+    def __init__(self, tile_props, parts=None):
+        """Builds the tile into the tile collection.
+
+        Keyword arguments:
+        parts -- set of parts to build e.g. {'CORE'}. Objects belonging to
+        these parts are removed and rebuilt and the rest of the tile is kept.
+        Defaults to all parts
+        """
         self.tile_props = tile_props
         scene = bpy.context.scene
         cursor = scene.cursor
@@ -21,26 +46,50 @@ class MT_Tile:
         cursor.location = (0, 0, 0)
         cursor.rotation_euler = (0, 0, 0)
 
+        if parts is None:
+            parts = set(self.part_dependencies)
+
+        tile_collection = bpy.data.collections[tile_props.tile_name]
+        orphans = remove_parts(tile_collection, parts)
+
         base_blueprint = tile_props.base_blueprint
         main_part_blueprint = tile_props.main_part_blueprint
 
-        if base_blueprint == 'PLAIN':
-            base = self.create_plain_base(tile_props)
+        objects = set(tile_collection.objects)
+
+        if 'BASE' in parts:
+            if base_blueprint == 'PLAIN':
+                base = self.create_plain_base(tile_props)
+
+            if base_blueprint == 'OPENLOCK':
+                if tile_props.live_booleans:
+                    base = self.create_openlock_base(tile_props)
+                else:
+                    base = self.create_baked_openlock_base(tile_props)
 
-        if base_blueprint == 'OPENLOCK':
-            base = self.create_openlock_base(tile_props)
+            if base_blueprint == 'NONE':
+                base = self.create_empty_base(tile_props)
 
-        if base_blueprint == 'NONE':
-            base = self.create_empty_base(tile_props)
+            objects = tag_part(tile_collection, objects, 'BASE')
 
-        if main_part_blueprint == 'PLAIN':
-            preview_core = self.create_plain_cores(base, tile_props)
+            # kept objects that were parented to the old base
+            for obj in orphans:
+                obj.parent = base
+        else:
+            # parts are built at the cursor and moved into place by finalise_tile
+            base = get_tile_base(tile_collection)
+            base.location = cursor.location
 
-        if main_part_blueprint == 'OPENLOCK':
-            preview_core = self.create_openlock_cores(base, tile_props)
+        preview_core = None
 
-        if main_part_blueprint == 'NONE':
-            preview_core = None
+        if 'CORE' in parts:
+            if main_part_blueprint == 'PLAIN':
+                preview_core = self.create_plain_cores(base, tile_props)
+
+            if main_part_blueprint == 'OPENLOCK':
+                preview_core = self.create_openlock_cores(base, tile_props)
+
+            tag_part(tile_collection, objects, 'CORE')
 
         self.finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
 
@@ -50,6 +99,17 @@ class MT_Tile:
     def create_openlock_base(self, tile_props):
         return False
 
+    def create_baked_openlock_base(self, tile_props):
+        """Returns an openlock base with its boolean cutters applied.
+        Reuses the mesh of any base built from the same tile properties"""
+        key = base_key(tile_props, self.part_dependencies['BASE'])
+        mesh = get_baked_mesh(key)
+        if mesh is not None:
+            return new_baked_base(mesh, tile_props)
+
+        base = self.create_openlock_base(tile_props)
+        return bake_base(base, key, tile_props)
+
     def create_empty_base(self, tile_props):
         tile_props.base_size = (0, 0, 0)
         base = bpy.data.objects.new(tile_props.tile_name + '.base', None)
@@ -76,8 +136,8 @@ class MT_Tile:
 
         preview_core, displacement_core = create_displacement_object(preview_core)      
 
-        primary_material = bpy.data.materials[scene.mt_scene_props.mt_tile_material_1]
-        secondary_material = bpy.data.materials[preferences.secondary_material]
+        primary_material = get_material(scene.mt_scene_props.mt_tile_material_1)
+        secondary_material = get_material(preferences.secondary_material)
 
         image_size = bpy.context.scene.mt_scene_props.mt_tile_resolution
 
@@ -106,7 +166,9 @@ class MT_Tile:
         # Assign secondary material to our base if its a mesh
         if base.type == 'MESH':
             prefs = get_prefs()
-            base.data.materials.append(bpy.data.materials[prefs.secondary_material])
+            secondary_material = get_material(prefs.secondary_material)
+            if secondary_material.name not in base.data.materials:
+                base.data.materials.append(secondary_material)
 
         # Add subsurf modifier to our cores
         if preview_core is not None:
@@ -122,3 +184,37 @@ class MT_Tile:
         select(base.name)
         activate(base.name)
 
+
+def tag_part(tile_collection, objects, part):
+    """Marks the objects in tile_collection that aren't in objects as belonging to part.
+    Returns the set of objects now in tile_collection"""
+    new_objects = set(tile_collection.objects)
+    for obj in new_objects - objects:
+        obj.mt_object_props.tile_part = part
+    return new_objects
+
+
+def remove_parts(tile_collection, parts):
+    """Removes the objects in tile_collection belonging to parts.
+    Returns the kept objects that were parented to a removed object"""
+    removed = [obj for obj in tile_collection.objects if obj.mt_object_props.tile_part in parts]
+    orphans = [obj for obj in tile_collection.objects
+               if obj not in removed and obj.parent in removed]
+
+    for obj in removed:
+        data = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+        # cutters share their mesh with a template so only remove orphans
+        if isinstance(data, bpy.types.Mesh) and data.users == 0:
+            bpy.data.meshes.remove(data)
+
+    return orphans
+
+
+def get_tile_base(tile_collection):
+    """Returns the base object of the tile or None"""
+    for obj in tile_collection.objects:
+        if obj.mt_object_props.tile_part == 'BASE' and obj.parent is None:
+            return obj
+    return None
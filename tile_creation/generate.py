@@ -0,0 +1,230 @@
+"""Generate tiles from a plain dict without the UI.
+
+Can be run from a script in background mode:
+
+    blender -b -P make_tiles.py
+
+    import bpy
+    from MakeTile.tile_creation.generate import generate_tile
+
+    generate_tile({
+        'tile_type': 'STRAIGHT_WALL',
+        'tile_size': (2, 0.3, 2),
+        'base_size': (2, 0.5, 0.2755)})
+"""
+import bpy
+from .. lib.utils.collections import create_collection, get_collection
+from . create_tile import get_tile_base
+from . L_Tiles import MT_L_Wall, MT_L_Floor
+from . Straight_Tiles import MT_Straight_Wall_Tile, MT_Straight_Floor_Tile
+from . Curved_Tiles import MT_Curved_Wall_Tile, MT_Curved_Floor_Tile
+from . Rectangular_Tiles import MT_Rectangular_Floor_Tile
+from . Triangular_Tiles import MT_Triangular_Floor_Tile
+from . Semi_Circ_Tiles import MT_Semi_Circ_Floor_Tile
+from . U_Tiles import MT_U_Wall_Tile
+from . Connecting_Column_Tiles import MT_Connecting_Column_Tile
+
+tile_classes = {
+    'STRAIGHT_WALL': MT_Straight_Wall_Tile,
+    'STRAIGHT_FLOOR': MT_Straight_Floor_Tile,
+    'CURVED_WALL': MT_Curved_Wall_Tile,
+    'CORNER_WALL': MT_L_Wall,
+    'CORNER_FLOOR': MT_L_Floor,
+    'RECTANGULAR_FLOOR': MT_Rectangular_Floor_Tile,
+    'TRIANGULAR_FLOOR': MT_Triangular_Floor_Tile,
+    'SEMI_CIRC_FLOOR': MT_Semi_Circ_Floor_Tile,
+    'CURVED_FLOOR': MT_Curved_Floor_Tile,
+    'U_WALL': MT_U_Wall_Tile,
+    'CONNECTING_COLUMN': MT_Connecting_Column_Tile}
+
+# collection tiles of each type go in when no collection is passed to generate_tile
+type_collections = {
+    'STRAIGHT_WALL': 'Walls',
+    'CURVED_WALL': 'Walls',
+    'CORNER_WALL': 'Walls',
+    'U_WALL': 'Walls',
+    'RECTANGULAR_FLOOR': 'Floors',
+    'TRIANGULAR_FLOOR': 'Floors',
+    'CURVED_FLOOR': 'Floors',
+    'CORNER_FLOOR': 'Floors',
+    'STRAIGHT_FLOOR': 'Floors',
+    'SEMI_CIRC_FLOOR': 'Floors',
+    'CONNECTING_COLUMN': 'Columns'}
+
+
+def generate_tile(spec, collection=None, location=(0, 0, 0), scene=None, name=None):
+    """Creates a tile and returns the tile collection.
+
+    Keyword arguments:
+    spec -- dict of MT_Tile_Properties names and values. Anything not in
+    spec keeps its default. main_part_blueprint and base_blueprint default
+    to tile_blueprint
+    collection -- bpy.types.Collection to create the tile collection in.
+    Defaults to Tiles > Walls, Floors or Columns like scene.make_tile
+    location -- VECTOR [X, Y, Z], location of the tile
+    scene -- bpy.types.Scene, defaults to the context scene
+    name -- name of the tile collection. Defaults to blueprint.type
+    """
+    if scene is None:
+        scene = bpy.context.scene
+
+    tile_blueprint = spec.get('tile_blueprint', 'OPENLOCK')
+    tile_type = spec.get('tile_type', 'STRAIGHT_WALL')
+
+    if tile_type not in tile_classes:
+        raise ValueError('Unknown tile type ' + tile_type)
+
+    if collection is None:
+        tiles_collection = create_collection('Tiles', scene.collection)
+        collection = create_collection(type_collections[tile_type], tiles_collection)
+    elif get_collection(bpy.context.view_layer.layer_collection, collection.name) is None:
+        scene.collection.children.link(collection)
+
+    if name is None:
+        name = tile_blueprint.lower() + "." + tile_type.lower()
+    tile_collection = bpy.data.collections.new(name)
+    collection.children.link(tile_collection)
+
+    tile_props = tile_collection.mt_tile_props
+    tile_props.main_part_blueprint = tile_blueprint
+    tile_props.base_blueprint = tile_blueprint
+    set_tile_props(tile_props, spec)
+    tile_props.tile_name = tile_collection.name
+    tile_props.is_mt_collection = True
+
+    build_tile(tile_props, location)
+
+    return tile_collection
+
+
+def set_tile_props(tile_props, spec):
+    """Copies the values in spec to tile_props"""
+    for key, value in spec.items():
+        if key not in tile_props.bl_rna.properties:
+            raise KeyError(key + ' is not a tile property')
+        setattr(tile_props, key, value)
+
+
+def build_tile(tile_props, location=(0, 0, 0), parts=None):
+    """Builds the tile described by tile_props into its collection.
+
+    The collection is made active while the tile is built so new objects
+    are added to it, and the previously active collection and cursor
+    location are restored afterwards
+
+    Keyword arguments:
+    parts -- set of parts to rebuild e.g. {'BASE'}. Defaults to all parts
+    """
+    view_layer = bpy.context.view_layer
+    cursor = bpy.context.scene.cursor
+    orig_layer_collection = view_layer.active_layer_collection
+    orig_cursor_loc = cursor.location.copy()
+
+    view_layer.active_layer_collection = get_collection(
+        view_layer.layer_collection,
+        tile_props.tile_name)
+    cursor.location = location
+
+    try:
+        tile_class = tile_classes[tile_props.tile_type]
+        if parts is None or tile_class.part_dependencies is None:
+            tile_class(tile_props)
+        else:
+            tile_class(tile_props, parts)
+    finally:
+        view_layer.active_layer_collection = orig_layer_collection
+        cursor.location = orig_cursor_loc
+
+    save_built_props(tile_props)
+
+
+def regenerate_tile(tile_collection, spec=None):
+    """Rebuilds the parts of a tile whose properties have changed since it was built.
+
+    Returns the set of parts that were rebuilt.
+
+    Keyword arguments:
+    tile_collection -- bpy.types.Collection, the tile collection
+    spec -- dict of MT_Tile_Properties names and values to change before rebuilding
+    """
+    tile_props = tile_collection.mt_tile_props
+    if spec is not None:
+        set_tile_props(tile_props, spec)
+
+    base = get_tile_base(tile_collection)
+    tile_class = tile_classes[tile_props.tile_type]
+
+    # tiles made before parts were recorded and tiles that can't be
+    # partially rebuilt are rebuilt in full
+    if base is None or tile_class.part_dependencies is None:
+        if base is None:
+            base = tile_base_guess(tile_collection)
+        location = base.location.copy() if base is not None else (0, 0, 0)
+        for obj in list(tile_collection.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+        build_tile(tile_props, location)
+        return {'BASE', 'CORE'}
+
+    parts = dirty_parts(tile_class, changed_props(tile_collection))
+    if not parts:
+        return parts
+
+    location = base.location.copy()
+    rotation = base.rotation_euler.copy()
+
+    build_tile(tile_props, location, parts)
+
+    if 'BASE' in parts:
+        get_tile_base(tile_collection).rotation_euler = rotation
+
+    return parts
+
+
+def tile_base_guess(tile_collection):
+    """Returns the object in tile_collection that everything else is parented to"""
+    for obj in tile_collection.objects:
+        if obj.parent is None:
+            return obj
+    return None
+
+
+def dirty_parts(tile_class, changed):
+    """Returns the set of parts of tile_class that depend on the properties in changed"""
+    if {'tile_type', 'tile_blueprint'} & changed:
+        return set(tile_class.part_dependencies)
+
+    return {part for part, props in tile_class.part_dependencies.items()
+            if changed.intersection(props)}
+
+
+def changed_props(tile_collection):
+    """Returns the names of the tile properties that have changed since the tile was built"""
+    built_props = tile_collection.get('mt_built_props')
+    if built_props is None:
+        return set(tile_props_values(tile_collection.mt_tile_props))
+
+    built_props = built_props.to_dict()
+    current = tile_props_values(tile_collection.mt_tile_props)
+    return {name for name, value in current.items() if built_props.get(name) != value}
+
+
+def save_built_props(tile_props):
+    """Saves the tile properties the tile was built with on its collection"""
+    tile_collection = bpy.data.collections[tile_props.tile_name]
+    tile_collection['mt_built_props'] = tile_props_values(tile_props)
+
+
+def tile_props_values(tile_props):
+    """Returns a dict of tile property names and values that can be stored as an ID property"""
+    values = {}
+    for prop in tile_props.bl_rna.properties:
+        name = prop.identifier
+        if name in ('rna_type', 'name', 'tile_name', 'is_mt_collection') or prop.type in ('POINTER', 'COLLECTION'):
+            continue
+        value = getattr(tile_props, name)
+        if getattr(prop, 'is_array', False):
+            value = list(value)
+        elif prop.type == 'BOOLEAN':
+            value = int(value)
+        values[name] = value
+    return values
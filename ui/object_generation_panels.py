@@ -22,7 +22,11 @@ class MT_PT_Tile_Generator_Panel(Panel):
         layout.prop(scene_props, 'mt_tile_material_1', text="Main Material")
         layout.prop(scene_props, 'mt_UV_island_margin')
 
+        if scene_props.mt_base_blueprint == 'OPENLOCK':
+            layout.prop(scene_props, 'mt_live_booleans')
+
         layout.operator('scene.make_tile', text="Make Tile")
+        layout.operator('scene.mt_regenerate_tile', text="Update Tile")
 
         if obj is not None and obj.type == 'MESH':
 